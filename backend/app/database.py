@@ -1,11 +1,32 @@
 import duckdb
 from pathlib import Path
 
+from .metrics import QUERY_SECONDS
+
 DB_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "jobs.duckdb"
 
-def get_connection() -> duckdb.DuckDBPyConnection:
+
+class TimedConnection:
+    """DuckDB connection that times every execute() into QUERY_SECONDS"""
+
+    def __init__(self, con: duckdb.DuckDBPyConnection):
+        self._con = con
+
+    def execute(self, query: str, parameters=None):
+        operation = query.split(None, 1)[0].lower() if query.strip() else "unknown"
+        with QUERY_SECONDS.time(operation=operation):
+            if parameters is None:
+                return self._con.execute(query)
+            return self._con.execute(query, parameters)
+
+    def __getattr__(self, name):
+        return getattr(self._con, name)
+
+
+def get_connection() -> TimedConnection:
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    return duckdb.connect(str(DB_PATH))
+    return TimedConnection(duckdb.connect(str(DB_PATH)))
+
 
 def init_db():
     con = get_connection()
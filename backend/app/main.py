@@ -1,7 +1,12 @@
-from fastapi import FastAPI
+import time
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
+from jobspy.metrics import CONTENT_TYPE, registry
 
 from .database import init_db
+from .metrics import REQUEST_SECONDS
 from .routes import router
 
 app = FastAPI(title="JobSpy API")
@@ -16,6 +21,30 @@ app.add_middleware(
 app.include_router(router)
 
 
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # the route template keeps label cardinality bounded (no job ids)
+        route = request.scope.get("route")
+        REQUEST_SECONDS.observe(
+            time.perf_counter() - start,
+            method=request.method,
+            route=route.path if route else "unmatched",
+            status=status,
+        )
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    return Response(registry.exposition(), media_type=CONTENT_TYPE)
+
+
 @app.on_event("startup")
 def startup():
     init_db()
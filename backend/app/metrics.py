@@ -0,0 +1,31 @@
+from jobspy.metrics import Counter, Gauge, Histogram
+
+# Backend metrics share the jobspy registry, so /metrics also serves the
+# scraper counters (per-host status codes, per-site scrape durations).
+
+REQUEST_SECONDS = Histogram(
+    "jobspy_api_request_duration_seconds",
+    "API request latency by method, route template and status code",
+    ("method", "route", "status"),
+)
+QUERY_SECONDS = Histogram(
+    "jobspy_api_duckdb_query_duration_seconds",
+    "DuckDB query execution time by statement type",
+    ("operation",),
+)
+SESSION_SECONDS = Histogram(
+    "jobspy_api_scrape_session_duration_seconds",
+    "Wall time of a scrape session, by final status",
+    ("status",),
+    buckets=(1, 5, 10, 30, 60, 120, 300, 600, 1800, 3600),
+)
+JOBS_INGESTED = Counter(
+    "jobspy_api_jobs_ingested_total",
+    "Jobs written to DuckDB by scrape sessions, by site",
+    ("site",),
+)
+BACKGROUND_TASKS = Gauge(
+    "jobspy_api_background_tasks",
+    "Scrape sessions waiting for or running in the background task pool",
+    ("state",),
+)
@@ -3,6 +3,7 @@ from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
 from typing import Optional
 
 from .database import get_connection
+from .metrics import BACKGROUND_TASKS
 from .models import ScrapeRequest, ScrapeResponse, ScrapeStatus, JobStats, ProxyLogEntry
 from .services import create_session, run_scrape
 
@@ -61,6 +62,7 @@ router = APIRouter(prefix="/api/v1/jobs")
 def start_scrape(req: ScrapeRequest, bg: BackgroundTasks):
     session_id = create_session(req)
     bg.add_task(run_scrape, session_id, req)
+    BACKGROUND_TASKS.inc(state="queued")
     return ScrapeResponse(session_id=session_id, status="running")
 
 
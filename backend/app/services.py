@@ -1,5 +1,6 @@
 import uuid
 import json
+import time
 import traceback
 from datetime import datetime
 
@@ -7,10 +8,15 @@ import pandas as pd
 from jobspy import scrape_jobs
 
 from .database import get_connection
+from .metrics import BACKGROUND_TASKS, JOBS_INGESTED, SESSION_SECONDS
 from .models import ScrapeRequest
 
 
 def run_scrape(session_id: str, req: ScrapeRequest):
+    BACKGROUND_TASKS.dec(state="queued")
+    BACKGROUND_TASKS.inc(state="running")
+    start = time.perf_counter()
+    status = "failed"
     con = get_connection()
     try:
         params = req.model_dump(exclude_none=True)
@@ -36,6 +42,7 @@ def run_scrape(session_id: str, req: ScrapeRequest):
                 "UPDATE scrape_sessions SET status='completed', jobs_found=0, completed_at=current_timestamp WHERE id=?",
                 [session_id],
             )
+            status = "completed"
             return
 
         df["scraped_at"] = datetime.now()
@@ -67,13 +74,20 @@ def run_scrape(session_id: str, req: ScrapeRequest):
                 df[col] = None
         df_insert = df[[c for c in table_cols if c in df.columns]]
 
+        # registered explicitly: DuckDB's lookup of local DataFrames by name
+        # does not see this frame through the timed connection wrapper
+        con.register("df_insert", df_insert)
         con.execute("INSERT INTO jobs SELECT * FROM df_insert")
+        con.unregister("df_insert")
+        for site, site_count in df["site"].value_counts().items():
+            JOBS_INGESTED.inc(int(site_count), site=site)
 
         count = len(df)
         con.execute(
             "UPDATE scrape_sessions SET status='completed', jobs_found=?, completed_at=current_timestamp WHERE id=?",
             [count, session_id],
         )
+        status = "completed"
     except Exception as e:
         con.execute(
             "UPDATE scrape_sessions SET status='failed', error_message=?, completed_at=current_timestamp WHERE id=?",
@@ -81,6 +95,8 @@ def run_scrape(session_id: str, req: ScrapeRequest):
         )
     finally:
         con.close()
+        SESSION_SECONDS.observe(time.perf_counter() - start, status=status)
+        BACKGROUND_TASKS.dec(state="running")
 
 
 def create_session(req: ScrapeRequest) -> str:
@@ -0,0 +1,139 @@
+"""
+Times BDJobs card and detail parsing on a generated search page.
+
+Compares the single-walk extraction plan used by the scraper against the
+per-field lambda class matchers it replaced.
+
+    python benchmarks/bdjobs_parse.py [--cards 50] [--repeat 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from bs4 import BeautifulSoup
+
+from jobspy.bdjobs import BDJobs
+from jobspy.bdjobs.util import find_job_listings, extract_detail_fields
+
+CARD = """
+<div class="job-item">
+  <div class="row">
+    <div class="col-sm-12 job-title-wrapper">
+      <div class="job-title-text"><a href="/jobdetail.asp?id={i}&jobid={i}">Software Engineer {i}</a></div>
+      <div class="comp-name-text">Company {i} Ltd.</div>
+    </div>
+    <div class="col-sm-12 locon-wrapper">
+      <div class="locon-text-d"><span>Dhaka, Bangladesh</span></div>
+      <div class="exp-text-d"><span>3 to 5 years</span></div>
+    </div>
+    <div class="col-sm-12">
+      <div class="dead-text-d"><span class="deadline">Deadline: 12 Jan 2026</span></div>
+      <ul class="edu-text-d"><li>B.Sc in CSE</li><li>M.Sc preferred</li></ul>
+    </div>
+  </div>
+</div>
+"""
+
+DETAIL = """
+<html><body>
+<div class="header"><div class="nav"><span>Home</span><span>Jobs</span></div></div>
+{filler}
+<div class="job-summary"><span>Employment Type</span><span>Full Time</span></div>
+<div class="job-summary"><span>Industry</span><span>IT/Telecommunication</span></div>
+<section class="job-description"><p>Build and maintain services.</p><ul><li>Python</li></ul></section>
+</body></html>
+"""
+
+
+def search_page(cards: int) -> str:
+    body = "".join(CARD.format(i=i) for i in range(cards))
+    return f"<html><body><div class='sout-jobs-wrapper'>{body}</div></body></html>"
+
+
+def detail_page() -> str:
+    filler = "".join(
+        f"<div class='block-{i}'><span>label {i}</span><div>value {i}</div></div>"
+        for i in range(200)
+    )
+    return DETAIL.format(filler=filler)
+
+
+def legacy_card_fields(job_card):
+    """Lookups used before the extraction plan, one subtree walk per field."""
+    job_card.find("a", href=lambda h: h and "jobdetail" in h.lower())
+    job_card.find(
+        ["span", "div"],
+        class_=lambda c: c and "comp-name-text" in (c or "").lower(),
+    )
+    job_card.find(
+        ["span", "div"],
+        class_=lambda c: c and "locon-text-d" in (c or "").lower(),
+    )
+    job_card.find(
+        ["span", "div"],
+        class_=lambda c: c
+        and any(
+            term in (c or "").lower() for term in ["date", "deadline", "published"]
+        ),
+    )
+
+
+def legacy_detail_fields(soup):
+    soup.find(
+        ["div", "section"],
+        class_=lambda c: c
+        and any(
+            term in (c or "").lower()
+            for term in ["job-description", "details", "requirements"]
+        ),
+    )
+    soup.find(
+        ["span", "div"],
+        string=lambda s: s
+        and any(term in (s or "").lower() for term in ["job type", "employment type"]),
+    )
+    soup.find(["span", "div"], string=lambda s: s and "industry" in (s or "").lower())
+
+
+def timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cards", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    scraper = BDJobs()
+    search_soup = BeautifulSoup(search_page(args.cards), "html.parser")
+    detail_soup = BeautifulSoup(detail_page(), "html.parser")
+    cards, _ = find_job_listings(search_soup)
+
+    def plan_cards():
+        for card in cards:
+            scraper._process_job(card)
+
+    def legacy_cards():
+        for card in cards:
+            legacy_card_fields(card)
+
+    results = {
+        "cards (plan, incl. JobPost)": timed(plan_cards, args.repeat),
+        "cards (legacy lookups only)": timed(legacy_cards, args.repeat),
+        "detail (plan)": timed(lambda: extract_detail_fields(detail_soup), args.repeat),
+        "detail (legacy)": timed(
+            lambda: legacy_detail_fields(detail_soup), args.repeat
+        ),
+    }
+    for name, seconds in results.items():
+        print(f"{name:<30} {seconds * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
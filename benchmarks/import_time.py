@@ -0,0 +1,105 @@
+"""
+Measures how long `import jobspy` takes in a fresh interpreter.
+
+Runs `python -X importtime` several times, reports the median cumulative
+import time and the heaviest modules, and checks that importing the package
+does not load the dependencies that are meant to be imported lazily.
+
+    python benchmarks/import_time.py [--statement "from jobspy import LinkedIn"]
+
+In CI, fail when the median goes over a budget:
+
+    python benchmarks/import_time.py --max-ms 400
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+# never loaded by `import jobspy` alone
+LAZY_MODULES = [
+    "pandas",
+    "numpy",
+    "tls_client",
+    "bs4",
+    "markdownify",
+    "regex",
+    "jobspy.linkedin",
+    "jobspy.indeed",
+]
+
+
+def import_times(
+    statement: str, startup: set[str] = frozenset()
+) -> tuple[float, dict[str, int]]:
+    """
+    Milliseconds spent importing what the statement loads, beyond interpreter
+    startup, and the cumulative import time in microseconds per module
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    top_level = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+        if not name[1:].startswith(" "):
+            top_level.append(name.strip())
+    total = sum(times[name] for name in top_level if name not in startup)
+    return total / 1000, times
+
+
+def loaded_modules(statement: str) -> set[str]:
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--statement", default="import jobspy")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--max-ms", type=float)
+    args = parser.parse_args()
+
+    startup = set(import_times("pass")[1])
+    runs = [import_times(args.statement, startup) for _ in range(args.repeat)]
+    median_ms = statistics.median(total for total, _ in runs)
+    print(f"{args.statement!r}: median {median_ms:.1f} ms over {args.repeat} runs")
+
+    heaviest = sorted(runs[-1][1].items(), key=lambda item: item[1], reverse=True)
+    for name, cumulative in heaviest[: args.top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    failed = False
+    if args.statement == "import jobspy":
+        eager = sorted(set(LAZY_MODULES) & loaded_modules(args.statement))
+        if eager:
+            print(f"imported eagerly: {', '.join(eager)}")
+            failed = True
+    if args.max_ms is not None and median_ms > args.max_ms:
+        print(f"over budget: {median_ms:.1f} ms > {args.max_ms} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
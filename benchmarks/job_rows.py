@@ -0,0 +1,197 @@
+"""
+Times JobPost construction and scrape_jobs DataFrame assembly for many jobs.
+
+Compares the attribute-based rows built into one DataFrame against the
+model_dump() + Location rebuild + per-job DataFrame + concat path it
+replaced, and validated JobPost construction against the trusted
+model_construct path, the per-job CPU and allocation difference of which
+is printed at the end. CPU time is the best of --repeat runs without
+tracing; peak allocations are measured in a separate run with tracemalloc.
+
+    python benchmarks/job_rows.py [--jobs 10000] [--repeat 3] [--skip-legacy]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from jobspy.model import (
+    Compensation,
+    CompensationInterval,
+    Country,
+    JobPost,
+    JobType,
+    Location,
+    SalarySource,
+)
+from jobspy.util import (
+    convert_to_annual,
+    desired_order,
+    extract_salary,
+    fill_description_salaries,
+    job_to_row,
+)
+
+
+def job_fields(i: int) -> dict:
+    fields = dict(
+        id=f"li-{i}",
+        title=f"Software Engineer {i}",
+        company_name=f"Company {i}",
+        job_url=f"https://www.linkedin.com/jobs/view/{i}",
+        location=Location(city="San Francisco", state="CA", country=Country.USA),
+        job_type=[JobType.FULL_TIME],
+        date_posted=date(2024, 1, 1 + i % 28),
+        description="Build things. Salary $120,000 - $150,000 per year.",
+        emails=[f"jobs{i}@example.com"],
+        is_remote=i % 3 == 0,
+    )
+    if i % 2:
+        fields["compensation"] = Compensation(
+            interval=CompensationInterval.HOURLY, min_amount=50, max_amount=70
+        )
+    return fields
+
+
+def legacy_rows(jobs: list[JobPost], country: Country) -> pd.DataFrame:
+    jobs_dfs = []
+    for job in jobs:
+        job_data = job.model_dump()
+        job_data["site"] = "linkedin"
+        job_data["company"] = job_data["company_name"]
+        job_data["job_type"] = (
+            ", ".join(job_type.value[0] for job_type in job_data["job_type"])
+            if job_data["job_type"]
+            else None
+        )
+        job_data["emails"] = (
+            ", ".join(job_data["emails"]) if job_data["emails"] else None
+        )
+        if job_data["location"]:
+            job_data["location"] = Location(**job_data["location"]).display_location()
+        compensation_obj = job_data.get("compensation")
+        if compensation_obj and isinstance(compensation_obj, dict):
+            job_data["interval"] = (
+                compensation_obj.get("interval").value
+                if compensation_obj.get("interval")
+                else None
+            )
+            job_data["min_amount"] = compensation_obj.get("min_amount")
+            job_data["max_amount"] = compensation_obj.get("max_amount")
+            job_data["currency"] = compensation_obj.get("currency", "USD")
+            job_data["salary_source"] = SalarySource.DIRECT_DATA.value
+            if job_data["interval"] != "yearly":
+                convert_to_annual(job_data)
+        elif country == Country.USA:
+            (
+                job_data["interval"],
+                job_data["min_amount"],
+                job_data["max_amount"],
+                job_data["currency"],
+            ) = extract_salary(job_data["description"], enforce_annual_salary=True)
+            job_data["salary_source"] = SalarySource.DESCRIPTION.value
+        job_data["salary_source"] = (
+            job_data["salary_source"] if job_data.get("min_amount") else None
+        )
+        job_data["skills"] = (
+            ", ".join(job_data["skills"]) if job_data["skills"] else None
+        )
+        jobs_dfs.append(pd.DataFrame([job_data]))
+    filtered = [df.dropna(axis=1, how="all") for df in jobs_dfs]
+    jobs_df = pd.concat(filtered, ignore_index=True)
+    for column in desired_order:
+        if column not in jobs_df.columns:
+            jobs_df[column] = None
+    return jobs_df[desired_order]
+
+
+def fast_rows(jobs: list[JobPost], country: Country) -> pd.DataFrame:
+    rows = [job_to_row(job, "linkedin", True) for job in jobs]
+    jobs_df = pd.DataFrame(rows, columns=desired_order)
+    if country == Country.USA:
+        without_compensation = np.array([job.compensation is None for job in jobs])
+        fill_description_salaries(jobs_df, without_compensation, True)
+    return jobs_df
+
+
+def measure(fn, repeat: int) -> tuple[float, int, object]:
+    """Best CPU seconds over repeat untraced runs, peak bytes, and the result"""
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        seconds.append(time.perf_counter() - start)
+    tracemalloc.start()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(seconds), peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--skip-legacy",
+        action="store_true",
+        help="leave out the old row path, which takes minutes for 10k jobs",
+    )
+    args = parser.parse_args()
+    n = args.jobs
+    fields = [job_fields(i) for i in range(n)]
+
+    results = {}
+    results["JobPost (validated)"] = measure(
+        lambda: [JobPost(**f) for f in fields], args.repeat
+    )
+    results["JobPost.model_construct"] = measure(
+        lambda: [JobPost.model_construct(**f) for f in fields], args.repeat
+    )
+    jobs = results["JobPost (validated)"][2]
+    if not args.skip_legacy:
+        results["rows (legacy dump + concat)"] = measure(
+            lambda: legacy_rows(jobs, Country.USA), 1
+        )
+    results["rows (attributes, one frame)"] = measure(
+        lambda: fast_rows(jobs, Country.USA), args.repeat
+    )
+
+    if not args.skip_legacy:
+        legacy = results["rows (legacy dump + concat)"][2]
+        fast = results["rows (attributes, one frame)"][2]
+        pd.testing.assert_frame_equal(
+            legacy.fillna(pd.NA).astype(object),
+            fast.fillna(pd.NA).astype(object),
+            check_dtype=False,
+        )
+    # the trusted path must build the same jobs to be a like-for-like comparison
+    constructed = results["JobPost.model_construct"][2]
+    assert [job.model_dump() for job in constructed[:100]] == [
+        job.model_dump() for job in jobs[:100]
+    ]
+
+    print(f"{'step':<30} {'total ms':>10} {'us/job':>8} {'peak MiB':>9} {'B/job':>7}")
+    for name, (seconds, peak, _) in results.items():
+        print(
+            f"{name:<30} {seconds * 1000:>10.1f} {seconds / n * 1e6:>8.1f}"
+            f" {peak / 2**20:>9.1f} {peak / n:>7.0f}"
+        )
+
+    validated_seconds, validated_peak, _ = results["JobPost (validated)"]
+    trusted_seconds, trusted_peak, _ = results["JobPost.model_construct"]
+    print(
+        f"\nmodel_construct vs validated: "
+        f"{(validated_seconds - trusted_seconds) / n * 1e6:+.1f} us/job CPU saved, "
+        f"{(validated_peak - trusted_peak) / n:+.0f} B/job allocation saved"
+    )
+
+
+if __name__ == "__main__":
+    main()
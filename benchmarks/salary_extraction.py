@@ -0,0 +1,95 @@
+"""
+Times salary extraction over a column of job descriptions.
+
+Compares extract_salary called row by row against extract_salary_batch on
+the same generated descriptions, and checks that both agree. Most of the
+time in either is the regex scan itself, which the batch version still
+runs once per description.
+
+    python benchmarks/salary_extraction.py [--rows 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+import numpy as np
+import pandas as pd
+
+from jobspy.util import extract_salary, extract_salary_batch
+
+TEMPLATES = [
+    "We pay ${lo} - ${hi} per year plus equity.",
+    "Compensation: ${lo}k-{hi}k depending on experience.",
+    "Hourly rate ${lo}.50 – ${hi} for contractors.",
+    "Monthly stipend of ${lo},000 — ${hi},500.",
+    "Salary range ${lo},{lo}00 - {hi},{hi}00 with benefits.",
+    "No salary listed, but great team and ${lo} signing bonus.",
+    "Competitive pay.",
+    "",
+]
+
+
+def descriptions(rows: int, seed: int = 7) -> pd.Series:
+    rng = random.Random(seed)
+    values = []
+    for _ in range(rows):
+        template = rng.choice(TEMPLATES)
+        lo = rng.choice([15, 40, 90, 120, 3000, 8000, 60000, 95000])
+        hi = lo + rng.choice([0, 5, 20, 50, 20000])
+        filler = " lorem ipsum" * rng.randint(5, 60)
+        values.append(filler + template.format(lo=lo, hi=hi) + filler)
+    values[0] = None
+    return pd.Series(values, dtype=object)
+
+
+def scalar(column: pd.Series, enforce_annual_salary: bool) -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            extract_salary(description, enforce_annual_salary=enforce_annual_salary)
+            for description in column
+        ],
+        columns=["interval", "min_amount", "max_amount", "currency"],
+        index=column.index,
+    )
+
+
+def check(expected: pd.DataFrame, actual: pd.DataFrame) -> None:
+    for column in ("interval", "currency"):
+        assert expected[column].isna().equals(actual[column].isna()), column
+        matched = expected[column].notna()
+        assert (expected.loc[matched, column] == actual.loc[matched, column]).all()
+    for column in ("min_amount", "max_amount"):
+        np.testing.assert_array_equal(
+            expected[column].astype(float).to_numpy(), actual[column].to_numpy()
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    column = descriptions(args.rows)
+    for enforce in (False, True):
+        start = time.perf_counter()
+        expected = scalar(column, enforce)
+        scalar_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = extract_salary_batch(column, enforce_annual_salary=enforce)
+        batch_seconds = time.perf_counter() - start
+
+        check(expected, actual)
+        found = int(actual["min_amount"].notna().sum())
+        print(
+            f"enforce_annual_salary={enforce!s:<5} {found} salaries in {args.rows} rows:"
+            f" row by row {scalar_seconds * 1000:.0f} ms,"
+            f" batch {batch_seconds * 1000:.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Times every scraper's full scrape() path against recorded responses.
+
+Record a fixture corpus once (needs network access, honours the scrapers'
+normal throttling):
+
+    python benchmarks/scrapers.py --record
+
+Replay it offline, with throttling sleeps skipped:
+
+    python benchmarks/scrapers.py [--sites linkedin,indeed] [--repeat 5]
+
+In CI, compare against a saved baseline and fail on parse-time regressions:
+
+    python benchmarks/scrapers.py --save-baseline benchmarks/baseline.json
+    python benchmarks/scrapers.py --baseline benchmarks/baseline.json --tolerance 1.5
+
+Fixtures live in <fixtures>/<site>/, one JSON file per request. Sites without
+fixtures are reported as skipped. The committed corpus covers every site
+with small, hand-made responses in the shape of the real ones;
+tests/test_fixtures.py replays it and checks the parsed jobs. The baseline in
+benchmarks/baseline.json is checked by CI (.github/workflows/tests.yml).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from unittest import mock
+
+from jobspy import (
+    BaytScraper,
+    BDJobs,
+    Glassdoor,
+    Google,
+    Indeed,
+    LinkedIn,
+    Naukri,
+    Wellfound,
+    ZipRecruiter,
+)
+from jobspy.model import Country, ScraperInput, Site
+from jobspy.transport import (
+    FixtureNotFound,
+    FixtureStore,
+    RecordTransport,
+    ReplayTransport,
+    use_transport,
+)
+from jobspy.util import map_str_to_site
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+SCRAPERS = {
+    Site.LINKEDIN: LinkedIn,
+    Site.INDEED: Indeed,
+    Site.GLASSDOOR: Glassdoor,
+    Site.GOOGLE: Google,
+    Site.ZIP_RECRUITER: ZipRecruiter,
+    Site.NAUKRI: Naukri,
+    Site.BDJOBS: BDJobs,
+    Site.BAYT: BaytScraper,
+    Site.WELLFOUND: Wellfound,
+}
+
+# one search per site, fixed so recorded request keys stay stable
+SEARCHES = {
+    Site.LINKEDIN: dict(
+        search_term="software engineer",
+        location="San Francisco, CA",
+        linkedin_fetch_description=True,
+    ),
+    Site.INDEED: dict(search_term="software engineer", location="San Francisco, CA"),
+    Site.GLASSDOOR: dict(search_term="software engineer", location="San Francisco, CA"),
+    Site.GOOGLE: dict(
+        search_term="software engineer",
+        google_search_term="software engineer jobs near San Francisco, CA since yesterday",
+    ),
+    Site.ZIP_RECRUITER: dict(
+        search_term="software engineer", location="San Francisco, CA"
+    ),
+    Site.NAUKRI: dict(
+        search_term="software engineer",
+        location="Bangalore",
+        country=Country.INDIA,
+        linkedin_fetch_description=True,
+    ),
+    Site.BDJOBS: dict(search_term="software engineer", country=Country.BANGLADESH),
+    Site.BAYT: dict(search_term="software engineer", bayt_fetch_description=True),
+    Site.WELLFOUND: dict(search_term="software engineer"),
+}
+
+
+class CountingReplay(ReplayTransport):
+    """Replay transport that counts requests without a recorded response"""
+
+    misses = 0
+
+    def send(self, request, send):
+        try:
+            return super().send(request, send)
+        except FixtureNotFound:
+            self.misses += 1
+            raise
+
+
+def scraper_input(site: Site, results_wanted: int) -> ScraperInput:
+    return ScraperInput(
+        site_type=[site], results_wanted=results_wanted, **SEARCHES[site]
+    )
+
+
+def record(site: Site, fixtures: Path, results_wanted: int) -> int:
+    with use_transport(RecordTransport(FixtureStore(fixtures / site.value))):
+        response = SCRAPERS[site]().scrape(scraper_input(site, results_wanted))
+    return len(response.jobs)
+
+
+def replay(site: Site, fixtures: Path, results_wanted: int, repeat: int) -> dict:
+    store = FixtureStore(fixtures / site.value)
+    if not store.path.is_dir():
+        return {"status": "skipped (no fixtures)"}
+    timings = []
+    transport = CountingReplay(store)
+    with use_transport(transport), mock.patch("time.sleep"):
+        for _ in range(repeat):
+            scraper = SCRAPERS[site]()
+            start = time.perf_counter()
+            response = scraper.scrape(scraper_input(site, results_wanted))
+            timings.append(time.perf_counter() - start)
+    return {
+        "status": "ok" if not transport.misses else f"{transport.misses} misses",
+        "jobs": len(response.jobs),
+        "median": statistics.median(timings),
+        "min": min(timings),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Offline scraper benchmarks")
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES)
+    parser.add_argument("--sites", help="comma separated, default all")
+    parser.add_argument("--results-wanted", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--record", action="store_true")
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--tolerance", type=float, default=1.5)
+    parser.add_argument("--save-baseline", type=Path)
+    args = parser.parse_args()
+
+    sites = (
+        [map_str_to_site(name.strip()) for name in args.sites.split(",")]
+        if args.sites
+        else list(SCRAPERS)
+    )
+
+    if args.record:
+        for site in sites:
+            jobs = record(site, args.fixtures, args.results_wanted)
+            print(f"{site.value:<15} recorded {jobs} jobs")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else {}
+    results = {}
+    regressions = []
+    print(f"{'site':<15} {'status':<22} {'jobs':>5} {'median ms':>10} {'min ms':>9}")
+    for site in sites:
+        result = replay(site, args.fixtures, args.results_wanted, args.repeat)
+        if "median" not in result:
+            print(f"{site.value:<15} {result['status']:<22}")
+            continue
+        results[site.value] = result["median"]
+        print(
+            f"{site.value:<15} {result['status']:<22} {result['jobs']:>5}"
+            f" {result['median'] * 1000:>10.1f} {result['min'] * 1000:>9.1f}"
+        )
+        allowed = baseline.get(site.value)
+        if allowed and result["median"] > allowed * args.tolerance:
+            regressions.append(site.value)
+
+    if args.save_baseline:
+        args.save_baseline.write_text(json.dumps(results, indent=2, sort_keys=True))
+    if regressions:
+        print(f"regressed beyond {args.tolerance}x baseline: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,19 +1,22 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Tuple
-
-import pandas as pd
-
-from jobspy.bayt import BaytScraper
-from jobspy.bdjobs import BDJobs
-from jobspy.glassdoor import Glassdoor
-from jobspy.google import Google
-from jobspy.indeed import Indeed
-from jobspy.linkedin import LinkedIn
-from jobspy.naukri import Naukri
-from jobspy.wellfound import Wellfound
-from jobspy.model import JobType, Location, JobResponse, Country
+import importlib
+import os
+import threading
+import time
+from concurrent.futures import TimeoutError as FuturesTimeoutError, as_completed
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Tuple
+
+from jobspy.cache import HttpCache, http_cache_scope
+from jobspy.concurrency import ContextExecutor
+from jobspy import metrics
+from jobspy.checkpoint import CheckpointStore, checkpoint_scope, failure_scope
+from jobspy.deadline import deadline_reached, deadline_scope
+from jobspy.exception import DeadlineExceeded
+from jobspy.incremental import HighWaterMarks, watermark_scope
+from jobspy.seen import SeenFilter, seen_scope
+from jobspy.instrument import ScrapeTimings, collect, site_scope
+from jobspy.model import JobType, Location, JobResponse, Country, Scraper
 from jobspy.model import SalarySource, ScraperInput, Site
 from jobspy.util import (
     set_logger_level,
@@ -23,11 +26,51 @@ from jobspy.util import (
     map_str_to_site,
     convert_to_annual,
     desired_order,
+    extract_emails_batch,
+    fill_description_salaries,
+    job_to_row,
+    shared_sessions,
 )
-from jobspy.ziprecruiter import ZipRecruiter
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# scraper classes by site as "module:class", imported on first use so that
+# scraping one site doesn't load every scraper and its dependencies
+SCRAPER_MAPPING = {
+    Site.LINKEDIN: "jobspy.linkedin:LinkedIn",
+    Site.INDEED: "jobspy.indeed:Indeed",
+    Site.ZIP_RECRUITER: "jobspy.ziprecruiter:ZipRecruiter",
+    Site.GLASSDOOR: "jobspy.glassdoor:Glassdoor",
+    Site.GOOGLE: "jobspy.google:Google",
+    Site.BAYT: "jobspy.bayt:BaytScraper",
+    Site.NAUKRI: "jobspy.naukri:Naukri",
+    Site.BDJOBS: "jobspy.bdjobs:BDJobs",
+    Site.WELLFOUND: "jobspy.wellfound:Wellfound",
+}
+# how long scrape_jobs waits past its timeout for scrapers stuck in a request
+# before returning without them
+DEADLINE_GRACE_SECONDS = 5
+_SCRAPER_PATHS = {path.partition(":")[2]: path for path in SCRAPER_MAPPING.values()}
+
+
+def _import_scraper(path: str) -> type[Scraper]:
+    module_name, _, class_name = path.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def get_scraper_class(site: Site) -> type[Scraper]:
+    return _import_scraper(SCRAPER_MAPPING[site])
+
+
+def __getattr__(name: str):
+    """Resolves the scraper classes (LinkedIn, Indeed, ...) on first access"""
+    if name in _SCRAPER_PATHS:
+        scraper_class = _import_scraper(_SCRAPER_PATHS[name])
+        globals()[name] = scraper_class
+        return scraper_class
+    raise AttributeError(f"module 'jobspy' has no attribute '{name}'")
 
-# Update the SCRAPER_MAPPING dictionary in the scrape_jobs function
 
 def scrape_jobs(
     site_name: str | list[str] | Site | list[Site] | None = None,
@@ -41,32 +84,56 @@ def scrape_jobs(
     results_wanted: int = 15,
     country_indeed: str = "usa",
     proxies: list[str] | str | None = None,
+    proxy_rotation: str | int = "request",
     ca_cert: str | None = None,
     description_format: str = "markdown",
     linkedin_fetch_description: bool | None = False,
     linkedin_company_ids: list[int] | None = None,
+    bdjobs_fetch_description: bool = True,
+    bayt_fetch_description: bool = False,
+    ziprecruiter_fetch_description: bool = True,
     offset: int | None = 0,
     hours_old: int = None,
     enforce_annual_salary: bool = False,
     verbose: int = 0,
     user_agent: str = None,
+    instrument: bool | Callable[[dict], None] = False,
+    timeout: float | None = None,
+    site_timeouts: dict[str | Site, float] | None = None,
+    incremental: str | os.PathLike | HighWaterMarks | None = None,
+    seen_jobs: str | os.PathLike | SeenFilter | None = None,
+    checkpoint: str | os.PathLike | CheckpointStore | None = None,
+    http_cache: str | os.PathLike | HttpCache | None = None,
     **kwargs,
 ) -> pd.DataFrame:
     """
     Scrapes job data from job boards concurrently
-    :return: Pandas DataFrame containing job data
+    :param timeout: seconds the whole call may take; scrapers stop paging at
+        the deadline and return the jobs gathered so far. A scraper still
+        blocked in a request past the grace period is left running: the call
+        returns without it, but its thread can hold up interpreter exit until
+        the request itself times out
+    :param site_timeouts: seconds each named site may take, within timeout
+    :param incremental: a JSON file path, or HighWaterMarks, remembering the
+        jobs already returned per site, search term and location; only new
+        jobs are returned and scrapers stop paging at known ones
+    :param seen_jobs: a file path, or SeenFilter, of the job ids returned by
+        earlier runs; scrapers skip those jobs before fetching their details,
+        and the ids of the jobs returned are added. A path is read and written
+        again by every call, so pass one SeenFilter to calls made in a loop
+    :param checkpoint: a directory, or CheckpointStore, where LinkedIn, Indeed,
+        Glassdoor and Naukri save their progress after every page; running
+        the same search again resumes an unfinished scrape from there
+    :param http_cache: a directory, or HttpCache, where GET responses are
+        cached for a few minutes and revalidated with ETag/Last-Modified,
+        shared by every process using the same directory
+    :return: Pandas DataFrame containing job data, with each site's status
+        in df.attrs["site_status"]: complete, partial when the deadline cut
+        it short, error when it stopped on a failed request, or timeout
     """
-    SCRAPER_MAPPING = {
-        Site.LINKEDIN: LinkedIn,
-        Site.INDEED: Indeed,
-        Site.ZIP_RECRUITER: ZipRecruiter,
-        Site.GLASSDOOR: Glassdoor,
-        Site.GOOGLE: Google,
-        Site.BAYT: BaytScraper,
-        Site.NAUKRI: Naukri,
-        Site.BDJOBS: BDJobs,  # Add BDJobs to the scraper mapping
-        Site.WELLFOUND: Wellfound,
-    }
+    import numpy as np
+    import pandas as pd
+
     set_logger_level(verbose)
     job_type = get_enum_from_value(job_type) if job_type else None
 
@@ -99,131 +166,288 @@ def scrape_jobs(
         linkedin_fetch_description=linkedin_fetch_description,
         results_wanted=results_wanted,
         linkedin_company_ids=linkedin_company_ids,
+        bdjobs_fetch_description=bdjobs_fetch_description,
+        bayt_fetch_description=bayt_fetch_description,
+        ziprecruiter_fetch_description=ziprecruiter_fetch_description,
         offset=offset,
         hours_old=hours_old,
     )
 
-    def scrape_site(site: Site) -> Tuple[str, JobResponse]:
-        scraper_class = SCRAPER_MAPPING[site]
-        scraper = scraper_class(proxies=proxies, ca_cert=ca_cert, user_agent=user_agent)
-        scraped_data: JobResponse = scraper.scrape(scraper_input)
+    site_budgets = {
+        map_str_to_site(site) if isinstance(site, str) else site: seconds
+        for site, seconds in (site_timeouts or {}).items()
+    }
+
+    marks = incremental
+    if incremental is not None and not isinstance(incremental, HighWaterMarks):
+        marks = HighWaterMarks(incremental)
+
+    seen = seen_jobs
+    if seen_jobs is not None and not isinstance(seen_jobs, SeenFilter):
+        seen = SeenFilter.open(seen_jobs)
+
+    checkpoints = checkpoint
+    if checkpoint is not None and not isinstance(checkpoint, CheckpointStore):
+        checkpoints = CheckpointStore(checkpoint)
+    cache = http_cache
+    if http_cache is not None and not isinstance(http_cache, HttpCache):
+        cache = HttpCache(http_cache)
+    # taken before the scrapers run, as some of them adjust scraper_input
+    search_key = scraper_input.model_dump_json()
+
+    def scrape_site(site: Site) -> Tuple[str, JobResponse, str]:
+        scraper_class = get_scraper_class(site)
+        scraper = scraper_class(
+            proxies=proxies,
+            ca_cert=ca_cert,
+            user_agent=user_agent,
+            proxy_rotation=proxy_rotation,
+        )
+        site_checkpoint = None
+        if checkpoints is not None:
+            site_checkpoint = checkpoints.get(site.value, search_key)
+        mark = None
+        if marks is not None:
+            mark = marks.get(site.value, search_term, location)
+        start = time.perf_counter()
+        with (
+            deadline_scope(site_budgets.get(site)),
+            watermark_scope(mark),
+            seen_scope(seen),
+            checkpoint_scope(site_checkpoint),
+            site_scope(site.value),
+            failure_scope() as errors,
+        ):
+            try:
+                scraped_data: JobResponse = scraper.scrape(scraper_input)
+                if deadline_reached():
+                    status = "partial"
+                else:
+                    status = "error" if errors else "complete"
+            except DeadlineExceeded:
+                # scrapers stop paging at the deadline and return what they
+                # have, so this is only reached before their first page
+                scraped_data, status = JobResponse(jobs=[]), "timeout"
+        if site_checkpoint is not None and status == "complete":
+            site_checkpoint.clear()
+        if mark is not None:
+            new_jobs = [
+                job
+                for job in scraped_data.jobs
+                if not mark.is_known(job.id, job.date_posted)
+            ]
+            mark.add(new_jobs)
+            scraped_data = JobResponse(jobs=new_jobs)
+        if seen is not None:
+            seen.update(job.id for job in scraped_data.jobs if job.id)
+        metrics.scrape_seconds.observe(time.perf_counter() - start, site=site.value)
+        metrics.jobs_scraped.inc(len(scraped_data.jobs), site=site.value)
         cap_name = site.value.capitalize()
         site_name = "ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name
         site_name = "LinkedIn" if cap_name == "Linkedin" else cap_name
         create_logger(site_name).info(f"finished scraping")
-        return site.value, scraped_data
+        return site.value, scraped_data, status
 
     site_to_jobs_dict = {}
+    site_status = {}
 
-    def worker(site):
-        site_val, scraped_info = scrape_site(site)
-        return site_val, scraped_info
+    timings = None
+    if instrument:
+        timings = ScrapeTimings(instrument if callable(instrument) else None)
 
-    with ThreadPoolExecutor() as executor:
+    wait = None if timeout is None else timeout + DEADLINE_GRACE_SECONDS
+    with collect(timings), deadline_scope(timeout), http_cache_scope(cache):
+        executor = ContextExecutor(max_workers=len(scraper_input.site_type))
         future_to_site = {
-            executor.submit(worker, site): site for site in scraper_input.site_type
+            executor.submit(scrape_site, site): site for site in scraper_input.site_type
         }
+        timed_out = False
+        try:
+            for future in as_completed(future_to_site, timeout=wait):
+                site_value, scraped_data, status = future.result()
+                site_to_jobs_dict[site_value] = scraped_data
+                site_status[site_value] = status
+        except FuturesTimeoutError:
+            # scrapers still blocked past the grace period are left behind
+            timed_out = True
+            for future, site in future_to_site.items():
+                if not future.done():
+                    site_status[site.value] = "timeout"
+                    create_logger("JobSpy").warning(
+                        f"{site.value} did not finish within the timeout"
+                    )
+        finally:
+            executor.shutdown(wait=not timed_out, cancel_futures=True)
+    if marks is not None:
+        marks.save()
+    if seen is not None:
+        seen.save()
+
+    dataframe_start = time.perf_counter()
+    jobs = [
+        (site, job)
+        for site, job_response in site_to_jobs_dict.items()
+        for job in job_response.jobs
+    ]
 
-        for future in as_completed(future_to_site):
-            site_value, scraped_data = future.result()
-            site_to_jobs_dict[site_value] = scraped_data
-
-    jobs_dfs: list[pd.DataFrame] = []
-
-    for site, job_response in site_to_jobs_dict.items():
-        for job in job_response.jobs:
-            job_data = job.model_dump()
-            job_url = job_data["job_url"]
-            job_data["site"] = site
-            job_data["company"] = job_data["company_name"]
-            job_data["job_type"] = (
-                ", ".join(job_type.value[0] for job_type in job_data["job_type"])
-                if job_data["job_type"]
-                else None
+    if jobs:
+        # one DataFrame for all jobs, already in the desired column order
+        jobs_df = pd.DataFrame(
+            [job_to_row(job, site, enforce_annual_salary) for site, job in jobs],
+            columns=desired_order,
+        )
+        # emails are taken from the final descriptions in one pass, not per scraper
+        without_emails = jobs_df["emails"].isna()
+        jobs_df.loc[without_emails, "emails"] = extract_emails_batch(
+            jobs_df.loc[without_emails, "description"]
+        )
+        if country_enum == Country.USA:
+            without_compensation = np.array(
+                [job.compensation is None for _, job in jobs]
             )
-            job_data["emails"] = (
-                ", ".join(job_data["emails"]) if job_data["emails"] else None
+            fill_description_salaries(
+                jobs_df, without_compensation, enforce_annual_salary
             )
-            if job_data["location"]:
-                job_data["location"] = Location(
-                    **job_data["location"]
-                ).display_location()
-
-            # Handle compensation
-            compensation_obj = job_data.get("compensation")
-            if compensation_obj and isinstance(compensation_obj, dict):
-                job_data["interval"] = (
-                    compensation_obj.get("interval").value
-                    if compensation_obj.get("interval")
-                    else None
-                )
-                job_data["min_amount"] = compensation_obj.get("min_amount")
-                job_data["max_amount"] = compensation_obj.get("max_amount")
-                job_data["currency"] = compensation_obj.get("currency", "USD")
-                job_data["salary_source"] = SalarySource.DIRECT_DATA.value
-                if enforce_annual_salary and (
-                    job_data["interval"]
-                    and job_data["interval"] != "yearly"
-                    and job_data["min_amount"]
-                    and job_data["max_amount"]
-                ):
-                    convert_to_annual(job_data)
-            else:
-                if country_enum == Country.USA:
-                    (
-                        job_data["interval"],
-                        job_data["min_amount"],
-                        job_data["max_amount"],
-                        job_data["currency"],
-                    ) = extract_salary(
-                        job_data["description"],
-                        enforce_annual_salary=enforce_annual_salary,
-                    )
-                    job_data["salary_source"] = SalarySource.DESCRIPTION.value
+        jobs_df = jobs_df.sort_values(
+            by=["site", "date_posted"], ascending=[True, False]
+        ).reset_index(drop=True)
+    else:
+        jobs_df = pd.DataFrame()
 
-            job_data["salary_source"] = (
-                job_data["salary_source"]
-                if "min_amount" in job_data and job_data["min_amount"]
-                else None
-            )
+    jobs_df.attrs["site_status"] = site_status
+    if timings:
+        timings.record("dataframe", time.perf_counter() - dataframe_start)
+        jobs_df.attrs["timings"] = timings.summary()
+    return jobs_df
 
-            #naukri-specific fields
-            job_data["skills"] = (
-                ", ".join(job_data["skills"]) if job_data["skills"] else None
-            )
-            job_data["experience_range"] = job_data.get("experience_range")
-            job_data["company_rating"] = job_data.get("company_rating")
-            job_data["company_reviews_count"] = job_data.get("company_reviews_count")
-            job_data["vacancy_count"] = job_data.get("vacancy_count")
-            job_data["work_from_home_type"] = job_data.get("work_from_home_type")
 
-            job_df = pd.DataFrame([job_data])
-            jobs_dfs.append(job_df)
+# scrape_jobs arguments naming a file or directory, and how each is opened
+_STORES = {
+    "incremental": HighWaterMarks,
+    "seen_jobs": SeenFilter.open,
+    "checkpoint": CheckpointStore,
+    "http_cache": HttpCache,
+}
+_stores_lock = threading.Lock()
 
-    if jobs_dfs:
-        # Step 1: Filter out all-NA columns from each DataFrame before concatenation
-        filtered_dfs = [df.dropna(axis=1, how="all") for df in jobs_dfs]
 
-        # Step 2: Concatenate the filtered DataFrames
-        jobs_df = pd.concat(filtered_dfs, ignore_index=True)
+def _open_stores(arguments: dict, opened: dict) -> dict:
+    """
+    The scrape_jobs arguments with the paths of their stores replaced by the
+    stores, each path opened once across the calls sharing opened, so that
+    concurrent scrapes update one store instead of each saving its own copy
+    """
+    arguments = dict(arguments)
+    for name, open_store in _STORES.items():
+        value = arguments.get(name)
+        if isinstance(value, (str, os.PathLike)):
+            key = (name, os.path.abspath(value))
+            with _stores_lock:
+                if key not in opened:
+                    opened[key] = open_store(value)
+                arguments[name] = opened[key]
+    return arguments
 
-        # Step 3: Ensure all desired columns are present, adding missing ones as empty
-        for column in desired_order:
-            if column not in jobs_df.columns:
-                jobs_df[column] = None  # Add missing columns as empty
 
-        # Reorder the DataFrame according to the desired order
-        jobs_df = jobs_df[desired_order]
+def _failed_query(site_name, error: Exception) -> pd.DataFrame:
+    """The result of a query whose scrape_jobs raised: no jobs, every site in error"""
+    import pandas as pd
 
-        # Step 4: Sort the DataFrame as required
-        return jobs_df.sort_values(
-            by=["site", "date_posted"], ascending=[True, False]
-        ).reset_index(drop=True)
+    if site_name is None:
+        sites = list(Site)
+    elif isinstance(site_name, (str, Site)):
+        sites = [site_name]
     else:
-        return pd.DataFrame()
+        sites = site_name
+    sites = [map_str_to_site(site) if isinstance(site, str) else site for site in sites]
+    create_logger("JobSpy").error(
+        f"query for {', '.join(site.value for site in sites)} failed: {error!r}"
+    )
+    jobs_df = pd.DataFrame()
+    jobs_df.attrs["site_status"] = {site.value: "error" for site in sites}
+    jobs_df.attrs["error"] = repr(error)
+    return jobs_df
+
+
+def _scrape_many(
+    queries: list[dict], max_concurrency: int, kwargs: dict
+) -> Iterator[tuple[int, dict, pd.DataFrame]]:
+    import pandas as pd
+
+    seen: set[tuple[str, str]] = set()
+    opened = {}
+    per_query = [_open_stores({**kwargs, **query}, opened) for query in queries]
+    with shared_sessions():
+        executor = ContextExecutor(max_workers=max_concurrency)
+        future_to_query = {
+            executor.submit(scrape_jobs, **arguments): (i, query)
+            for i, (query, arguments) in enumerate(zip(queries, per_query))
+        }
+        try:
+            for future in as_completed(future_to_query):
+                i, query = future_to_query[future]
+                try:
+                    jobs_df = future.result()
+                except Exception as e:
+                    # one failed query doesn't cost the others their results
+                    jobs_df = _failed_query(per_query[i].get("site_name"), e)
+                if not jobs_df.empty:
+                    keep = []
+                    for key in zip(jobs_df["site"], jobs_df["id"]):
+                        duplicate = pd.notna(key[1]) and key in seen
+                        seen.add(key)
+                        keep.append(not duplicate)
+                    jobs_df = jobs_df[keep].reset_index(drop=True)
+                yield i, query, jobs_df
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def scrape_jobs_many(
+    queries: Iterable[dict],
+    max_concurrency: int = 4,
+    stream: bool = False,
+    **kwargs,
+) -> pd.DataFrame | Iterator[tuple[dict, pd.DataFrame]]:
+    """
+    Runs scrape_jobs for many queries over shared sessions and limiters. The
+    incremental, seen_jobs, checkpoint and http_cache paths are opened once
+    and their stores shared by every query
+    :param queries: scrape_jobs arguments per query, e.g.
+        {"site_name": "indeed", "search_term": "nurse", "location": "Austin, TX"},
+        applied over the arguments shared by all queries in kwargs
+    :param max_concurrency: queries scraped at the same time
+    :param stream: yields (query, DataFrame) as each query finishes instead
+        of returning one DataFrame
+    :return: Pandas DataFrame containing the jobs of all queries, each job
+        once per site and id, with the queries and their sites' status in
+        df.attrs["queries"]. A query whose scrape raised has no jobs, its
+        sites in error and the exception under "error"
+    """
+    results = _scrape_many(list(queries), max_concurrency, kwargs)
+    if stream:
+        return ((query, jobs_df) for _, query, jobs_df in results)
+
+    import pandas as pd
+
+    results = sorted(results, key=lambda result: result[0])
+    frames = [jobs_df for _, _, jobs_df in results if not jobs_df.empty]
+    jobs_df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    jobs_df.attrs = {
+        "queries": [
+            {
+                "query": query,
+                "jobs": len(query_df),
+                "site_status": query_df.attrs.get("site_status", {}),
+                "error": query_df.attrs.get("error"),
+            }
+            for _, query, query_df in results
+        ]
+    }
+    return jobs_df
 
 
 # Add BDJobs to __all__
 __all__ = [
     "BDJobs",
-]
\ No newline at end of file
+]
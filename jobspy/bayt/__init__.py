@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import json
 import random
-import time
+from datetime import datetime
 
 from bs4 import BeautifulSoup
 
+from jobspy.concurrency import ContextExecutor
+from jobspy.checkpoint import mark_failed
+from jobspy.deadline import deadline_reached
+from jobspy.instrument import set_page
+from jobspy.seen import already_seen
 from jobspy.model import (
     Scraper,
     ScraperInput,
@@ -13,8 +19,17 @@ from jobspy.model import (
     JobResponse,
     Location,
     Country,
+    DescriptionFormat,
+)
+from jobspy.util import (
+    create_logger,
+    create_session,
+    get_enum_from_job_type,
+    markdown_converter,
+    plain_converter,
+    stable_job_id,
+    throttle,
 )
-from jobspy.util import create_logger, create_session
 
 log = create_logger("Bayt")
 
@@ -23,68 +38,113 @@ class BaytScraper(Scraper):
     base_url = "https://www.bayt.com"
     delay = 2
     band_delay = 3
+    jobs_per_page = 20
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        proxy_rotation: str | int = "request",
     ):
-        super().__init__(Site.BAYT, proxies=proxies, ca_cert=ca_cert)
+        super().__init__(
+            Site.BAYT, proxies=proxies, ca_cert=ca_cert, proxy_rotation=proxy_rotation
+        )
         self.scraper_input = None
         self.session = None
         self.country = "worldwide"
+        self.num_workers = 4
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         self.scraper_input = scraper_input
         self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
+            proxies=self.proxies,
+            ca_cert=self.ca_cert,
+            is_tls=False,
+            has_retry=True,
+            rotation=self.proxy_rotation,
+            key=self.site.value,
         )
         job_list: list[JobPost] = []
+        seen_urls = set()
         page = 1
         results_wanted = (
             scraper_input.results_wanted if scraper_input.results_wanted else 10
         )
 
-        while len(job_list) < results_wanted:
-            log.info(f"Fetching Bayt jobs page {page}")
-            job_elements = self._fetch_jobs(self.scraper_input.search_term, page)
-            if not job_elements:
-                break
-
-            if job_elements:
-                log.debug(
-                    "First job element snippet:\n" + job_elements[0].prettify()[:500]
+        with ContextExecutor(max_workers=self.num_workers) as executor:
+            while len(job_list) < results_wanted and not deadline_reached():
+                # fetch the next batch of listing pages concurrently, then read
+                # them in page order so results keep Bayt's ranking
+                pages_left = -(-(results_wanted - len(job_list)) // self.jobs_per_page)
+                batch = range(page, page + min(self.num_workers, pages_left))
+                log.info(f"Fetching Bayt jobs pages {batch[0]}-{batch[-1]}")
+                results = executor.map(
+                    lambda p: self._fetch_jobs(self.scraper_input.search_term, p),
+                    batch,
                 )
 
-            initial_count = len(job_list)
-            for job in job_elements:
-                try:
-                    job_post = self._extract_job_info(job)
-                    if job_post:
-                        job_list.append(job_post)
+                last_page_reached = False
+                for batch_page, job_elements in zip(batch, results):
+                    if last_page_reached:
+                        continue
+                    if not job_elements:
+                        last_page_reached = True
+                        continue
+                    log.debug(
+                        "First job element snippet:\n"
+                        + job_elements[0].prettify()[:500]
+                    )
+
+                    # jobs skipped as seen in earlier runs still count as new
+                    # on this page, so a page of them doesn't end the search
+                    initial_count = len(seen_urls)
+                    for job in job_elements:
                         if len(job_list) >= results_wanted:
                             break
-                    else:
-                        log.debug(
-                            "Extraction returned None. Job snippet:\n"
-                            + job.prettify()[:500]
+                        try:
+                            job_post = self._extract_job_info(job)
+                            if job_post and job_post.job_url not in seen_urls:
+                                seen_urls.add(job_post.job_url)
+                                if not already_seen(job_post.id):
+                                    job_list.append(job_post)
+                            elif not job_post:
+                                log.debug(
+                                    "Extraction returned None. Job snippet:\n"
+                                    + job.prettify()[:500]
+                                )
+                        except Exception as e:
+                            log.error(f"Bayt: Error extracting job info: {str(e)}")
+                            continue
+
+                    if len(seen_urls) == initial_count:
+                        log.info(
+                            f"No new jobs found on page {batch_page}. Ending pagination."
                         )
-                except Exception as e:
-                    log.error(f"Bayt: Error extracting job info: {str(e)}")
-                    continue
+                        last_page_reached = True
 
-            if len(job_list) == initial_count:
-                log.info(f"No new jobs found on page {page}. Ending pagination.")
-                break
+                if last_page_reached or len(job_list) >= results_wanted:
+                    break
+                page = batch[-1] + 1
+                throttle(random.uniform(self.delay, self.delay + self.band_delay))
 
-            page += 1
-            time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
+            job_list = job_list[:results_wanted]
+            if scraper_input.bayt_fetch_description:
+                details = executor.map(
+                    lambda job_post: self._fetch_job_details(job_post.job_url),
+                    job_list,
+                )
+                for job_post, job_details in zip(job_list, details):
+                    for field, value in job_details.items():
+                        setattr(job_post, field, value)
 
-        job_list = job_list[: scraper_input.results_wanted]
         return JobResponse(jobs=job_list)
 
     def _fetch_jobs(self, query: str, page: int) -> list | None:
         """
         Grabs the job results for the given query and page number.
         """
+        set_page(page)
         try:
             url = f"{self.base_url}/en/international/jobs/{query}-jobs/?page={page}"
             response = self.session.get(url)
@@ -95,8 +155,67 @@ class BaytScraper(Scraper):
             return job_listings
         except Exception as e:
             log.error(f"Bayt: Error fetching jobs - {str(e)}")
+            mark_failed(str(e))
             return None
 
+    def _fetch_job_details(self, job_url: str) -> dict:
+        """
+        Reads description, date posted and job type from the JobPosting
+        structured data on the job page.
+        """
+        try:
+            response = self.session.get(
+                job_url, timeout=self.scraper_input.request_timeout
+            )
+            response.raise_for_status()
+        except Exception as e:
+            log.error(f"Bayt: Error fetching job details - {str(e)}")
+            return {}
+
+        soup = BeautifulSoup(response.text, "html.parser")
+        job_posting = None
+        for script in soup.find_all("script", type="application/ld+json"):
+            try:
+                data = json.loads(script.string or "")
+            except json.JSONDecodeError:
+                continue
+            for item in data if isinstance(data, list) else [data]:
+                if isinstance(item, dict) and item.get("@type") == "JobPosting":
+                    job_posting = item
+                    break
+            if job_posting:
+                break
+        if not job_posting:
+            return {}
+
+        details = {}
+        description = job_posting.get("description")
+        if description:
+            if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
+                description = markdown_converter(description)
+            elif self.scraper_input.description_format == DescriptionFormat.PLAIN:
+                description = plain_converter(description)
+            details["description"] = description
+
+        date_posted = job_posting.get("datePosted")
+        if date_posted:
+            try:
+                details["date_posted"] = datetime.fromisoformat(date_posted[:10]).date()
+            except ValueError:
+                pass
+
+        employment_types = job_posting.get("employmentType") or []
+        if isinstance(employment_types, str):
+            employment_types = [employment_types]
+        job_types = [
+            get_enum_from_job_type(t.lower().replace("_", "").replace("-", ""))
+            for t in employment_types
+        ]
+        job_types = [job_type for job_type in job_types if job_type]
+        if job_types:
+            details["job_type"] = job_types
+        return details
+
     def _extract_job_info(self, job: BeautifulSoup) -> JobPost | None:
         """
         Extracts the job information from a single job listing.
@@ -123,7 +242,7 @@ class BaytScraper(Scraper):
         location_tag = job.find("div", class_="t-mute t-small")
         location = location_tag.get_text(strip=True) if location_tag else None
 
-        job_id = f"bayt-{abs(hash(job_url))}"
+        job_id = f"bayt-{stable_job_id(job_url)}"
         location_obj = Location(
             city=location,
             country=Country.from_string(self.country),
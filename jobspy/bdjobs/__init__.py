@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import random
-import time
+from concurrent.futures import Future
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from urllib.parse import urljoin
@@ -16,6 +16,8 @@ from jobspy.bdjobs.util import (
     parse_location,
     parse_date,
     find_job_listings,
+    extract_card_fields,
+    extract_detail_fields,
     is_job_remote,
 )
 from jobspy.model import (
@@ -28,12 +30,19 @@ from jobspy.model import (
     Site,
     DescriptionFormat,
 )
+from jobspy.concurrency import ContextExecutor
+from jobspy.checkpoint import mark_failed
+from jobspy.deadline import deadline_reached
+from jobspy.instrument import set_page
+from jobspy.seen import already_seen
 from jobspy.util import (
-    extract_emails_from_text,
     create_session,
     create_logger,
+    get_enum_from_job_type,
     remove_attributes,
     markdown_converter,
+    stable_job_id,
+    throttle,
 )
 
 log = create_logger("BDJobs")
@@ -46,12 +55,18 @@ class BDJobs(Scraper):
     band_delay = 3
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        proxy_rotation: str | int = "request",
     ):
         """
         Initializes BDJobsScraper with the BDJobs job search url
         """
-        super().__init__(Site.BDJOBS, proxies=proxies, ca_cert=ca_cert)
+        super().__init__(
+            Site.BDJOBS, proxies=proxies, ca_cert=ca_cert, proxy_rotation=proxy_rotation
+        )
         self.session = create_session(
             proxies=self.proxies,
             ca_cert=ca_cert,
@@ -59,10 +74,13 @@ class BDJobs(Scraper):
             has_retry=True,
             delay=5,
             clear_cookies=True,
+            rotation=self.proxy_rotation,
+            key=self.site.value,
         )
         self.session.headers.update(headers)
         self.scraper_input = None
         self.country = "bangladesh"
+        self.job_selector = None
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         """
@@ -75,60 +93,87 @@ class BDJobs(Scraper):
         seen_ids = set()
         page = 1
         request_count = 0
+        fetch_details = scraper_input.bdjobs_fetch_description
+        detail_futures: list[tuple[JobPost, Future]] = []
 
         # Set up search parameters
         params = search_params.copy()
         params["txtsearch"] = scraper_input.search_term
 
-        continue_search = lambda: len(job_list) < scraper_input.results_wanted
-
-        while continue_search():
-            request_count += 1
-            log.info(f"search page: {request_count}")
-
-            try:
-                # Add page parameter if needed
-                if page > 1:
-                    params["pg"] = page
-
-                response = self.session.get(
-                    self.search_url,
-                    params=params,
-                    timeout=getattr(scraper_input, "request_timeout", 60),
-                )
-
-                if response.status_code != 200:
-                    log.error(f"BDJobs response status code {response.status_code}")
-                    break
-
-                soup = BeautifulSoup(response.text, "html.parser")
-                job_cards = find_job_listings(soup)
+        continue_search = (
+            lambda: len(job_list) < scraper_input.results_wanted
+            and not deadline_reached()
+        )
 
-                if not job_cards or len(job_cards) == 0:
-                    log.info("No more job listings found")
+        # detail pages are fetched in the background while the next cards and
+        # search pages are parsed, instead of one blocking request per card
+        with ContextExecutor() as executor:
+            while continue_search():
+                request_count += 1
+                log.info(f"search page: {request_count}")
+                set_page(request_count)
+
+                try:
+                    # Add page parameter if needed
+                    if page > 1:
+                        params["pg"] = page
+
+                    response = self.session.get(
+                        self.search_url,
+                        params=params,
+                        timeout=scraper_input.request_timeout,
+                    )
+
+                    if response.status_code != 200:
+                        log.error(f"BDJobs response status code {response.status_code}")
+                        mark_failed(f"status code {response.status_code}")
+                        break
+
+                    soup = BeautifulSoup(response.text, "html.parser")
+                    job_cards, selector = find_job_listings(soup, self.job_selector)
+                    if selector:
+                        self.job_selector = selector
+
+                    if not job_cards or len(job_cards) == 0:
+                        log.info("No more job listings found")
+                        break
+
+                    log.info(f"Found {len(job_cards)} job cards on page {page}")
+
+                    for job_card in job_cards:
+                        try:
+                            job_post = self._process_job(job_card)
+                            if (
+                                job_post
+                                and job_post.id not in seen_ids
+                                and not already_seen(job_post.id)
+                            ):
+                                seen_ids.add(job_post.id)
+                                job_list.append(job_post)
+                                if fetch_details:
+                                    future = executor.submit(
+                                        self._get_job_details, job_post.job_url
+                                    )
+                                    detail_futures.append((job_post, future))
+
+                                if not continue_search():
+                                    break
+                        except Exception as e:
+                            log.error(f"Error processing job card: {str(e)}")
+
+                    if not continue_search():
+                        break
+                    page += 1
+                    # Add delay between requests
+                    throttle(random.uniform(self.delay, self.delay + self.band_delay))
+
+                except Exception as e:
+                    log.error(f"Error during scraping: {str(e)}")
+                    mark_failed(str(e))
                     break
 
-                log.info(f"Found {len(job_cards)} job cards on page {page}")
-
-                for job_card in job_cards:
-                    try:
-                        job_post = self._process_job(job_card)
-                        if job_post and job_post.id not in seen_ids:
-                            seen_ids.add(job_post.id)
-                            job_list.append(job_post)
-
-                            if not continue_search():
-                                break
-                    except Exception as e:
-                        log.error(f"Error processing job card: {str(e)}")
-
-                page += 1
-                # Add delay between requests
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
-
-            except Exception as e:
-                log.error(f"Error during scraping: {str(e)}")
-                break
+            for job_post, future in detail_futures:
+                self._apply_job_details(job_post, future.result())
 
         job_list = job_list[: scraper_input.results_wanted]
         return JobResponse(jobs=job_list)
@@ -140,8 +185,11 @@ class BDJobs(Scraper):
         :return: JobPost object
         """
         try:
+            # Walk the card once and pick every field from the extraction plan
+            fields = extract_card_fields(job_card)
+
             # Extract job ID and URL
-            job_link = job_card.find("a", href=lambda h: h and "jobdetail" in h.lower())
+            job_link = fields.get("link")
             if not job_link:
                 return None
 
@@ -153,53 +201,21 @@ class BDJobs(Scraper):
             job_id = (
                 job_url.split("jobid=")[-1].split("&")[0]
                 if "jobid=" in job_url
-                else f"bdjobs-{hash(job_url)}"
+                else f"bdjobs-{stable_job_id(job_url)}"
             )
 
             # Extract title
             title = job_link.get_text(strip=True)
             if not title:
-                title_elem = job_card.find(
-                    ["h2", "h3", "h4", "strong", "div"],
-                    class_=lambda c: c and "job-title-text" in c,
-                )
+                title_elem = fields.get("title")
                 title = title_elem.get_text(strip=True) if title_elem else "N/A"
 
-            # Extract company name - IMPROVED
-            company_elem = job_card.find(
-                ["span", "div"],
-                class_=lambda c: c and "comp-name-text" in (c or "").lower(),
-            )
-            if company_elem:
-                company_name = company_elem.get_text(strip=True)
-            else:
-                # Try alternative selectors
-                company_elem = job_card.find(
-                    ["span", "div"],
-                    class_=lambda c: c
-                    and any(
-                        term in (c or "").lower()
-                        for term in ["company", "org", "comp-name"]
-                    ),
-                )
-                company_name = (
-                    company_elem.get_text(strip=True) if company_elem else "N/A"
-                )
+            # Extract company name
+            company_elem = fields.get("company")
+            company_name = company_elem.get_text(strip=True) if company_elem else "N/A"
 
             # Extract location
-            location_elem = job_card.find(
-                ["span", "div"],
-                class_=lambda c: c and "locon-text-d" in (c or "").lower(),
-            )
-            if not location_elem:
-                location_elem = job_card.find(
-                    ["span", "div"],
-                    class_=lambda c: c
-                    and any(
-                        term in (c or "").lower()
-                        for term in ["location", "area", "locon"]
-                    ),
-                )
+            location_elem = fields.get("location")
             location_text = (
                 location_elem.get_text(strip=True)
                 if location_elem
@@ -210,14 +226,7 @@ class BDJobs(Scraper):
             location = parse_location(location_text, self.country)
 
             # Extract date posted
-            date_elem = job_card.find(
-                ["span", "div"],
-                class_=lambda c: c
-                and any(
-                    term in (c or "").lower()
-                    for term in ["date", "deadline", "published"]
-                ),
-            )
+            date_elem = fields.get("date")
             date_posted = None
             if date_elem:
                 date_text = date_elem.get_text(strip=True)
@@ -238,16 +247,27 @@ class BDJobs(Scraper):
                 site=self.site,
             )
 
-            # Always fetch description for BDJobs
-            job_details = self._get_job_details(job_url)
-            job_post.description = job_details.get("description", "")
-            job_post.job_type = job_details.get("job_type", "")
-
             return job_post
         except Exception as e:
             log.error(f"Error in _process_job: {str(e)}")
             return None
 
+    @staticmethod
+    def _apply_job_details(job_post: JobPost, job_details: Dict[str, Any]) -> None:
+        """
+        Copies the fields fetched from the job page onto the job post
+        :param job_post: JobPost built from the job card
+        :param job_details: Dictionary returned by _get_job_details
+        """
+        job_post.description = job_details.get("description", "")
+        job_type_text = job_details.get("job_type")
+        if job_type_text:
+            job_type = get_enum_from_job_type(
+                job_type_text.lower().replace("-", "").replace(" ", "")
+            )
+            job_post.job_type = [job_type] if job_type else None
+        job_post.company_industry = job_details.get("company_industry")
+
     def _get_job_details(self, job_url: str) -> Dict[str, Any]:
         """
         Gets detailed job information from the job page
@@ -255,7 +275,9 @@ class BDJobs(Scraper):
         :return: Dictionary with job details
         """
         try:
-            response = self.session.get(job_url, timeout=60)
+            response = self.session.get(
+                job_url, timeout=self.scraper_input.request_timeout
+            )
             if response.status_code != 200:
                 return {}
 
@@ -295,16 +317,12 @@ class BDJobs(Scraper):
                     else ""
                 )
 
+            # Walk the page once for the remaining fields
+            fields = extract_detail_fields(soup)
+
             # If no description found yet, try the original approach
             if not description:
-                description_elem = soup.find(
-                    ["div", "section"],
-                    class_=lambda c: c
-                    and any(
-                        term in (c or "").lower()
-                        for term in ["job-description", "details", "requirements"]
-                    ),
-                )
+                description_elem = fields.get("description")
                 if description_elem:
                     description_elem = remove_attributes(description_elem)
                     description = description_elem.prettify(formatter="html")
@@ -316,29 +334,22 @@ class BDJobs(Scraper):
                         description = markdown_converter(description)
 
             # Extract job type
-            job_type_elem = soup.find(
-                ["span", "div"],
-                string=lambda s: s
-                and any(
-                    term in (s or "").lower()
-                    for term in ["job type", "employment type"]
-                ),
-            )
+            job_type_elem = fields.get("job_type")
             job_type = None
             if job_type_elem:
-                job_type_text = job_type_elem.find_next(["span", "div"]).get_text(
-                    strip=True
+                job_type_value = job_type_elem.find_next(["span", "div"])
+                job_type_text = (
+                    job_type_value.get_text(strip=True) if job_type_value else None
                 )
                 job_type = job_type_text if job_type_text else None
 
             # Extract company industry
-            industry_elem = soup.find(
-                ["span", "div"], string=lambda s: s and "industry" in (s or "").lower()
-            )
+            industry_elem = fields.get("company_industry")
             company_industry = None
             if industry_elem:
-                industry_text = industry_elem.find_next(["span", "div"]).get_text(
-                    strip=True
+                industry_value = industry_elem.find_next(["span", "div"])
+                industry_text = (
+                    industry_value.get_text(strip=True) if industry_value else None
                 )
                 company_industry = industry_text if industry_text else None
 
@@ -29,4 +29,26 @@ date_formats = [
     "%d %B %Y",
     "%B %d, %Y",
     "%d/%m/%Y",
-]
\ No newline at end of file
+]
+
+# Extraction plan for job cards: (field, tag names, class substrings) in
+# priority order. A field takes the first rule it matches, so the specific
+# BDJobs class names come before the generic fallbacks.
+card_field_rules = [
+    ("title", ("h2", "h3", "h4", "strong", "div"), ("job-title-text",)),
+    ("company", ("span", "div"), ("comp-name-text",)),
+    ("company", ("span", "div"), ("company", "org", "comp-name")),
+    ("location", ("span", "div"), ("locon-text-d",)),
+    ("location", ("span", "div"), ("location", "area", "locon")),
+    ("date", ("span", "div"), ("date", "deadline", "published")),
+]
+
+# Extraction plan for job detail pages. Class rules match the class attribute,
+# label rules match the element's own text (the value is in the next element).
+detail_class_rules = [
+    ("description", ("div", "section"), ("job-description", "details", "requirements")),
+]
+detail_label_rules = [
+    ("job_type", ("span", "div"), ("job type", "employment type")),
+    ("company_industry", ("span", "div"), ("industry",)),
+]
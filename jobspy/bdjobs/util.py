@@ -1,9 +1,34 @@
-#util.py
+# util.py
+import re
 from bs4 import BeautifulSoup
+from bs4.element import Tag
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
 from jobspy.model import Location, Country
+from jobspy.util import classify_text
+from .constant import card_field_rules, detail_class_rules, detail_label_rules
+
+
+def _compile_rules(rules):
+    return [
+        (field, frozenset(tags), re.compile("|".join(map(re.escape, terms))))
+        for field, tags, terms in rules
+    ]
+
+
+_card_plan = _compile_rules(card_field_rules)
+_detail_class_plan = _compile_rules(detail_class_rules)
+_detail_label_plan = _compile_rules(detail_label_rules)
+
+
+def _class_text(tag: Tag) -> str:
+    classes = tag.get("class")
+    if not classes:
+        return ""
+    if isinstance(classes, str):
+        return classes.lower()
+    return " ".join(classes).lower()
 
 
 def parse_location(location_text: str, country: str = "bangladesh") -> Location:
@@ -36,47 +61,112 @@ def parse_date(date_text: str) -> Optional[datetime]:
     :return: datetime object or None if parsing fails
     """
     from .constant import date_formats
-    
+
     try:
         # Clean up date text
         if "Deadline:" in date_text:
             date_text = date_text.replace("Deadline:", "").strip()
-        
+
         # Try different date formats
         for fmt in date_formats:
             try:
                 return datetime.strptime(date_text, fmt)
             except ValueError:
                 continue
-        
+
         return None
     except Exception:
         return None
 
 
-def find_job_listings(soup: BeautifulSoup) -> List[Any]:
+def find_job_listings(
+    soup: BeautifulSoup, preferred_selector: str | None = None
+) -> tuple[List[Any], str | None]:
     """
     Finds job listing elements in the HTML
     :param soup: BeautifulSoup object
-    :return: List of job card elements
+    :param preferred_selector: selector that matched on a previous page, tried first
+    :return: List of job card elements and the selector that found them
     """
     from .constant import job_selectors
-    
+
+    selectors = job_selectors
+    if preferred_selector:
+        selectors = [preferred_selector] + [
+            s for s in job_selectors if s != preferred_selector
+        ]
+
     # Try different selectors
-    for selector in job_selectors:
+    for selector in selectors:
         if "." in selector:
             tag_name, class_name = selector.split(".", 1)
             elements = soup.find_all(tag_name, class_=class_name)
             if elements and len(elements) > 0:
-                return elements
-    
+                return elements, selector
+
     # If no selectors match, look for job detail links
-    job_links = soup.find_all("a", href=lambda h: h and "jobdetail" in h.lower())
+    job_links = [
+        link
+        for link in soup.find_all("a", href=True)
+        if "jobdetail" in link["href"].lower()
+    ]
     if job_links:
         # Return parent elements of job links
-        return [link.parent for link in job_links]
-    
-    return []
+        return [link.parent for link in job_links], None
+
+    return [], None
+
+
+def extract_card_fields(job_card: Tag) -> Dict[str, Tag]:
+    """
+    Walks a job card once and picks the element for every field in the card plan
+    :param job_card: Job card element
+    :return: Dictionary of field name to element, plus the job detail "link"
+    """
+    found: Dict[str, tuple[int, Tag]] = {}
+    link = None
+    for tag in job_card.find_all(True):
+        if link is None and tag.name == "a":
+            href = tag.get("href")
+            if href and "jobdetail" in href.lower():
+                link = tag
+        classes = _class_text(tag)
+        if not classes:
+            continue
+        for rank, (field, tags, pattern) in enumerate(_card_plan):
+            if field in found and found[field][0] <= rank:
+                continue
+            if tag.name in tags and pattern.search(classes):
+                found[field] = (rank, tag)
+    fields = {field: tag for field, (_, tag) in found.items()}
+    if link is not None:
+        fields["link"] = link
+    return fields
+
+
+def extract_detail_fields(soup: BeautifulSoup) -> Dict[str, Tag]:
+    """
+    Walks a job detail page once and picks the description container and the
+    label elements for job type and industry
+    :param soup: BeautifulSoup object of the job page
+    :return: Dictionary of field name to element
+    """
+    found: Dict[str, Tag] = {}
+    wanted = len(_detail_class_plan) + len(_detail_label_plan)
+    for tag in soup.find_all(["div", "section", "span"]):
+        classes = _class_text(tag)
+        for field, tags, pattern in _detail_class_plan:
+            if field not in found and tag.name in tags and pattern.search(classes):
+                found[field] = tag
+        text = tag.string
+        if text:
+            text = text.lower()
+            for field, tags, pattern in _detail_label_plan:
+                if field not in found and tag.name in tags and pattern.search(text):
+                    found[field] = tag
+        if len(found) == wanted:
+            break
+    return found
 
 
 def is_job_remote(title: str, description: str = None, location: Location = None) -> bool:
@@ -87,14 +177,7 @@ def is_job_remote(title: str, description: str = None, location: Location = None
     :param location: Job location
     :return: True if job is remote, False otherwise
     """
-    remote_keywords = ["remote", "work from home", "wfh", "home based"]
-    
-    # Combine all text fields
-    full_text = title.lower()
-    if description:
-        full_text += " " + description.lower()
-    if location:
-        full_text += " " + location.display_location().lower()
-    
-    # Check for remote keywords
-    return any(keyword in full_text for keyword in remote_keywords)
\ No newline at end of file
+    tags = classify_text(
+        title, description, location.display_location() if location else None
+    )
+    return "remote" in tags or "home_based" in tags
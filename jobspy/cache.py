@@ -0,0 +1,185 @@
+"""
+jobspy.cache
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the opt-in HTTP cache behind create_session. Responses
+are stored on disk by method, normalized URL with its params, and body, so
+processes sharing the directory share them. A response younger than `ttl`
+is served without touching the network. An older one is revalidated with
+If-None-Match / If-Modified-Since when the site sent an ETag or
+Last-Modified, and a 304 serves it again without transferring the body.
+
+The cache ignores Cache-Control: search pages are marked uncacheable by
+most sites, and the short ttl is what bounds how stale results can be.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from jobspy.transport import HttpRequest, RecordedResponse
+
+
+@dataclass
+class CacheEntry:
+    status_code: int
+    url: str
+    headers: dict
+    content: bytes
+    encoding: str | None
+    stored_at: float
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+    def validators(self) -> dict:
+        """The conditional request headers the site's response allows"""
+        headers = {key.lower(): value for key, value in self.headers.items()}
+        validators = {}
+        if "etag" in headers:
+            validators["If-None-Match"] = headers["etag"]
+        if "last-modified" in headers:
+            validators["If-Modified-Since"] = headers["last-modified"]
+        return validators
+
+    def response(self) -> RecordedResponse:
+        return RecordedResponse(
+            status_code=self.status_code,
+            url=self.url,
+            headers=self.headers,
+            content=self.content,
+            encoding=self.encoding,
+        )
+
+
+class HttpCache:
+    """
+    A directory of cached responses, one JSON file per request.
+
+    Entries are served for `ttl` seconds, then revalidated while they are
+    younger than `max_stale` seconds, after which they are fetched again.
+    Only successful responses to the `methods` given are stored.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        ttl: float = 300,
+        max_stale: float = 86_400,
+        methods: tuple[str, ...] = ("GET",),
+    ):
+        self.directory = os.fspath(directory)
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.methods = {method.upper() for method in methods}
+        os.makedirs(self.directory, exist_ok=True)
+
+    def settings(self) -> tuple:
+        """What makes two caches interchangeable, for pooling sessions"""
+        return self.directory, self.ttl, self.max_stale, tuple(sorted(self.methods))
+
+    def _path(self, request: HttpRequest) -> str:
+        return os.path.join(self.directory, f"{request.key()}.json")
+
+    def cacheable(self, request: HttpRequest) -> bool:
+        return request.method.upper() in self.methods
+
+    def load(self, request: HttpRequest) -> CacheEntry | None:
+        """The entry stored for the request, or None when it is too old"""
+        try:
+            with open(self._path(request), encoding="utf-8") as file:
+                record = json.load(file)
+        except (FileNotFoundError, ValueError):
+            return None
+        entry = CacheEntry(
+            status_code=record["status_code"],
+            url=record["url"],
+            headers=record["headers"],
+            content=base64.b64decode(record["body_b64"]),
+            encoding=record.get("encoding"),
+            stored_at=record["stored_at"],
+        )
+        return entry if entry.age < self.max_stale else None
+
+    def _write(self, request: HttpRequest, entry: CacheEntry) -> None:
+        record = {
+            "status_code": entry.status_code,
+            "url": entry.url,
+            "headers": entry.headers,
+            "encoding": entry.encoding,
+            "stored_at": entry.stored_at,
+            "body_b64": base64.b64encode(entry.content).decode("ascii"),
+        }
+        path = self._path(request)
+        # several processes may share the directory, so each writes its own file
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(record, file)
+        os.replace(temporary, path)
+
+    def save(self, request: HttpRequest, response) -> None:
+        if response is None or response.status_code != 200:
+            return
+        self._write(
+            request,
+            CacheEntry(
+                status_code=response.status_code,
+                url=str(response.url),
+                headers={key: str(value) for key, value in response.headers.items()},
+                content=response.content or b"",
+                encoding=getattr(response, "encoding", None),
+                stored_at=time.time(),
+            ),
+        )
+
+    def revalidated(
+        self, request: HttpRequest, entry: CacheEntry, response
+    ) -> RecordedResponse:
+        """Serves the entry again after a 304, fresh for another ttl"""
+        for key in ("ETag", "Last-Modified"):
+            value = response.headers.get(key)
+            if value:
+                entry.headers = {
+                    name: header
+                    for name, header in entry.headers.items()
+                    if name.lower() != key.lower()
+                }
+                entry.headers[key] = str(value)
+        entry.stored_at = time.time()
+        self._write(request, entry)
+        return entry.response()
+
+    def clear(self) -> None:
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    pass
+
+
+_http_cache: ContextVar[HttpCache | None] = ContextVar(
+    "jobspy_http_cache", default=None
+)
+
+
+@contextmanager
+def http_cache_scope(cache: HttpCache | None):
+    """Makes cache the one the sessions created in the block use by default"""
+    token = _http_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _http_cache.reset(token)
+
+
+def current_cache() -> HttpCache | None:
+    return _http_cache.get()
@@ -0,0 +1,149 @@
+"""
+jobspy.checkpoint
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the checkpoints that let a long scrape resume where it
+stopped. Scrapers that page through results save their cursor state after
+every page, appending the jobs of that page to the checkpoint; when the same
+search is run again with the same checkpoint directory, they start from the
+saved page instead of refetching everything before it. A checkpoint is
+removed once its scrape completes, and kept when the scraper stopped on an
+error (see mark_failed) or at the deadline.
+
+Checkpoints are pickled, so only point scrape_jobs at a directory you trust.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from jobspy.model import JobPost
+
+
+class Checkpoint:
+    """The saved state of one site's scrape for one search"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        # how many jobs the file holds, None until it was loaded or written
+        self._saved: int | None = None
+
+    def load(self) -> tuple[dict | None, list[JobPost]]:
+        """The saved cursor state and jobs, or (None, []) without a checkpoint"""
+        records = []
+        complete = True
+        try:
+            with open(self.path, "rb") as file:
+                while True:
+                    position = file.tell()
+                    try:
+                        records.append(pickle.load(file))
+                    except (EOFError, pickle.UnpicklingError):
+                        # a page cut short by a crash is dropped, and the file
+                        # rewritten on the next save
+                        complete = position == os.fstat(file.fileno()).st_size
+                        break
+        except FileNotFoundError:
+            return None, []
+        jobs = [job for record in records for job in record["jobs"]]
+        with self._lock:
+            self._saved = len(jobs) if complete else None
+        if not records:
+            return None, []
+        return records[-1]["cursor"], jobs
+
+    def save(self, cursor: dict, jobs: list[JobPost]) -> None:
+        """
+        Saves the cursor state with the jobs added to the list since the last
+        save, so each page writes only its own jobs
+        """
+        with self._lock:
+            if self._saved is None or len(jobs) < self._saved:
+                mode, new_jobs = "wb", list(jobs)
+            else:
+                mode, new_jobs = "ab", list(jobs[self._saved :])
+            with open(self.path, mode) as file:
+                pickle.dump({"cursor": cursor, "jobs": new_jobs}, file)
+            self._saved = len(jobs)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._saved = None
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+
+class CheckpointStore:
+    """A directory of checkpoints, one file per site and search"""
+
+    def __init__(self, directory: str | os.PathLike):
+        self.directory = os.fspath(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def get(self, site: str, search: str) -> Checkpoint:
+        """The checkpoint of site for the search, given as any stable string"""
+        digest = hashlib.sha1(search.encode()).hexdigest()[:16]
+        return Checkpoint(os.path.join(self.directory, f"{site}-{digest}.pkl"))
+
+
+_checkpoint: ContextVar[Checkpoint | None] = ContextVar(
+    "jobspy_checkpoint", default=None
+)
+
+
+@contextmanager
+def checkpoint_scope(checkpoint: Checkpoint | None):
+    """Makes checkpoint the one the scraper of the block saves to"""
+    token = _checkpoint.set(checkpoint)
+    try:
+        yield checkpoint
+    finally:
+        _checkpoint.reset(token)
+
+
+def resume_state() -> tuple[dict | None, list[JobPost]]:
+    """The cursor state and jobs to resume from, (None, []) to start over"""
+    checkpoint = _checkpoint.get()
+    if checkpoint is None:
+        return None, []
+    return checkpoint.load()
+
+
+def save_state(cursor: dict, jobs: list[JobPost]) -> None:
+    """Saves the scraper's cursor state after a page, if checkpointing"""
+    checkpoint = _checkpoint.get()
+    if checkpoint is not None:
+        checkpoint.save(cursor, jobs)
+
+
+_errors: ContextVar[list[str] | None] = ContextVar("jobspy_errors", default=None)
+
+
+@contextmanager
+def failure_scope():
+    """Collects the errors the scraper of the block reports with mark_failed"""
+    errors: list[str] = []
+    token = _errors.set(errors)
+    try:
+        yield errors
+    finally:
+        _errors.reset(token)
+
+
+def mark_failed(error: str) -> None:
+    """
+    Records that the scraper stopped paging on an error rather than at the
+    end of the results, so its checkpoint is kept and its site reported as
+    failed
+    """
+    errors = _errors.get()
+    if errors is not None:
+        errors.append(error)
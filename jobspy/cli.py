@@ -0,0 +1,260 @@
+"""
+jobspy.cli
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the `jobspy` command. It takes the scrape_jobs
+arguments as options, scrapes every site as its own search and writes each
+site's jobs as soon as that site finishes, as NDJSON, CSV or Parquet row
+groups, to stdout or a file. Memory is bounded per site, not per page:
+every site still scraping holds its jobs until it finishes, so it grows
+with results_wanted, and a written site's jobs are let go. A site that
+fails or times out is reported on stderr and the others are still written.
+pandas and pyarrow are imported only once there is something to write.
+
+    jobspy --site indeed --site linkedin --search-term nurse \\
+        --location "Austin, TX" --results-wanted 200 -o jobs.parquet
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from typing import IO, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+FORMATS = ("ndjson", "csv", "parquet")
+
+
+class RowWriter:
+    """Writes DataFrames of jobs one after another to a single output"""
+
+    binary = False
+
+    def __init__(self, file: IO):
+        self.file = file
+
+    def write(self, jobs_df: pd.DataFrame) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        self.file.flush()
+
+
+class NDJSONWriter(RowWriter):
+    def write(self, jobs_df: pd.DataFrame) -> None:
+        lines = jobs_df.to_json(orient="records", lines=True, date_format="iso")
+        self.file.write(lines if lines.endswith("\n") else lines + "\n")
+        self.file.flush()
+
+
+class CSVWriter(RowWriter):
+    def __init__(self, file: IO):
+        super().__init__(file)
+        self.header = True
+
+    def write(self, jobs_df: pd.DataFrame) -> None:
+        from jobspy.util import desired_order
+
+        jobs_df.reindex(columns=desired_order).to_csv(
+            self.file, header=self.header, index=False
+        )
+        self.header = False
+        self.file.flush()
+
+
+class ParquetWriter(RowWriter):
+    """Writes each DataFrame as one row group of a single Parquet file"""
+
+    binary = True
+
+    def __init__(self, file: IO):
+        super().__init__(file)
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit(
+                "Parquet output needs pyarrow: pip install 'python-jobspy[parquet]'"
+            )
+        from jobspy.util import desired_order
+
+        types = {
+            "date_posted": pa.date32(),
+            "is_remote": pa.bool_(),
+            "min_amount": pa.float64(),
+            "max_amount": pa.float64(),
+            "company_rating": pa.float64(),
+            "company_reviews_count": pa.float64(),
+            "vacancy_count": pa.float64(),
+        }
+        # one fixed schema, as a column can be empty in one site and not another
+        self.schema = pa.schema(
+            [(column, types.get(column, pa.string())) for column in desired_order]
+        )
+        self.writer = pq.ParquetWriter(pa.PythonFile(file, mode="w"), self.schema)
+
+    def write(self, jobs_df: pd.DataFrame) -> None:
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(
+            jobs_df.reindex(columns=self.schema.names),
+            schema=self.schema,
+            preserve_index=False,
+        )
+        self.writer.write_table(table)
+
+    def close(self) -> None:
+        self.writer.close()
+        super().close()
+
+
+WRITERS = {"ndjson": NDJSONWriter, "csv": CSVWriter, "parquet": ParquetWriter}
+
+
+def output_format(output: str | None, format: str | None) -> str:
+    """The format asked for, or the one the output file's extension names"""
+    if format:
+        return format
+    extension = os.path.splitext(output or "")[1].lower().lstrip(".")
+    extension = {"jsonl": "ndjson", "json": "ndjson", "pq": "parquet"}.get(
+        extension, extension
+    )
+    return extension if extension in FORMATS else "ndjson"
+
+
+def site_timeout(value: str) -> tuple[str, float]:
+    site, separator, seconds = value.partition("=")
+    if not separator:
+        raise argparse.ArgumentTypeError(f"expected SITE=SECONDS, got '{value}'")
+    return site, float(seconds)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    # options left out take scrape_jobs' defaults
+    parser = argparse.ArgumentParser(
+        prog="jobspy",
+        description="Scrape job postings and stream them as NDJSON, CSV or Parquet",
+        argument_default=argparse.SUPPRESS,
+    )
+    add = parser.add_argument
+    add(
+        "-s",
+        "--site",
+        dest="site_name",
+        action="append",
+        metavar="SITE",
+        help="site to scrape, repeatable; every site by default",
+    )
+    add("-q", "--search-term")
+    add("--google-search-term")
+    add("-l", "--location")
+    add("--distance", type=int)
+    add("--is-remote", action="store_true")
+    add("--job-type", help="fulltime, parttime, internship or contract")
+    add("--easy-apply", action="store_true")
+    add("-n", "--results-wanted", type=int)
+    add("--country-indeed")
+    add(
+        "--proxy",
+        dest="proxies",
+        action="append",
+        metavar="PROXY",
+        help="user:pass@host:port, repeatable",
+    )
+    add(
+        "--proxy-rotation",
+        type=lambda value: int(value) if value.isdigit() else value,
+        help="request, session or a number of requests",
+    )
+    add("--ca-cert")
+    add("--description-format", choices=["markdown", "html", "plain"])
+    add("--linkedin-fetch-description", action="store_true")
+    add(
+        "--linkedin-company-id",
+        dest="linkedin_company_ids",
+        type=int,
+        action="append",
+        metavar="ID",
+    )
+    add("--bdjobs-fetch-description", action=argparse.BooleanOptionalAction)
+    add("--bayt-fetch-description", action=argparse.BooleanOptionalAction)
+    add("--ziprecruiter-fetch-description", action=argparse.BooleanOptionalAction)
+    add("--offset", type=int)
+    add("--hours-old", type=int)
+    add("--enforce-annual-salary", action="store_true")
+    add("-v", "--verbose", type=int, choices=[0, 1, 2])
+    add("--user-agent")
+    add("--timeout", type=float)
+    add(
+        "--site-timeout",
+        dest="site_timeouts",
+        type=site_timeout,
+        action="append",
+        metavar="SITE=SECONDS",
+    )
+    add("--incremental", metavar="PATH")
+    add("--seen-jobs", metavar="PATH")
+    add("--checkpoint", metavar="DIRECTORY")
+    add("--http-cache", metavar="DIRECTORY")
+    add("-o", "--output", metavar="PATH", help="file to write; stdout by default")
+    add(
+        "-f",
+        "--format",
+        choices=FORMATS,
+        help="output format; taken from the output's extension by default",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    kwargs = vars(build_parser().parse_args(argv))
+    output = kwargs.pop("output", None)
+    format = output_format(output, kwargs.pop("format", None))
+    if "site_timeouts" in kwargs:
+        kwargs["site_timeouts"] = dict(kwargs["site_timeouts"])
+    sites = kwargs.pop("site_name", None)
+    if sites is None:
+        from jobspy.model import Site
+
+        sites = [site.value for site in Site]
+
+    from jobspy import scrape_jobs_many
+
+    writer_class = WRITERS[format]
+    if output is None:
+        file = sys.stdout.buffer if writer_class.binary else sys.stdout
+    elif writer_class.binary:
+        file = open(output, "wb")
+    else:
+        file = open(output, "w", encoding="utf-8", newline="")
+    writer = None
+    failed = False
+    try:
+        writer = writer_class(file)
+        # one query per site, so each site is written as soon as it finishes
+        results = scrape_jobs_many(
+            [{"site_name": site} for site in sites],
+            max_concurrency=len(sites),
+            stream=True,
+            **kwargs,
+        )
+        for query, jobs_df in results:
+            for site, status in jobs_df.attrs.get("site_status", {}).items():
+                if status != "complete":
+                    failed = failed or status in ("error", "timeout")
+                    print(f"jobspy: {site} {status}", file=sys.stderr)
+            if not jobs_df.empty:
+                writer.write(jobs_df)
+    finally:
+        if writer is not None:
+            writer.close()
+        if output is not None:
+            file.close()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+jobspy.concurrency
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the helpers scrapers use to run requests concurrently
+without overloading a single job board, or the process running them.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+from jobspy.deadline import remaining
+from jobspy.exception import DeadlineExceeded
+from jobspy.instrument import run_detached
+
+
+class ConcurrencyGovernor:
+    """
+    Caps the number of in-flight requests, per host and across the process.
+    One instance is shared by every session created through create_session,
+    so concurrent searches against the same job board queue up behind the
+    same limit, and many searches at once cannot open more than
+    `max_in_flight` sockets between them.
+
+    A host slot is taken before a global one, so requests waiting on a busy
+    host don't hold global slots other hosts could use. Waiting for a slot
+    ends at the scrape's deadline, if any.
+    """
+
+    def __init__(self, max_in_flight: int = 32, max_per_host: int = 4):
+        self._lock = threading.Lock()
+        self.configure(max_in_flight, max_per_host)
+
+    def configure(
+        self, max_in_flight: int | None = None, max_per_host: int | None = None
+    ) -> None:
+        """Changes the caps; call it before scraping, not while requests are in flight"""
+        with self._lock:
+            if max_in_flight is not None:
+                self.max_in_flight = max_in_flight
+                self._global = threading.BoundedSemaphore(max_in_flight)
+            if max_per_host is not None:
+                self.max_per_host = max_per_host
+                self._hosts: dict[str, threading.BoundedSemaphore] = {}
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._hosts.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.max_per_host)
+                self._hosts[host] = semaphore
+            return semaphore
+
+    @staticmethod
+    def _acquire(semaphore: threading.BoundedSemaphore) -> None:
+        if not semaphore.acquire(timeout=remaining()):
+            raise DeadlineExceeded()
+
+    @contextmanager
+    def limit(self, url: str):
+        """Holds one of the host's slots and one global slot for the block"""
+        host = self._semaphore(urlparse(url).netloc.lower())
+        with self._lock:
+            global_ = self._global
+        self._acquire(host)
+        try:
+            self._acquire(global_)
+            try:
+                yield
+            finally:
+                global_.release()
+        finally:
+            host.release()
+
+
+governor = ConcurrencyGovernor()
+
+
+class ContextExecutor(ThreadPoolExecutor):
+    """
+    ThreadPoolExecutor whose tasks run in a copy of the submitting thread's
+    context, so per-call state such as timing instrumentation follows the
+    work into the pool.
+
+    Without max_workers the pool has as many threads as the governor has
+    slots per host: scrapers fan out to a single job board, so any more
+    threads would only wait on the governor.
+    """
+
+    def __init__(self, max_workers: int | None = None, **kwargs):
+        super().__init__(max_workers=max_workers or governor.max_per_host, **kwargs)
+
+    def submit(self, fn, /, *args, **kwargs):
+        context = contextvars.copy_context()
+        return super().submit(context.run, run_detached, fn, *args, **kwargs)
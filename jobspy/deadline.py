@@ -0,0 +1,66 @@
+"""
+jobspy.deadline
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the deadline scrape_jobs sets for each site. The
+deadline lives in a context variable, so it follows the scraper into its
+worker threads. Sessions clamp request timeouts to it and refuse requests
+once it has passed, throttling sleeps stop at it, and the scrapers' paging
+loops stop when it is reached and return the jobs gathered so far.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from jobspy.exception import DeadlineExceeded
+
+_deadline: ContextVar[float | None] = ContextVar("jobspy_deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(seconds: float | None):
+    """
+    Gives the block `seconds` to finish, or the time left on the enclosing
+    deadline if that is shorter. None leaves the enclosing deadline as is.
+    """
+    if seconds is None:
+        yield _deadline.get()
+        return
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        deadline = min(deadline, current)
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> float | None:
+    """Seconds left before the deadline, None without one"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
+
+
+def deadline_reached() -> bool:
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def clamp_timeout(timeout: float | None) -> float | None:
+    """
+    The request timeout cut down to the time left, raising DeadlineExceeded
+    when there is none
+    """
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise DeadlineExceeded()
+    return left if timeout is None else min(timeout, left)
@@ -47,4 +47,9 @@ class BDJobsException(Exception):
 
 class WellfoundException(Exception):
     def __init__(self, message=None):
-        super().__init__(message or "An error occurred with Wellfound")
\ No newline at end of file
+        super().__init__(message or "An error occurred with Wellfound")
+
+
+class DeadlineExceeded(Exception):
+    def __init__(self, message=None):
+        super().__init__(message or "The scrape ran out of time")
@@ -5,7 +5,7 @@ import json
 import requests
 from typing import Tuple
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import as_completed
 
 from jobspy.glassdoor.constant import fallback_token, query_template, headers
 from jobspy.glassdoor.util import (
@@ -13,8 +13,13 @@ from jobspy.glassdoor.util import (
     parse_compensation,
     parse_location,
 )
+from jobspy.concurrency import ContextExecutor
+from jobspy.deadline import deadline_reached
+from jobspy.incremental import is_known, page_is_known
+from jobspy.checkpoint import mark_failed, resume_state, save_state
+from jobspy.instrument import set_page
+from jobspy.seen import already_seen
 from jobspy.util import (
-    extract_emails_from_text,
     create_logger,
     create_session,
     markdown_converter,
@@ -34,13 +39,23 @@ log = create_logger("Glassdoor")
 
 class Glassdoor(Scraper):
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        proxy_rotation: str | int = "request",
     ):
         """
         Initializes GlassdoorScraper with the Glassdoor job search url
         """
         site = Site(Site.GLASSDOOR)
-        super().__init__(site, proxies=proxies, ca_cert=ca_cert, user_agent=user_agent)
+        super().__init__(
+            site,
+            proxies=proxies,
+            ca_cert=ca_cert,
+            user_agent=user_agent,
+            proxy_rotation=proxy_rotation,
+        )
 
         self.base_url = None
         self.country = None
@@ -61,13 +76,20 @@ class Glassdoor(Scraper):
         self.base_url = self.scraper_input.country.get_glassdoor_url()
 
         self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, has_retry=True
+            proxies=self.proxies,
+            ca_cert=self.ca_cert,
+            has_retry=True,
+            rotation=self.proxy_rotation,
+            key=f"{self.site.value}:{self.base_url}",
         )
-        token = self._get_csrf_token()
-        headers["gd-csrf-token"] = token if token else fallback_token
+        # a session shared between searches of this Glassdoor domain already
+        # carries its token
+        if "gd-csrf-token" not in self.session.headers:
+            token = self._get_csrf_token()
+            self.session.headers.update(headers)
+            self.session.headers["gd-csrf-token"] = token if token else fallback_token
         if self.user_agent:
-            headers["user-agent"] = self.user_agent
-        self.session.headers.update(headers)
+            self.session.headers["user-agent"] = self.user_agent
 
         location_id, location_type = self._get_location(
             scraper_input.location, scraper_input.is_remote
@@ -75,24 +97,35 @@ class Glassdoor(Scraper):
         if location_type is None:
             log.error("Glassdoor: location not parsed")
             return JobResponse(jobs=[])
-        job_list: list[JobPost] = []
         cursor = None
 
         range_start = 1 + (scraper_input.offset // self.jobs_per_page)
         tot_pages = (scraper_input.results_wanted // self.jobs_per_page) + 2
         range_end = min(tot_pages, self.max_pages + 1)
+        state, job_list = resume_state()
+        if state:
+            range_start, cursor = state["page"], state["cursor"]
+            self.seen_urls.update(job.job_url for job in job_list)
         for page in range(range_start, range_end):
+            if deadline_reached():
+                break
             log.info(f"search page: {page} / {range_end - 1}")
+            set_page(page)
             try:
                 jobs, cursor = self._fetch_jobs_page(
                     scraper_input, location_id, location_type, page, cursor
                 )
                 job_list.extend(jobs)
+                if page_is_known(jobs):
+                    log.info(f"only known jobs on page: {page}")
+                    break
                 if not jobs or len(job_list) >= scraper_input.results_wanted:
                     job_list = job_list[: scraper_input.results_wanted]
                     break
+                save_state({"page": page + 1, "cursor": cursor}, job_list)
             except Exception as e:
                 log.error(f"Glassdoor: {str(e)}")
+                mark_failed(str(e))
                 break
         return JobResponse(jobs=job_list)
 
@@ -129,11 +162,12 @@ class Glassdoor(Scraper):
             Exception,
         ) as e:
             log.error(f"Glassdoor: {str(e)}")
+            mark_failed(str(e))
             return jobs, None
 
         jobs_data = res_json["data"]["jobListings"]["jobListings"]
 
-        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
+        with ContextExecutor() as executor:
             future_to_job_data = {
                 executor.submit(self._process_job, job): job for job in jobs_data
             }
@@ -167,7 +201,7 @@ class Glassdoor(Scraper):
         """
         job_id = job_data["jobview"]["job"]["listingId"]
         job_url = f"{self.base_url}job-listing/j?jl={job_id}"
-        if job_url in self.seen_urls:
+        if job_url in self.seen_urls or already_seen(f"gd-{job_id}"):
             return None
         self.seen_urls.add(job_url)
         job = job_data["jobview"]
@@ -187,10 +221,12 @@ class Glassdoor(Scraper):
             location = parse_location(location_name)
 
         compensation = parse_compensation(job["header"])
-        try:
-            description = self._fetch_job_description(job_id)
-        except:
-            description = None
+        description = None
+        if not is_known(f"gd-{job_id}", date_posted):
+            try:
+                description = self._fetch_job_description(job_id)
+            except:
+                pass
         company_url = f"{self.base_url}Overview/W-EI_IE{company_id}.htm"
         company_logo = (
             job_data["jobview"].get("overview", {}).get("squareLogoUrl", None)
@@ -212,7 +248,6 @@ class Glassdoor(Scraper):
             compensation=compensation,
             is_remote=is_remote,
             description=description,
-            emails=extract_emails_from_text(description) if description else None,
             company_logo=company_logo,
             listing_type=listing_type,
         )
@@ -246,7 +281,7 @@ class Glassdoor(Scraper):
                 """,
             }
         ]
-        res = requests.post(url, json=body, headers=headers)
+        res = self.session.post(url, json=body)
         if res.status_code != 200:
             return None
         data = res.json()[0]
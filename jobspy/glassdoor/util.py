@@ -24,9 +24,8 @@ def parse_compensation(data: dict) -> Compensation | None:
 
 
 def get_job_type_enum(job_type_str: str) -> list[JobType] | None:
-    for job_type in JobType:
-        if job_type_str in job_type.value:
-            return [job_type]
+    job_type = JobType.from_label(job_type_str)
+    return [job_type] if job_type else None
 
 
 def parse_location(location_name: str) -> Location | None:
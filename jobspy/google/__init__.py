@@ -16,19 +16,29 @@ from jobspy.model import (
     Location,
     JobType,
 )
-from jobspy.util import extract_emails_from_text, extract_job_type, create_session
+from jobspy.checkpoint import mark_failed
+from jobspy.deadline import deadline_reached
+from jobspy.instrument import set_page
+from jobspy.seen import already_seen
+from jobspy.util import classify_text, create_session, job_types_from_tags
 from jobspy.google.util import log, find_job_info_initial_page, find_job_info
 
 
 class Google(Scraper):
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        proxy_rotation: str | int = "request",
     ):
         """
         Initializes Google Scraper with the Goodle jobs search url
         """
         site = Site(Site.GOOGLE)
-        super().__init__(site, proxies=proxies, ca_cert=ca_cert)
+        super().__init__(
+            site, proxies=proxies, ca_cert=ca_cert, proxy_rotation=proxy_rotation
+        )
 
         self.country = None
         self.session = None
@@ -48,7 +58,12 @@ class Google(Scraper):
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
 
         self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
+            proxies=self.proxies,
+            ca_cert=self.ca_cert,
+            is_tls=False,
+            has_retry=True,
+            rotation=self.proxy_rotation,
+            key=self.site.value,
         )
         forward_cursor, job_list = self._get_initial_cursor_and_jobs()
         if forward_cursor is None:
@@ -62,14 +77,17 @@ class Google(Scraper):
         while (
             len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset
             and forward_cursor
+            and not deadline_reached()
         ):
             log.info(
                 f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
             )
+            set_page(page)
             try:
                 jobs, forward_cursor = self._get_jobs_next_page(forward_cursor)
             except Exception as e:
                 log.error(f"failed to get jobs on page: {page}, {e}")
+                mark_failed(str(e))
                 break
             if not jobs:
                 log.info(f"found no jobs on page: {page}")
@@ -166,7 +184,8 @@ class Google(Scraper):
 
     def _parse_job(self, job_info: list):
         job_url = job_info[3][0][0] if job_info[3] and job_info[3][0] else None
-        if job_url in self.seen_urls:
+        # jobs skipped as already seen don't count towards results_wanted
+        if job_url in self.seen_urls or already_seen(f"go-{job_info[28]}"):
             return
         self.seen_urls.add(job_url)
 
@@ -184,6 +203,7 @@ class Google(Scraper):
             date_posted = (datetime.now() - timedelta(days=days_ago)).date()
 
         description = job_info[19]
+        tags = classify_text(description)
 
         job_post = JobPost(
             id=f"go-{job_info[28]}",
@@ -194,9 +214,8 @@ class Google(Scraper):
             ),
             job_url=job_url,
             date_posted=date_posted,
-            is_remote="remote" in description.lower() or "wfh" in description.lower(),
+            is_remote="remote" in tags,
             description=description,
-            emails=extract_emails_from_text(description),
-            job_type=extract_job_type(description),
+            job_type=job_types_from_tags(tags),
         )
         return job_post
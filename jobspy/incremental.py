@@ -0,0 +1,199 @@
+"""
+jobspy.incremental
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the high-water marks behind scrape_jobs' incremental
+mode. For every (site, search term, location) the store keeps the newest
+date_posted seen and the ids of the jobs posted in the few days before it.
+A job is known when its id is stored or it was posted before that window.
+Scrapers stop paging at the first page made only of known jobs, and
+scrape_jobs returns only the jobs that are not known yet.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, timedelta
+
+from jobspy.model import JobPost
+
+
+class Watermark:
+    """The high-water mark of one (site, search term, location)"""
+
+    def __init__(
+        self,
+        newest: date | None = None,
+        ids: dict[str, str | None] | None = None,
+        lookback_days: int = 2,
+        max_ids: int = 20_000,
+    ):
+        self.newest = newest
+        self.ids = ids or {}
+        self.lookback_days = lookback_days
+        self.max_ids = max_ids
+        self._lock = threading.Lock()
+
+    @property
+    def cutoff(self) -> date | None:
+        """Jobs posted before this day are known even without their id"""
+        if self.newest is None:
+            return None
+        return self.newest - timedelta(days=self.lookback_days)
+
+    def is_known(self, job_id: str | None, date_posted: date | None = None) -> bool:
+        if job_id is not None and job_id in self.ids:
+            return True
+        cutoff = self.cutoff
+        return date_posted is not None and cutoff is not None and date_posted < cutoff
+
+    def add(self, jobs: list[JobPost]) -> None:
+        """Records jobs as seen and moves the mark forward"""
+        with self._lock:
+            for job in jobs:
+                if job.id is None:
+                    continue
+                self.ids[job.id] = job.date_posted and job.date_posted.isoformat()
+                if job.date_posted and (
+                    self.newest is None or job.date_posted > self.newest
+                ):
+                    self.newest = job.date_posted
+            self._prune()
+
+    def merge(self, other: Watermark) -> None:
+        """Takes in the ids and newest date of a mark saved by another writer"""
+        with self._lock:
+            for job_id, posted in other.ids.items():
+                self.ids.setdefault(job_id, posted)
+            if other.newest and (self.newest is None or other.newest > self.newest):
+                self.newest = other.newest
+            self._prune()
+
+    def _prune(self) -> None:
+        cutoff = self.cutoff
+        if cutoff is not None:
+            cutoff = cutoff.isoformat()
+            self.ids = {
+                job_id: posted
+                for job_id, posted in self.ids.items()
+                if posted is None or posted >= cutoff
+            }
+        if len(self.ids) > self.max_ids:
+            # ids are kept in the order they were first seen
+            self.ids = dict(list(self.ids.items())[-self.max_ids :])
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "newest": self.newest and self.newest.isoformat(),
+                "ids": dict(self.ids),
+            }
+
+    @classmethod
+    def from_dict(cls, data: dict, **kwargs) -> Watermark:
+        newest = data.get("newest")
+        return cls(
+            newest=date.fromisoformat(newest) if newest else None,
+            ids=data.get("ids") or {},
+            **kwargs,
+        )
+
+
+class HighWaterMarks:
+    """
+    High-water marks by (site, search term, location), persisted as JSON at
+    path when one is given
+    """
+
+    def __init__(self, path: str | os.PathLike | None = None, lookback_days: int = 2):
+        self.path = path
+        self.lookback_days = lookback_days
+        self._lock = threading.Lock()
+        self._marks: dict[str, Watermark] = self._load()
+
+    def _load(self) -> dict[str, Watermark]:
+        if self.path is None:
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return {}
+        return {
+            key: Watermark.from_dict(mark, lookback_days=self.lookback_days)
+            for key, mark in data.items()
+        }
+
+    @staticmethod
+    def key(site: str, search_term: str | None, location: str | None) -> str:
+        return "|".join(
+            (
+                site,
+                (search_term or "").strip().lower(),
+                (location or "").strip().lower(),
+            )
+        )
+
+    def get(
+        self, site: str, search_term: str | None, location: str | None
+    ) -> Watermark:
+        key = self.key(site, search_term, location)
+        with self._lock:
+            mark = self._marks.get(key)
+            if mark is None:
+                mark = self._marks[key] = Watermark(lookback_days=self.lookback_days)
+            return mark
+
+    def save(self) -> None:
+        """
+        Writes the marks to path, replacing the file in one step. The marks
+        saved there since they were loaded are merged in first, so processes
+        sharing the file keep each other's jobs, except when two of them save
+        at the same moment.
+        """
+        if self.path is None:
+            return
+        with self._lock:
+            for key, saved in self._load().items():
+                mark = self._marks.get(key)
+                if mark is None:
+                    self._marks[key] = saved
+                else:
+                    mark.merge(saved)
+            data = {key: mark.to_dict() for key, mark in self._marks.items()}
+            path = os.fspath(self.path)
+            # several processes may share the file, so each writes its own
+            temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temporary, "w", encoding="utf-8") as file:
+                json.dump(data, file)
+            os.replace(temporary, path)
+
+
+_watermark: ContextVar[Watermark | None] = ContextVar("jobspy_watermark", default=None)
+
+
+@contextmanager
+def watermark_scope(mark: Watermark | None):
+    """Makes mark the one the scrapers of the block compare their jobs with"""
+    token = _watermark.set(mark)
+    try:
+        yield mark
+    finally:
+        _watermark.reset(token)
+
+
+def is_known(job_id: str | None, date_posted: date | None = None) -> bool:
+    """Whether an incremental scrape has already returned the job"""
+    mark = _watermark.get()
+    return mark is not None and mark.is_known(job_id, date_posted)
+
+
+def page_is_known(jobs: list[JobPost]) -> bool:
+    """Whether a search page holds only known jobs, so paging can stop"""
+    if _watermark.get() is None or not jobs:
+        return False
+    return all(is_known(job.id, job.date_posted) for job in jobs)
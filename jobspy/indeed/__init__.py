@@ -16,8 +16,13 @@ from jobspy.model import (
     JobType,
     DescriptionFormat,
 )
+from jobspy.deadline import deadline_reached
+from jobspy.exception import DeadlineExceeded
+from jobspy.incremental import page_is_known
+from jobspy.checkpoint import mark_failed, resume_state, save_state
+from jobspy.instrument import set_page
+from jobspy.seen import already_seen
 from jobspy.util import (
-    extract_emails_from_text,
     markdown_converter,
     create_session,
     create_logger,
@@ -28,15 +33,23 @@ log = create_logger("Indeed")
 
 class Indeed(Scraper):
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        proxy_rotation: str | int = "request",
     ):
         """
         Initializes IndeedScraper with the Indeed API url
         """
-        super().__init__(Site.INDEED, proxies=proxies)
+        super().__init__(Site.INDEED, proxies=proxies, proxy_rotation=proxy_rotation)
 
         self.session = create_session(
-            proxies=self.proxies, ca_cert=ca_cert, is_tls=False
+            proxies=self.proxies,
+            ca_cert=ca_cert,
+            is_tls=False,
+            rotation=self.proxy_rotation,
+            key=self.site.value,
         )
         self.scraper_input = None
         self.jobs_per_page = 100
@@ -58,21 +71,36 @@ class Indeed(Scraper):
         self.base_url = f"https://{domain}.indeed.com"
         self.headers = api_headers.copy()
         self.headers["indeed-co"] = self.scraper_input.country.indeed_domain_value
-        job_list = []
         page = 1
 
         cursor = None
+        state, job_list = resume_state()
+        if state:
+            cursor, page = state["cursor"], state["page"]
+            self.seen_urls.update(job.job_url for job in job_list)
 
-        while len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset:
+        while (
+            len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset
+            and not deadline_reached()
+        ):
             log.info(
                 f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
             )
-            jobs, cursor = self._scrape_page(cursor)
+            set_page(page)
+            try:
+                jobs, cursor = self._scrape_page(cursor)
+            except DeadlineExceeded:
+                log.info(f"deadline reached on page: {page}")
+                break
             if not jobs:
                 log.info(f"found no jobs on page: {page}")
                 break
             job_list += jobs
+            if page_is_known(jobs):
+                log.info(f"only known jobs on page: {page}")
+                break
             page += 1
+            save_state({"cursor": cursor, "page": page}, job_list)
         return JobResponse(
             jobs=job_list[
                 scraper_input.offset : scraper_input.offset
@@ -121,6 +149,7 @@ class Indeed(Scraper):
             log.info(
                 f"responded with status code: {response.status_code} (submit GitHub issue if this appears to be a bug)"
             )
+            mark_failed(f"status code {response.status_code}")
             return jobs, new_cursor
         data = response.json()
         jobs = data["data"]["jobSearch"]["results"]
@@ -199,7 +228,8 @@ class Indeed(Scraper):
         :return: JobPost if it's a new job
         """
         job_url = f'{self.base_url}/viewjob?jk={job["key"]}'
-        if job_url in self.seen_urls:
+        # jobs skipped as already seen don't count towards results_wanted
+        if job_url in self.seen_urls or already_seen(f'in-{job["key"]}'):
             return
         self.seen_urls.add(job_url)
         description = job["description"]["html"]
@@ -233,7 +263,6 @@ class Indeed(Scraper):
             job_url_direct=(
                 job["recruit"].get("viewJobUrl") if job.get("recruit") else None
             ),
-            emails=extract_emails_from_text(description) if description else None,
             is_remote=is_job_remote(job, description),
             company_addresses=(
                 employer_details["addresses"][0]
@@ -0,0 +1,217 @@
+"""
+jobspy.instrument
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the timing instrumentation for scrape_jobs. While a
+collector is active, scrapers report how long each stage took (network,
+throttling sleeps, parsing, markdown conversion, model validation, DataFrame
+assembly) per site and per search page, together with request counts and
+bytes downloaded.
+
+Stages nest: time spent in an inner stage is not counted again in the outer
+one. "parse" is the outermost stage of every scraper, so it holds everything
+a scraper does that no other stage claims. Stage times are summed over the
+worker threads of a site, so they can add up to more than its wall time.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Callable
+
+
+class ScrapeTimings:
+    """
+    Collects the stage events of one scrape_jobs call. Every event is also
+    passed to the callback, if given, as a dict shaped like a finished span:
+    name, start_ns, end_ns and attributes (site, page, stage, bytes, status).
+    """
+
+    def __init__(self, callback: Callable[[dict], None] | None = None):
+        self.callback = callback
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+        self._sites: dict[str, dict] = {}
+        self._stages: dict[str, float] = {}
+
+    def _site(self, site: str) -> dict:
+        if site not in self._sites:
+            self._sites[site] = {
+                "seconds": 0.0,
+                "requests": 0,
+                "bytes": 0,
+                "stages": {},
+                "pages": {},
+            }
+        return self._sites[site]
+
+    def record(
+        self,
+        stage: str,
+        seconds: float,
+        site: str | None = None,
+        page: int | None = None,
+        bytes_downloaded: int = 0,
+        status: int | None = None,
+        end_ns: int | None = None,
+    ) -> None:
+        with self._lock:
+            if site is None:
+                self._stages[stage] = self._stages.get(stage, 0.0) + seconds
+            else:
+                summary = self._site(site)
+                stages = summary["stages"]
+                stages[stage] = stages.get(stage, 0.0) + seconds
+                if page is not None:
+                    summary["pages"][page] = summary["pages"].get(page, 0.0) + seconds
+                if stage == "network":
+                    summary["requests"] += 1
+                    summary["bytes"] += bytes_downloaded
+        if self.callback:
+            end_ns = end_ns or time.time_ns()
+            self.callback(
+                {
+                    "name": f"jobspy.{stage}",
+                    "start_ns": end_ns - int(seconds * 1e9),
+                    "end_ns": end_ns,
+                    "attributes": {
+                        "site": site,
+                        "page": page,
+                        "stage": stage,
+                        "bytes": bytes_downloaded,
+                        "status": status,
+                    },
+                }
+            )
+
+    def finish_site(self, site: str, seconds: float) -> None:
+        with self._lock:
+            self._site(site)["seconds"] = seconds
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {
+                "total_seconds": time.perf_counter() - self.started,
+                "stages": dict(self._stages),
+                "sites": {
+                    site: {
+                        **values,
+                        "stages": dict(values["stages"]),
+                        "pages": dict(sorted(values["pages"].items())),
+                    }
+                    for site, values in self._sites.items()
+                },
+            }
+
+
+class _Frame:
+    __slots__ = ("child_seconds",)
+
+    def __init__(self):
+        self.child_seconds = 0.0
+
+
+_timings: ContextVar[ScrapeTimings | None] = ContextVar("jobspy_timings", default=None)
+_site: ContextVar[str | None] = ContextVar("jobspy_site", default=None)
+_page: ContextVar[int | None] = ContextVar("jobspy_page", default=None)
+_frame: ContextVar[_Frame | None] = ContextVar("jobspy_frame", default=None)
+
+
+def active() -> bool:
+    return _timings.get() is not None
+
+
+@contextmanager
+def collect(timings: ScrapeTimings | None):
+    """Sends the stage events of the block to timings, if given"""
+    if timings is None:
+        yield None
+        return
+    token = _timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _timings.reset(token)
+
+
+@contextmanager
+def site_scope(site: str):
+    """Attributes the stage events of the block to site"""
+    site_token = _site.set(site)
+    page_token = _page.set(None)
+    start = time.perf_counter()
+    try:
+        with stage("parse"):
+            yield
+    finally:
+        timings = _timings.get()
+        if timings is not None:
+            timings.finish_site(site, time.perf_counter() - start)
+        _page.reset(page_token)
+        _site.reset(site_token)
+
+
+def set_page(page: int) -> None:
+    """Marks the search page the scraper is working on"""
+    if _timings.get() is not None:
+        _page.set(page)
+
+
+@contextmanager
+def _stage(timings: ScrapeTimings, name: str):
+    parent = _frame.get()
+    frame = _Frame()
+    token = _frame.set(frame)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        _frame.reset(token)
+        if parent is not None:
+            parent.child_seconds += elapsed
+        timings.record(
+            name, elapsed - frame.child_seconds, site=_site.get(), page=_page.get()
+        )
+
+
+def stage(name: str):
+    """Times the block as the named stage; does nothing without a collector"""
+    timings = _timings.get()
+    if timings is None:
+        return nullcontext()
+    return _stage(timings, name)
+
+
+def run_detached(fn, *args, **kwargs):
+    """
+    Runs fn as its own "parse" stage, for tasks handed to worker threads whose
+    time overlaps the stage of the thread that submitted them
+    """
+    if _timings.get() is None or _site.get() is None:
+        return fn(*args, **kwargs)
+    _frame.set(None)
+    with stage("parse"):
+        return fn(*args, **kwargs)
+
+
+def record_request(seconds: float, response) -> None:
+    """Records a finished HTTP request as the "network" stage"""
+    timings = _timings.get()
+    if timings is None:
+        return
+    parent = _frame.get()
+    if parent is not None:
+        parent.child_seconds += seconds
+    content = getattr(response, "content", None) or b""
+    timings.record(
+        "network",
+        seconds,
+        site=_site.get(),
+        page=_page.get(),
+        bytes_downloaded=len(content),
+        status=getattr(response, "status_code", None),
+    )
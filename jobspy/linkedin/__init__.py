@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import math
 import random
-import time
 from datetime import datetime
 from typing import Optional
 from urllib.parse import urlparse, urlunparse, unquote
@@ -32,14 +31,19 @@ from jobspy.model import (
     Site,
 )
 from jobspy.util import (
-    extract_emails_from_text,
     currency_parser,
     markdown_converter,
     plain_converter,
     create_session,
     remove_attributes,
     create_logger,
+    throttle,
 )
+from jobspy.deadline import deadline_reached
+from jobspy.incremental import is_known, page_is_known
+from jobspy.checkpoint import mark_failed, resume_state, save_state
+from jobspy.instrument import set_page
+from jobspy.seen import already_seen
 
 log = create_logger("LinkedIn")
 
@@ -51,12 +55,21 @@ class LinkedIn(Scraper):
     jobs_per_page = 25
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        proxy_rotation: str | int = "request",
     ):
         """
         Initializes LinkedInScraper with the LinkedIn job search url
         """
-        super().__init__(Site.LINKEDIN, proxies=proxies, ca_cert=ca_cert)
+        super().__init__(
+            Site.LINKEDIN,
+            proxies=proxies,
+            ca_cert=ca_cert,
+            proxy_rotation=proxy_rotation,
+        )
         self.session = create_session(
             proxies=self.proxies,
             ca_cert=ca_cert,
@@ -64,10 +77,13 @@ class LinkedIn(Scraper):
             has_retry=True,
             delay=5,
             clear_cookies=True,
+            rotation=self.proxy_rotation,
+            key=self.site.value,
         )
         self.session.headers.update(headers)
         self.scraper_input = None
         self.country = "worldwide"
+        self.country_enum = Country.from_string(self.country)
         self.job_url_direct_regex = re.compile(r'(?<=\?url=)[^"]+')
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
@@ -77,21 +93,27 @@ class LinkedIn(Scraper):
         :return: job_response
         """
         self.scraper_input = scraper_input
-        job_list: list[JobPost] = []
         seen_ids = set()
         start = scraper_input.offset // 10 * 10 if scraper_input.offset else 0
         request_count = 0
+        state, job_list = resume_state()
+        if state:
+            start, request_count = state["start"], state["request_count"]
+            seen_ids = set(state["seen_ids"])
         seconds_old = (
             scraper_input.hours_old * 3600 if scraper_input.hours_old else None
         )
         continue_search = (
-            lambda: len(job_list) < scraper_input.results_wanted and start < 1000
+            lambda: len(job_list) < scraper_input.results_wanted
+            and start < 1000
+            and not deadline_reached()
         )
         while continue_search():
             request_count += 1
             log.info(
                 f"search page: {request_count} / {math.ceil(scraper_input.results_wanted / 10)}"
             )
+            set_page(request_count)
             params = {
                 "keywords": scraper_input.search_term,
                 "location": scraper_input.location,
@@ -130,18 +152,21 @@ class LinkedIn(Scraper):
                         err = f"LinkedIn response status code {response.status_code}"
                         err += f" - {response.text}"
                     log.error(err)
+                    mark_failed(err)
                     return JobResponse(jobs=job_list)
             except Exception as e:
                 if "Proxy responded with" in str(e):
                     log.error(f"LinkedIn: Bad proxy")
                 else:
                     log.error(f"LinkedIn: {str(e)}")
+                mark_failed(str(e))
                 return JobResponse(jobs=job_list)
 
             soup = BeautifulSoup(response.text, "html.parser")
             job_cards = soup.find_all("div", class_="base-search-card")
             if len(job_cards) == 0:
                 return JobResponse(jobs=job_list)
+            page_jobs = []
 
             for job_card in job_cards:
                 href_tag = job_card.find("a", class_="base-card__full-link")
@@ -149,23 +174,37 @@ class LinkedIn(Scraper):
                     href = href_tag.attrs["href"].split("?")[0]
                     job_id = href.split("-")[-1]
 
-                    if job_id in seen_ids:
+                    if job_id in seen_ids or already_seen(f"li-{job_id}"):
                         continue
                     seen_ids.add(job_id)
 
                     try:
                         fetch_desc = scraper_input.linkedin_fetch_description
+                        if is_known(f"li-{job_id}"):
+                            fetch_desc = False
                         job_post = self._process_job(job_card, job_id, fetch_desc)
                         if job_post:
                             job_list.append(job_post)
+                            page_jobs.append(job_post)
                         if not continue_search():
                             break
                     except Exception as e:
                         raise LinkedInException(str(e))
 
+            if page_is_known(page_jobs):
+                log.info(f"only known jobs on page: {request_count}")
+                break
             if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
+                throttle(random.uniform(self.delay, self.delay + self.band_delay))
                 start += len(job_cards)
+                save_state(
+                    {
+                        "start": start,
+                        "request_count": request_count,
+                        "seen_ids": list(seen_ids),
+                    },
+                    job_list,
+                )
 
         job_list = job_list[: scraper_input.results_wanted]
         return JobResponse(jobs=job_list)
@@ -237,7 +276,6 @@ class LinkedIn(Scraper):
             company_industry=job_details.get("company_industry"),
             description=job_details.get("description"),
             job_url_direct=job_details.get("job_url_direct"),
-            emails=extract_emails_from_text(description),
             company_logo=job_details.get("company_logo"),
             job_function=job_details.get("job_function"),
         )
@@ -303,7 +341,7 @@ class LinkedIn(Scraper):
         :param metadata_card
         :return: location
         """
-        location = Location(country=Country.from_string(self.country))
+        location = Location(country=self.country_enum)
         if metadata_card is not None:
             location_tag = metadata_card.find(
                 "span", class_="job-search-card__location"
@@ -315,7 +353,7 @@ class LinkedIn(Scraper):
                 location = Location(
                     city=city,
                     state=state,
-                    country=Country.from_string(self.country),
+                    country=self.country_enum,
                 )
             elif len(parts) == 3:
                 city, state, country = parts
@@ -1,7 +1,7 @@
 from bs4 import BeautifulSoup
 
 from jobspy.model import JobType, Location
-from jobspy.util import get_enum_from_job_type
+from jobspy.util import classify_text, get_enum_from_job_type
 
 
 def job_type_code(job_type_enum: JobType) -> str:
@@ -89,8 +89,4 @@ def is_job_remote(title: dict, description: str, location: Location) -> bool:
     """
     Searches the title, location, and description to check if job is remote
     """
-    remote_keywords = ["remote", "work from home", "wfh"]
-    location = location.display_location()
-    full_string = f'{title} {description} {location}'.lower()
-    is_remote = any(keyword in full_string for keyword in remote_keywords)
-    return is_remote
+    return "remote" in classify_text(title, description, location.display_location())
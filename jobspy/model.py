@@ -6,6 +6,8 @@ from datetime import date
 from enum import Enum
 from pydantic import BaseModel
 
+from jobspy.instrument import stage
+
 
 class JobType(Enum):
     FULL_TIME = (
@@ -56,6 +58,11 @@ class JobType(Enum):
     SUMMER = ("summer",)
     VOLUNTEER = ("volunteer",)
 
+    @classmethod
+    def from_label(cls, label: str) -> JobType | None:
+        """Returns the JobType with the given label (e.g. "fulltime", "vollzeit"), if any"""
+        return _job_type_index.get(label)
+
 
 class Country(Enum):
     """
@@ -168,16 +175,27 @@ class Country(Enum):
     def from_string(cls, country_str: str):
         """Convert a string to the corresponding Country enum."""
         country_str = country_str.strip().lower()
-        for country in cls:
-            country_names = country.value[0].split(",")
-            if country_str in country_names:
-                return country
+        country = _country_index.get(country_str)
+        if country is not None:
+            return country
         valid_countries = [country.value for country in cls]
         raise ValueError(
             f"Invalid country string: '{country_str}'. Valid countries are: {', '.join([country[0] for country in valid_countries])}"
         )
 
 
+# label/alias -> member indexes, built once so lookups don't scan every member
+_job_type_index: dict[str, JobType] = {}
+for _job_type in JobType:
+    for _label in _job_type.value:
+        _job_type_index.setdefault(_label, _job_type)
+
+_country_index: dict[str, Country] = {}
+for _country in Country:
+    for _alias in _country.value[0].split(","):
+        _country_index.setdefault(_alias, _country)
+
+
 class Location(BaseModel):
     country: Country | str | None = None
     city: Optional[str] = None
@@ -280,6 +298,13 @@ class JobPost(BaseModel):
     vacancy_count: int | None = None  #from vacancy
     work_from_home_type: str | None = None  #from clusters.wfhType (e.g., "Hybrid", "Remote")
 
+    # scrapers build JobPosts validated: they rely on the coercion, and
+    # model_construct is slower per job (see benchmarks/job_rows.py)
+    def __init__(self, /, **data):
+        with stage("validation"):
+            super().__init__(**data)
+
+
 class JobResponse(BaseModel):
     jobs: list[JobPost] = []
 
@@ -315,6 +340,9 @@ class ScraperInput(BaseModel):
     offset: int = 0
     linkedin_fetch_description: bool = False
     linkedin_company_ids: list[int] | None = None
+    bdjobs_fetch_description: bool = True
+    bayt_fetch_description: bool = False
+    ziprecruiter_fetch_description: bool = True
     description_format: DescriptionFormat | None = DescriptionFormat.MARKDOWN
 
     request_timeout: int = 60
@@ -325,12 +353,18 @@ class ScraperInput(BaseModel):
 
 class Scraper(ABC):
     def __init__(
-        self, site: Site, proxies: list[str] | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        site: Site,
+        proxies: list[str] | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        proxy_rotation: str | int = "request",
     ):
         self.site = site
         self.proxies = proxies
         self.ca_cert = ca_cert
         self.user_agent = user_agent
+        self.proxy_rotation = proxy_rotation
 
     @abstractmethod
     def scrape(self, scraper_input: ScraperInput) -> JobResponse: ...
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import math
 import random
-import time
 from datetime import datetime, date, timedelta
 from typing import Optional
 
@@ -12,7 +11,6 @@ import requests
 from jobspy.exception import NaukriException
 from jobspy.naukri.constant import headers as naukri_headers
 from jobspy.naukri.util import (
-    is_job_remote,
     parse_job_type,
     parse_company_industry,
 )
@@ -28,12 +26,18 @@ from jobspy.model import (
     Site,
 )
 from jobspy.util import (
-    extract_emails_from_text,
     currency_parser,
     markdown_converter,
     create_session,
+    classify_text,
     create_logger,
+    throttle,
 )
+from jobspy.deadline import deadline_reached
+from jobspy.incremental import is_known, page_is_known
+from jobspy.checkpoint import mark_failed, resume_state, save_state
+from jobspy.instrument import set_page
+from jobspy.seen import already_seen
 
 log = create_logger("Naukri")
 
@@ -44,12 +48,18 @@ class Naukri(Scraper):
     jobs_per_page = 20  
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        proxy_rotation: str | int = "request",
     ):
         """
         Initializes NaukriScraper with the Naukri API URL
         """
-        super().__init__(Site.NAUKRI, proxies=proxies, ca_cert=ca_cert)
+        super().__init__(
+            Site.NAUKRI, proxies=proxies, ca_cert=ca_cert, proxy_rotation=proxy_rotation
+        )
         self.session = create_session(
             proxies=self.proxies,
             ca_cert=ca_cert,
@@ -57,6 +67,8 @@ class Naukri(Scraper):
             has_retry=True,
             delay=5,
             clear_cookies=True,
+            rotation=self.proxy_rotation,
+            key=self.site.value,
         )
         self.session.headers.update(naukri_headers)
         self.scraper_input = None
@@ -70,16 +82,21 @@ class Naukri(Scraper):
         :return: job_response
         """
         self.scraper_input = scraper_input
-        job_list: list[JobPost] = []
         seen_ids = set()
         start = scraper_input.offset or 0
         page = (start // self.jobs_per_page) + 1
         request_count = 0
+        state, job_list = resume_state()
+        if state:
+            page, request_count = state["page"], state["request_count"]
+            seen_ids = set(state["seen_ids"])
         seconds_old = (
             scraper_input.hours_old * 3600 if scraper_input.hours_old else None
         )
         continue_search = (
-            lambda: len(job_list) < scraper_input.results_wanted and page <= 50  # Arbitrary limit
+            lambda: len(job_list) < scraper_input.results_wanted
+            and page <= 50  # Arbitrary limit
+            and not deadline_reached()
         )
 
         while continue_search():
@@ -88,6 +105,7 @@ class Naukri(Scraper):
                 f"Scraping page {request_count} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)} "
                 f"for search term: {scraper_input.search_term}"
             )
+            set_page(request_count)
             params = {
                 "noOfResults": self.jobs_per_page,
                 "urlType": "search_by_keyword",
@@ -111,6 +129,7 @@ class Naukri(Scraper):
                 if response.status_code not in range(200, 400):
                     err = f"Naukri API response status code {response.status_code} - {response.text}"
                     log.error(err)
+                    mark_failed(err)
                     return JobResponse(jobs=job_list)
                 data = response.json()
                 job_details = data.get("jobDetails", [])
@@ -120,20 +139,25 @@ class Naukri(Scraper):
                     break
             except Exception as e:
                 log.error(f"Naukri API request failed: {str(e)}")
+                mark_failed(str(e))
                 return JobResponse(jobs=job_list)
 
+            page_jobs = []
             for job in job_details:
                 job_id = job.get("jobId")
-                if not job_id or job_id in seen_ids:
+                if not job_id or job_id in seen_ids or already_seen(f"nk-{job_id}"):
                     continue
                 seen_ids.add(job_id)
                 log.debug(f"Processing job ID: {job_id}")
 
                 try:
                     fetch_desc = scraper_input.linkedin_fetch_description
+                    if is_known(f"nk-{job_id}"):
+                        fetch_desc = False
                     job_post = self._process_job(job, job_id, fetch_desc)
                     if job_post:
                         job_list.append(job_post)
+                        page_jobs.append(job_post)
                         log.info(f"Added job: {job_post.title} (ID: {job_id})")
                     if not continue_search():
                         break
@@ -141,9 +165,20 @@ class Naukri(Scraper):
                     log.error(f"Error processing job ID {job_id}: {str(e)}")
                     raise NaukriException(str(e))
 
+            if page_is_known(page_jobs):
+                log.info(f"only known jobs on page: {request_count}")
+                break
             if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
+                throttle(random.uniform(self.delay, self.delay + self.band_delay))
                 page += 1
+                save_state(
+                    {
+                        "page": page,
+                        "request_count": request_count,
+                        "seen_ids": list(seen_ids),
+                    },
+                    job_list,
+                )
 
         job_list = job_list[:scraper_input.results_wanted]
         log.info(f"Scraping completed. Total jobs collected: {len(job_list)}")
@@ -173,7 +208,14 @@ class Naukri(Scraper):
         if description and self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
             description = markdown_converter(description)
 
-        is_remote = is_job_remote(title, description or "", location)
+        placeholders = job.get("placeholders", [])
+        location_label = next(
+            (p["label"] for p in placeholders if p["type"] == "location"), ""
+        )
+        tags = classify_text(
+            title, description, location.display_location(), location_label
+        )
+        is_remote = "remote" in tags
         company_logo = job.get("logoPathV3") or job.get("logoPath")
 
         # Naukri-specific fields
@@ -183,7 +225,7 @@ class Naukri(Scraper):
         company_rating = float(ambition_box.get("AggregateRating")) if ambition_box.get("AggregateRating") else None
         company_reviews_count = ambition_box.get("ReviewsCount")
         vacancy_count = job.get("vacancy")
-        work_from_home_type = self._infer_work_from_home_type(job.get("placeholders", []), title, description or "")
+        work_from_home_type = self._infer_work_from_home_type(tags)
 
         job_post = JobPost(
             id=f"nk-{job_id}",
@@ -198,7 +240,6 @@ class Naukri(Scraper):
             job_type=job_type,
             company_industry=company_industry,
             description=description,
-            emails=extract_emails_from_text(description or ""),
             company_logo=company_logo,
             skills=skills,
             experience_range=experience_range,
@@ -290,15 +331,14 @@ class Naukri(Scraper):
         log.debug("No date parsed")
         return None
 
-    def _infer_work_from_home_type(self, placeholders: list[dict], title: str, description: str) -> Optional[str]:
+    @staticmethod
+    def _infer_work_from_home_type(tags: set[str]) -> Optional[str]:
         """
-        Infers work-from-home type from job data (e.g., 'Hybrid', 'Remote', 'Work from office')
+        Infers work-from-home type from the keyword tags of the title, description
+        and location (e.g., 'Hybrid', 'Remote', 'Work from office')
         """
-        location_str = next((p["label"] for p in placeholders if p["type"] == "location"), "").lower()
-        if "hybrid" in location_str or "hybrid" in title.lower() or "hybrid" in description.lower():
+        if "hybrid" in tags:
             return "Hybrid"
-        elif "remote" in location_str or "remote" in title.lower() or "remote" in description.lower():
+        elif "remote" in tags:
             return "Remote"
-        elif "work from office" in description.lower() or not ("remote" in description.lower() or "hybrid" in description.lower()):
-            return "Work from office"
-        return None
\ No newline at end of file
+        return "Work from office"
@@ -0,0 +1,163 @@
+"""
+jobspy.proxy
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the proxy health tracker shared by every session in
+the process and the rotation policies sessions choose proxies by. Each
+finished request updates its proxy's latency, error and 429 rates, proxies
+that keep failing sit out a cool-down, and the next proxy is drawn at
+random weighted towards the healthy, fast ones.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+
+DIRECT = "http://localhost"
+
+
+@dataclass(frozen=True)
+class RotationPolicy:
+    """
+    How often a session moves to another proxy. `every` is the number of
+    requests a proxy is kept for, None keeping it for the whole session.
+    Sticky policies still move on as soon as the proxy errors, is throttled
+    or is quarantined.
+    """
+
+    every: int | None = 1
+
+    @property
+    def sticky(self) -> bool:
+        return self.every != 1
+
+    @classmethod
+    def parse(cls, value: RotationPolicy | str | int | None) -> RotationPolicy:
+        """Accepts "request", "session", a request count or a policy"""
+        if isinstance(value, RotationPolicy):
+            return value
+        if value is None or value == "request":
+            return cls(1)
+        if value == "session":
+            return cls(None)
+        if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+            return cls(value)
+        raise ValueError(
+            f"Invalid proxy rotation: {value!r}, "
+            'expected "request", "session" or a positive number of requests'
+        )
+
+
+@dataclass
+class ProxyStats:
+    latency: float | None = None
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    requests: int = 0
+    consecutive_failures: int = 0
+    strikes: int = 0
+    quarantined_until: float = 0.0
+
+
+class ProxyHealth:
+    """
+    Health of every proxy seen in the process, keyed by proxy url.
+
+    Rates are exponentially weighted moving averages, so a proxy that
+    recovers earns its traffic back within a few requests. A 429, or
+    `max_failures` errors in a row, quarantines the proxy for `cooldown`
+    seconds, doubling on each repeat up to `max_cooldown`.
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.3,
+        max_failures: int = 3,
+        cooldown: float = 30,
+        max_cooldown: float = 600,
+        unknown_latency: float = 1.0,
+    ):
+        self.alpha = alpha
+        self.max_failures = max_failures
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.unknown_latency = unknown_latency
+        self._lock = threading.Lock()
+        self._stats: dict[str, ProxyStats] = {}
+
+    def stats(self, proxy: str) -> ProxyStats:
+        with self._lock:
+            return self._stats.setdefault(proxy, ProxyStats())
+
+    def weight(self, stats: ProxyStats) -> float:
+        latency = stats.latency if stats.latency is not None else self.unknown_latency
+        healthy = (1 - stats.error_rate) * (1 - stats.throttle_rate)
+        return max(healthy, 0.01) / (latency + 0.1)
+
+    def is_quarantined(self, proxy: str) -> bool:
+        return self.stats(proxy).quarantined_until > time.monotonic()
+
+    def choose(self, proxies: list[str]) -> str:
+        """
+        Picks one of the proxies, skipping quarantined ones. When all of them
+        are quarantined the one released soonest is used.
+        """
+        if len(proxies) == 1:
+            return proxies[0]
+        now = time.monotonic()
+        with self._lock:
+            stats = [self._stats.setdefault(proxy, ProxyStats()) for proxy in proxies]
+            available = [
+                (proxy, s)
+                for proxy, s in zip(proxies, stats)
+                if s.quarantined_until <= now
+            ]
+            if not available:
+                return min(
+                    zip(proxies, stats), key=lambda item: item[1].quarantined_until
+                )[0]
+            weights = [self.weight(s) for _, s in available]
+        return random.choices([proxy for proxy, _ in available], weights)[0]
+
+    def record(self, proxy: str, seconds: float, status: int | None) -> bool:
+        """
+        Updates the proxy's health from a finished request and returns whether
+        the request went through it cleanly
+        """
+        failed = status is None or status in (403, 407) or status >= 500
+        throttled = status == 429
+        alpha = self.alpha
+        with self._lock:
+            stats = self._stats.setdefault(proxy, ProxyStats())
+            stats.requests += 1
+            if status is not None:
+                stats.latency = (
+                    seconds
+                    if stats.latency is None
+                    else alpha * seconds + (1 - alpha) * stats.latency
+                )
+            stats.error_rate = alpha * failed + (1 - alpha) * stats.error_rate
+            stats.throttle_rate = alpha * throttled + (1 - alpha) * stats.throttle_rate
+            if not failed and not throttled:
+                stats.consecutive_failures = 0
+                stats.strikes = 0
+                return True
+            stats.consecutive_failures += 1
+            if throttled or stats.consecutive_failures >= self.max_failures:
+                stats.strikes += 1
+                stats.consecutive_failures = 0
+                cooldown = min(
+                    self.cooldown * 2 ** (stats.strikes - 1), self.max_cooldown
+                )
+                stats.quarantined_until = time.monotonic() + cooldown
+            return False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+proxy_health = ProxyHealth()
@@ -0,0 +1,162 @@
+"""
+jobspy.seen
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the seen-job filter shared across runs: a Bloom filter
+of job ids, sized for tens of millions of jobs in a few tens of megabytes
+and saved to a single file. Scrapers check it as soon as they know a job's
+id and skip jobs already ingested before fetching their detail pages or
+parsing them further. A Bloom filter has no false negatives, so a job seen
+before is never fetched again; its false positives mean that about
+`error_rate` of the new jobs are skipped as if they had been seen.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import struct
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_MAGIC = b"JSBF"
+_HEADER = struct.Struct("<4sQQQ")
+
+
+class SeenFilter:
+    """Bloom filter of job ids"""
+
+    def __init__(
+        self,
+        capacity: int = 10_000_000,
+        error_rate: float = 0.01,
+        path: str | os.PathLike | None = None,
+    ):
+        self.path = path
+        self.bit_count = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self.bit_count / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.bit_count + 7) // 8)
+        self._lock = threading.Lock()
+
+    def _positions(self, job_id: str):
+        digest = hashlib.blake2b(job_id.encode(), digest_size=16).digest()
+        first, second = struct.unpack("<QQ", digest)
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.bit_count
+
+    def __contains__(self, job_id: str) -> bool:
+        bits = self._bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(job_id)
+        )
+
+    def add(self, job_id: str) -> None:
+        positions = list(self._positions(job_id))
+        with self._lock:
+            bits = self._bits
+            new = False
+            for position in positions:
+                mask = 1 << (position & 7)
+                if not bits[position >> 3] & mask:
+                    bits[position >> 3] |= mask
+                    new = True
+            if new:
+                self.count += 1
+
+    def update(self, job_ids) -> None:
+        for job_id in job_ids:
+            self.add(job_id)
+
+    @classmethod
+    def open(
+        cls,
+        path: str | os.PathLike,
+        capacity: int = 10_000_000,
+        error_rate: float = 0.01,
+    ) -> SeenFilter:
+        """The filter saved at path, or a new, empty one that will be saved there"""
+        if not os.path.exists(path):
+            return cls(capacity, error_rate, path)
+        with open(path, "rb") as file:
+            magic, bit_count, hash_count, count = _HEADER.unpack(
+                file.read(_HEADER.size)
+            )
+            if magic != _MAGIC:
+                raise ValueError(f"Not a seen-job filter: '{os.fspath(path)}'")
+            seen = cls.__new__(cls)
+            seen.path = path
+            seen.bit_count = bit_count
+            seen.hash_count = hash_count
+            seen.count = count
+            seen._bits = bytearray(file.read())
+            seen._lock = threading.Lock()
+        return seen
+
+    def _merge_saved(self, path: str | os.PathLike) -> None:
+        """ORs in the bits of the filter saved at path, if it has the same size"""
+        try:
+            with open(path, "rb") as file:
+                magic, bit_count, hash_count, count = _HEADER.unpack(
+                    file.read(_HEADER.size)
+                )
+                if (magic, bit_count, hash_count) != (
+                    _MAGIC,
+                    self.bit_count,
+                    self.hash_count,
+                ):
+                    return
+                saved = file.read()
+        except (FileNotFoundError, struct.error):
+            return
+        if len(saved) != len(self._bits):
+            return
+        merged = int.from_bytes(self._bits, "little") | int.from_bytes(saved, "little")
+        self._bits = bytearray(merged.to_bytes(len(self._bits), "little"))
+        self.count = max(self.count, count)
+
+    def save(self, path: str | os.PathLike | None = None) -> None:
+        """
+        Writes the filter to path, replacing the file in one step. The ids
+        saved there by other writers since the filter was opened are merged
+        in first, so processes sharing the file keep each other's jobs,
+        except when two of them save at the same moment.
+        """
+        path = path or self.path
+        if path is None:
+            return
+        path = os.fspath(path)
+        # several processes may share the file, so each writes its own
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with self._lock:
+            self._merge_saved(path)
+            with open(temporary, "wb") as file:
+                file.write(
+                    _HEADER.pack(_MAGIC, self.bit_count, self.hash_count, self.count)
+                )
+                file.write(self._bits)
+            os.replace(temporary, path)
+
+
+_seen: ContextVar[SeenFilter | None] = ContextVar("jobspy_seen", default=None)
+
+
+@contextmanager
+def seen_scope(seen: SeenFilter | None):
+    """Makes seen the filter the scrapers of the block skip jobs with"""
+    token = _seen.set(seen)
+    try:
+        yield seen
+    finally:
+        _seen.reset(token)
+
+
+def already_seen(job_id: str | None) -> bool:
+    """Whether a job was ingested by an earlier run"""
+    seen = _seen.get()
+    return seen is not None and job_id is not None and job_id in seen
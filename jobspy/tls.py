@@ -0,0 +1,57 @@
+"""
+jobspy.tls
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the tls_client backed session, kept apart from
+jobspy.util so the native tls_client library is only loaded by scrapers
+that ask create_session for a TLS session.
+"""
+
+from __future__ import annotations
+
+import math
+
+import tls_client
+
+from jobspy.deadline import clamp_timeout
+from jobspy.transport import HttpRequest
+from jobspy.util import RotatingProxySession
+
+
+class TLSRotating(RotatingProxySession, tls_client.Session):
+    def __init__(self, proxies=None, rotation="request"):
+        RotatingProxySession.__init__(self, proxies=proxies, rotation=rotation)
+        tls_client.Session.__init__(self, random_tls_extension_order=True)
+
+    def execute_request(self, method, url, **kwargs):
+        timeout = (
+            kwargs.get("timeout")
+            or kwargs.get("timeout_seconds")
+            or self.timeout_seconds
+        )
+        clamped = clamp_timeout(timeout)
+        if clamped != timeout:
+            # whole seconds, as tls_client keeps a native session per timeout
+            kwargs.pop("timeout", None)
+            kwargs["timeout_seconds"] = math.ceil(clamped)
+        proxy, _ = self.next_proxy()
+        kwargs["proxy"] = self.proxy_settings(proxy)
+        request = HttpRequest(
+            method,
+            url,
+            params=kwargs.get("params"),
+            data=kwargs.get("data"),
+            json=kwargs.get("json"),
+        )
+
+        def send(headers: dict):
+            if headers:
+                kwargs["headers"] = {**(kwargs.get("headers") or {}), **headers}
+            return self._execute_request(method, url, **kwargs)
+
+        return self.send_cached(request, send, proxy)
+
+    def _execute_request(self, method, url, **kwargs):
+        response = tls_client.Session.execute_request(self, method, url, **kwargs)
+        response.ok = response.status_code in range(200, 400)
+        return response
@@ -0,0 +1,225 @@
+"""
+jobspy.transport
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the pluggable transports behind the sessions returned by
+create_session. A transport sees every request a scraper sends and decides how
+it is answered: by the network, by the network while recording the response to
+a fixture corpus, or from a recorded corpus without touching the network.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+class FixtureNotFound(Exception):
+    def __init__(self, message=None):
+        super().__init__(message or "No recorded response for this request")
+
+
+@dataclass
+class HttpRequest:
+    method: str
+    url: str
+    params: Any = None
+    data: Any = None
+    json: Any = None
+
+    def normalized_url(self) -> str:
+        """URL with the params merged into the query string, sorted"""
+        parts = urlsplit(self.url)
+        query = parse_qsl(parts.query, keep_blank_values=True)
+        if self.params:
+            items = (
+                self.params.items() if isinstance(self.params, dict) else self.params
+            )
+            for key, value in items:
+                if value is None:
+                    continue
+                values = value if isinstance(value, (list, tuple)) else [value]
+                query += [(str(key), str(v)) for v in values]
+        return urlunsplit(parts._replace(query=urlencode(sorted(query))))
+
+    def body(self) -> str:
+        if self.json is not None:
+            return json.dumps(self.json, sort_keys=True, separators=(",", ":"))
+        if self.data is None:
+            return ""
+        if isinstance(self.data, bytes):
+            return self.data.decode("utf-8", errors="replace")
+        if isinstance(self.data, dict):
+            return urlencode(sorted(self.data.items()))
+        if isinstance(self.data, (list, tuple)):
+            return urlencode(list(self.data))
+        return str(self.data)
+
+    def key(self) -> str:
+        """Stable identifier of the request used to name its fixture"""
+        fingerprint = "\n".join(
+            [self.method.upper(), self.normalized_url(), self.body()]
+        )
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:32]
+
+
+class RecordedResponse:
+    """Response rebuilt from a fixture, with the parts of the requests API scrapers use"""
+
+    def __init__(
+        self, status_code: int, url: str, headers: dict, content: bytes, encoding=None
+    ):
+        self.status_code = status_code
+        self.url = url
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code in range(200, 400)
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    def json(self, **kwargs):
+        return json.loads(self.text, **kwargs)
+
+    def raise_for_status(self):
+        if not self.ok:
+            import requests
+
+            raise requests.HTTPError(
+                f"{self.status_code} Error for url: {self.url}", response=self
+            )
+
+
+class FixtureStore:
+    """A directory of recorded responses, one JSON file per request key"""
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def _file(self, request: HttpRequest) -> Path:
+        return self.path / f"{request.key()}.json"
+
+    def save(self, request: HttpRequest, response) -> None:
+        content = response.content or b""
+        record = {
+            "request": {
+                "method": request.method.upper(),
+                "url": request.normalized_url(),
+                "body": request.body(),
+            },
+            "status_code": response.status_code,
+            "url": str(response.url),
+            "headers": {k: str(v) for k, v in dict(response.headers).items()},
+            "encoding": getattr(response, "encoding", None),
+            "body_b64": base64.b64encode(content).decode("ascii"),
+        }
+        with self._lock:
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._file(request).write_text(json.dumps(record, indent=1))
+
+    def load(self, request: HttpRequest) -> RecordedResponse | None:
+        file = self._file(request)
+        if not file.exists():
+            return None
+        record = json.loads(file.read_text())
+        return RecordedResponse(
+            status_code=record["status_code"],
+            url=record["url"],
+            headers=record["headers"],
+            content=base64.b64decode(record["body_b64"]),
+            encoding=record.get("encoding"),
+        )
+
+
+class Transport:
+    """Sends requests straight to the network"""
+
+    def send(self, request: HttpRequest, send: Callable[[], Any]):
+        return send()
+
+
+class RecordTransport(Transport):
+    """Sends requests to the network and saves every response to the store"""
+
+    def __init__(self, store: FixtureStore | str | os.PathLike):
+        self.store = store if isinstance(store, FixtureStore) else FixtureStore(store)
+
+    def send(self, request: HttpRequest, send: Callable[[], Any]):
+        response = send()
+        self.store.save(request, response)
+        return response
+
+
+class ReplayTransport(Transport):
+    """Answers requests from the store only, never touching the network"""
+
+    def __init__(self, store: FixtureStore | str | os.PathLike):
+        self.store = store if isinstance(store, FixtureStore) else FixtureStore(store)
+
+    def send(self, request: HttpRequest, send: Callable[[], Any]):
+        response = self.store.load(request)
+        if response is None:
+            raise FixtureNotFound(
+                f"No recorded response for {request.method.upper()} {request.normalized_url()}"
+            )
+        return response
+
+
+_default_transport: Transport | None = None
+_env_transport: tuple[str, Transport] | None = None
+
+
+def transport_from_env() -> Transport | None:
+    """
+    Reads JOBSPY_TRANSPORT, e.g. "record:fixtures/linkedin" or "replay:fixtures/linkedin"
+    """
+    global _env_transport
+    value = os.environ.get("JOBSPY_TRANSPORT")
+    if not value:
+        return None
+    if _env_transport and _env_transport[0] == value:
+        return _env_transport[1]
+    mode, _, path = value.partition(":")
+    if mode == "record":
+        transport = RecordTransport(path)
+    elif mode == "replay":
+        transport = ReplayTransport(path)
+    else:
+        raise ValueError(f"Invalid JOBSPY_TRANSPORT mode: '{mode}'")
+    _env_transport = (value, transport)
+    return transport
+
+
+def get_default_transport() -> Transport | None:
+    return _default_transport or transport_from_env()
+
+
+def set_default_transport(transport: Transport | None) -> None:
+    """Sets the transport used by sessions that were not given one explicitly"""
+    global _default_transport
+    _default_transport = transport
+
+
+@contextmanager
+def use_transport(transport: Transport | None):
+    """Sets the default transport for the duration of the block"""
+    previous = _default_transport
+    set_default_transport(transport)
+    try:
+        yield transport
+    finally:
+        set_default_transport(previous)
@@ -1,17 +1,33 @@
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
 import re
-from itertools import cycle
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from urllib.parse import urlsplit
 
-import numpy as np
 import requests
-import tls_client
 import urllib3
-from markdownify import markdownify as md
 from requests.adapters import HTTPAdapter, Retry
 
-from jobspy.model import CompensationInterval, JobType, Site
+from jobspy.cache import HttpCache, current_cache
+from jobspy.concurrency import governor
+from jobspy.deadline import clamp_timeout, remaining
+from jobspy.instrument import record_request, stage
+from jobspy.metrics import http_cache_requests, record_response
+from jobspy.model import (
+    CompensationInterval,
+    JobPost,
+    JobType,
+    SalarySource,
+    Site,
+)
+from jobspy.proxy import DIRECT, RotationPolicy, proxy_health
+from jobspy.transport import HttpRequest, Transport, get_default_transport
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -30,17 +46,114 @@ def create_logger(name: str):
 
 
 class RotatingProxySession:
-    def __init__(self, proxies=None):
+    transport: Transport | None = None
+    cache: HttpCache | None = None
+
+    def __init__(self, proxies=None, rotation="request"):
         if isinstance(proxies, str):
-            self.proxy_cycle = cycle([self.format_proxy(proxies)])
-        elif isinstance(proxies, list):
-            self.proxy_cycle = (
-                cycle([self.format_proxy(proxy) for proxy in proxies])
-                if proxies
-                else None
-            )
-        else:
-            self.proxy_cycle = None
+            proxies = [proxies]
+        self.proxy_pool = {
+            proxy["http"]: proxy for proxy in map(self.format_proxy, proxies or [])
+        }
+        self.rotation = RotationPolicy.parse(rotation)
+        self._proxy_lock = threading.Lock()
+        self._proxy = None
+        self._proxy_uses = 0
+        self._proxy_failed = False
+
+    def next_proxy(self) -> tuple[str | None, bool]:
+        """
+        Chooses the proxy for the next request and returns its url, or None
+        without proxies, and whether it differs from the previous request's.
+        Sticky rotation policies keep the current proxy until its budget is
+        spent or it stops going through cleanly; otherwise the shared health
+        tracker picks one. The choice is handed to the request rather than
+        stored on the session, as threads share scrapers' sessions.
+        """
+        with self._proxy_lock:
+            previous = self._proxy
+            if not self.proxy_pool:
+                self._proxy = DIRECT
+                return None, previous is None
+            if (
+                not self.rotation.sticky
+                or previous is None
+                or self._proxy_failed
+                or (
+                    self.rotation.every is not None
+                    and self._proxy_uses >= self.rotation.every
+                )
+                or proxy_health.is_quarantined(previous)
+            ):
+                candidates = list(self.proxy_pool)
+                if self._proxy_failed and len(candidates) > 1:
+                    candidates.remove(previous)
+                self._proxy = proxy_health.choose(candidates)
+                self._proxy_uses = 0
+                self._proxy_failed = False
+            self._proxy_uses += 1
+            return self._proxy, self._proxy != previous
+
+    def proxy_settings(self, proxy: str | None) -> dict:
+        """The requests-style proxies mapping of a proxy url from next_proxy"""
+        if proxy is None or proxy == DIRECT:
+            return {}
+        return self.proxy_pool[proxy]
+
+    def send_through_transport(
+        self, request: HttpRequest, send, proxy: str | None = None
+    ):
+        """
+        Hands the request to the session's transport, or the default one if
+        any, once the concurrency governor has a slot for its host, and
+        reports the outcome against the proxy it went through
+        """
+        transport = self.transport or get_default_transport()
+        with governor.limit(request.url):
+            start = time.perf_counter()
+            response = None
+            try:
+                if transport is None:
+                    response = send()
+                else:
+                    response = transport.send(request, send)
+                return response
+            finally:
+                seconds = time.perf_counter() - start
+                record_request(seconds, response)
+                record_response(request.url, seconds, response)
+                if proxy is not None:
+                    clean = proxy_health.record(
+                        proxy, seconds, getattr(response, "status_code", None)
+                    )
+                    if not clean:
+                        with self._proxy_lock:
+                            if proxy == self._proxy:
+                                self._proxy_failed = True
+
+    def send_cached(self, request: HttpRequest, send, proxy: str | None = None):
+        """
+        Answers the request from the session's HTTP cache when it holds a
+        fresh response, and otherwise sends it through the transport, with
+        the cached response's validators when there is one. send takes the
+        extra headers to send.
+        """
+        cache = self.cache
+        if cache is None or not cache.cacheable(request):
+            return self.send_through_transport(request, lambda: send({}), proxy)
+        host = urlsplit(request.url).hostname or ""
+        entry = cache.load(request)
+        if entry is not None and entry.age < cache.ttl:
+            http_cache_requests.inc(host=host, result="hit")
+            return entry.response()
+        validators = entry.validators() if entry is not None else {}
+        response = self.send_through_transport(request, lambda: send(validators), proxy)
+        if entry is not None and validators and response.status_code == 304:
+            http_cache_requests.inc(host=host, result="revalidated")
+            return cache.revalidated(request, entry, response)
+        http_cache_requests.inc(host=host, result="miss")
+        cache.save(request, response)
+        return response
 
     @staticmethod
     def format_proxy(proxy):
@@ -53,8 +166,15 @@ class RotatingProxySession:
 
 
 class RequestsRotating(RotatingProxySession, requests.Session):
-    def __init__(self, proxies=None, has_retry=False, delay=1, clear_cookies=False):
-        RotatingProxySession.__init__(self, proxies=proxies)
+    def __init__(
+        self,
+        proxies=None,
+        has_retry=False,
+        delay=1,
+        clear_cookies=False,
+        rotation="request",
+    ):
+        RotatingProxySession.__init__(self, proxies=proxies, rotation=rotation)
         requests.Session.__init__(self)
         self.clear_cookies = clear_cookies
         self.allow_redirects = True
@@ -74,33 +194,70 @@ class RequestsRotating(RotatingProxySession, requests.Session):
             self.mount("https://", adapter)
 
     def request(self, method, url, **kwargs):
-        if self.clear_cookies:
+        kwargs["timeout"] = clamp_timeout(kwargs.get("timeout"))
+        proxy, changed = self.next_proxy()
+        kwargs["proxies"] = self.proxy_settings(proxy)
+        if self.clear_cookies and (not self.rotation.sticky or changed):
             self.cookies.clear()
 
-        if self.proxy_cycle:
-            next_proxy = next(self.proxy_cycle)
-            if next_proxy["http"] != "http://localhost":
-                self.proxies = next_proxy
-            else:
-                self.proxies = {}
-        return requests.Session.request(self, method, url, **kwargs)
+        request = HttpRequest(
+            method,
+            url,
+            params=kwargs.get("params"),
+            data=kwargs.get("data"),
+            json=kwargs.get("json"),
+        )
 
+        def send(headers: dict):
+            if headers:
+                kwargs["headers"] = {**(kwargs.get("headers") or {}), **headers}
+            return requests.Session.request(self, method, url, **kwargs)
 
-class TLSRotating(RotatingProxySession, tls_client.Session):
-    def __init__(self, proxies=None):
-        RotatingProxySession.__init__(self, proxies=proxies)
-        tls_client.Session.__init__(self, random_tls_extension_order=True)
+        return self.send_cached(request, send, proxy)
 
-    def execute_request(self, *args, **kwargs):
-        if self.proxy_cycle:
-            next_proxy = next(self.proxy_cycle)
-            if next_proxy["http"] != "http://localhost":
-                self.proxies = next_proxy
-            else:
-                self.proxies = {}
-        response = tls_client.Session.execute_request(self, *args, **kwargs)
-        response.ok = response.status_code in range(200, 400)
-        return response
+
+class SessionPool:
+    """Sessions shared by the scrapers running inside shared_sessions()"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sessions: dict[tuple, requests.Session] = {}
+
+    def get(self, key: tuple, create) -> requests.Session:
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._sessions[key] = create()
+            return session
+
+    def close(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            close = getattr(session, "close", None)
+            if close:
+                close()
+
+
+_session_pool: ContextVar[SessionPool | None] = ContextVar(
+    "jobspy_session_pool", default=None
+)
+
+
+@contextmanager
+def shared_sessions():
+    """
+    Makes create_session hand out one session per key and settings for the
+    block, so repeated searches reuse connections, cookies and tokens
+    """
+    pool = SessionPool()
+    token = _session_pool.set(pool)
+    try:
+        yield pool
+    finally:
+        _session_pool.reset(token)
+        pool.close()
 
 
 def create_session(
@@ -111,23 +268,76 @@ def create_session(
     has_retry: bool = False,
     delay: int = 1,
     clear_cookies: bool = False,
+    transport: Transport | None = None,
+    rotation: RotationPolicy | str | int = "request",
+    key: str | None = None,
+    cache: HttpCache | str | os.PathLike | None = None,
 ) -> requests.Session:
     """
     Creates a requests session with optional tls, proxy, and retry settings.
+    :param rotation: how often the session moves to another proxy, "request",
+        "session" or every N requests (see jobspy.proxy.RotationPolicy). With
+        a sticky policy clear_cookies only clears them when the proxy changes
+    :param transport: answers the session's requests instead of the default
+        transport (see jobspy.transport), e.g. to record or replay fixtures
+    :param key: names the session, usually the site; inside shared_sessions()
+        calls with the same key and settings get the same session back
+    :param cache: an HttpCache, or its directory, answering repeated requests
+        (see jobspy.cache); defaults to the one set by http_cache_scope()
     :return: A session object
     """
+    if cache is None:
+        cache = current_cache()
+    elif not isinstance(cache, HttpCache):
+        cache = HttpCache(cache)
+    pool = _session_pool.get()
+    if key is not None and pool is not None:
+        settings = (
+            key,
+            tuple(proxies) if isinstance(proxies, list) else proxies,
+            ca_cert,
+            is_tls,
+            has_retry,
+            delay,
+            clear_cookies,
+            id(transport),
+            RotationPolicy.parse(rotation),
+            cache and cache.settings(),
+        )
+        return pool.get(
+            settings,
+            lambda: create_session(
+                proxies=proxies,
+                ca_cert=ca_cert,
+                is_tls=is_tls,
+                has_retry=has_retry,
+                delay=delay,
+                clear_cookies=clear_cookies,
+                transport=transport,
+                rotation=rotation,
+                cache=cache,
+            ),
+        )
+
     if is_tls:
-        session = TLSRotating(proxies=proxies)
+        from jobspy.tls import TLSRotating
+
+        session = TLSRotating(proxies=proxies, rotation=rotation)
     else:
         session = RequestsRotating(
             proxies=proxies,
             has_retry=has_retry,
             delay=delay,
             clear_cookies=clear_cookies,
+            rotation=rotation,
         )
 
     if ca_cert:
         session.verify = ca_cert
+    if transport:
+        session.transport = transport
+    if cache is not None:
+        session.cache = cache
 
     return session
 
@@ -151,38 +361,71 @@ def set_logger_level(verbose: int):
         raise ValueError(f"Invalid log level: {level_name}")
 
 
+def throttle(seconds: float):
+    """
+    Sleeps between requests to a job board, timed as the "sleep" stage. The
+    sleep ends early at the scrape's deadline, if any.
+    """
+    left = remaining()
+    if left is not None:
+        seconds = min(seconds, left)
+    with stage("sleep"):
+        time.sleep(seconds)
+
+
 def markdown_converter(description_html: str):
     if description_html is None:
         return None
-    markdown = md(description_html)
+    from markdownify import markdownify as md
+
+    with stage("markdown"):
+        markdown = md(description_html)
     return markdown.strip()
 
 def plain_converter(decription_html:str):
     from bs4 import BeautifulSoup
     if decription_html is None:
         return None
-    soup = BeautifulSoup(decription_html, "html.parser")
-    text = soup.get_text(separator=" ")
-    text = re.sub(r'\s+',' ',text)
+    with stage("markdown"):
+        soup = BeautifulSoup(decription_html, "html.parser")
+        text = soup.get_text(separator=" ")
+        text = re.sub(r"\s+", " ", text)
     return text.strip()
 
 
+EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+
+
 def extract_emails_from_text(text: str) -> list[str] | None:
-    if not text:
+    """Lowercased, de-duplicated email addresses in the text, in order of appearance"""
+    if not text or "@" not in text:
         return None
-    email_regex = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
-    return email_regex.findall(text)
+    return list(dict.fromkeys(email.lower() for email in EMAIL_PATTERN.findall(text)))
+
+
+def extract_emails_batch(descriptions: pd.Series) -> pd.Series:
+    """
+    extract_emails_from_text over a whole column of descriptions, as the
+    comma separated strings scrape_jobs returns (None where there are none)
+    """
+    import pandas as pd
+
+    emails = (
+        extract_emails_from_text(text) if isinstance(text, str) else None
+        for text in descriptions
+    )
+    return pd.Series(
+        [", ".join(found) if found else None for found in emails],
+        index=descriptions.index,
+        dtype=object,
+    )
 
 
 def get_enum_from_job_type(job_type_str: str) -> JobType | None:
     """
     Given a string, returns the corresponding JobType enum member if a match is found.
     """
-    res = None
-    for job_type in JobType:
-        if job_type_str in job_type.value:
-            res = job_type
-    return res
+    return JobType.from_label(job_type_str)
 
 
 def currency_parser(cur_str):
@@ -199,6 +442,8 @@ def currency_parser(cur_str):
     else:
         num = float(cur_str)
 
+    import numpy as np
+
     return np.round(num, 2)
 
 
@@ -208,6 +453,23 @@ def remove_attributes(tag):
     return tag
 
 
+def stable_job_id(job_url: str) -> str:
+    """
+    An id for a job that only has a url, the same in every process: the
+    numeric id the url ends with, or a digest of the url. (hash() is salted
+    per process, so it can't identify a job across runs.)
+    """
+    match = re.search(r"(\d{4,})/?(?:[?#].*)?$", job_url)
+    if match:
+        return match.group(1)
+    return hashlib.sha1(job_url.encode()).hexdigest()[:16]
+
+
+SALARY_RANGE_PATTERN = re.compile(
+    r"\$(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)\s*[-—–]\s*(?:\$)?(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)"
+)
+
+
 def extract_salary(
     salary_str,
     lower_limit=1000,
@@ -224,7 +486,6 @@ def extract_salary(
         return None, None, None, None
 
     annual_max_salary = None
-    min_max_pattern = r"\$(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)\s*[-—–]\s*(?:\$)?(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)"
 
     def to_int(s):
         return int(float(s.replace(",", "")))
@@ -235,7 +496,7 @@ def extract_salary(
     def convert_monthly_to_annual(monthly_wage):
         return monthly_wage * 12
 
-    match = re.search(min_max_pattern, salary_str)
+    match = SALARY_RANGE_PATTERN.search(salary_str)
 
     if match:
         min_salary = to_int(match.group(1))
@@ -278,23 +539,136 @@ def extract_salary(
     return None, None, None, None
 
 
-def extract_job_type(description: str):
-    if not description:
-        return []
+def extract_salary_batch(
+    descriptions: pd.Series,
+    lower_limit=1000,
+    upper_limit=700000,
+    hourly_threshold=350,
+    monthly_threshold=30000,
+    enforce_annual_salary=False,
+) -> pd.DataFrame:
+    """
+    extract_salary over a whole column of descriptions at once. Returns a
+    DataFrame with the descriptions' index and the interval, min_amount,
+    max_amount and currency columns, empty (NaN/None) where extract_salary
+    would return Nones.
+    """
+    import numpy as np
+    import pandas as pd
+
+    # one pass of the precompiled pattern; only the matches go on to numpy
+    search = SALARY_RANGE_PATTERN.search
+    matches = [
+        search(description) if isinstance(description, str) else None
+        for description in descriptions
+    ]
+    matched = np.fromiter((match is not None for match in matches), bool, len(matches))
+    groups = [match.groups() for match in matches if match is not None]
+    amounts = np.array(
+        [(low.replace(",", ""), high.replace(",", "")) for low, _, high, _ in groups],
+        dtype=float,
+    ).reshape(-1, 2)
+    thousands = np.array(
+        [bool(min_k) or bool(max_k) for _, min_k, _, max_k in groups], dtype=bool
+    )
+    amounts = np.trunc(amounts) * np.where(thousands, 1000, 1)[:, None]
+    min_salary, max_salary = amounts[:, 0], amounts[:, 1]
+
+    hourly = min_salary < hourly_threshold
+    monthly = ~hourly & (min_salary < monthly_threshold)
+    yearly = ~hourly & ~monthly
+    annual_min = np.select(
+        [hourly, monthly], [min_salary * 2080, min_salary * 12], min_salary
+    )
+    # like extract_salary, a max past the min's interval threshold means no salary
+    annual_max = np.select(
+        [
+            hourly & (max_salary < hourly_threshold),
+            monthly & (max_salary < monthly_threshold),
+            yearly,
+        ],
+        [max_salary * 2080, max_salary * 12, max_salary],
+        np.nan,
+    )
+    with np.errstate(invalid="ignore"):
+        valid = (
+            (annual_max != 0)
+            & ~np.isnan(annual_max)
+            & (lower_limit <= annual_min)
+            & (annual_min <= upper_limit)
+            & (lower_limit <= annual_max)
+            & (annual_max <= upper_limit)
+            & (annual_min < annual_max)
+        )
+
+    if enforce_annual_salary:
+        min_salary, max_salary = annual_min, annual_max
+    interval = np.select(
+        [hourly, monthly],
+        [CompensationInterval.HOURLY.value, CompensationInterval.MONTHLY.value],
+        CompensationInterval.YEARLY.value,
+    ).astype(object)
+
+    def scatter(values: np.ndarray, empty) -> np.ndarray:
+        column = np.full(len(matches), empty, dtype=values.dtype)
+        column[matched] = np.where(valid, values, empty)
+        return column
+
+    return pd.DataFrame(
+        {
+            "interval": scatter(interval, None),
+            "min_amount": scatter(min_salary, np.nan),
+            "max_amount": scatter(max_salary, np.nan),
+            "currency": scatter(np.full(len(groups), "USD", dtype=object), None),
+        },
+        index=descriptions.index,
+    )
+
+
+# keyword tags found by classify_text; one alternation so each text is scanned once
+KEYWORD_PATTERNS = {
+    "remote": r"remote|work from home|wfh",
+    "home_based": r"home based",
+    "hybrid": r"hybrid",
+    "office": r"work from office",
+    "full_time": r"full\s?time",
+    "part_time": r"part\s?time",
+    "internship": r"internship",
+    "contract": r"contract",
+}
+KEYWORD_PATTERN = re.compile(
+    "|".join(f"(?P<{tag}>{pattern})" for tag, pattern in KEYWORD_PATTERNS.items()),
+    re.IGNORECASE,
+)
+TAG_JOB_TYPES = {
+    "full_time": JobType.FULL_TIME,
+    "part_time": JobType.PART_TIME,
+    "internship": JobType.INTERNSHIP,
+    "contract": JobType.CONTRACT,
+}
+
+
+def classify_text(*texts: str | None) -> set[str]:
+    """
+    Tags (keys of KEYWORD_PATTERNS) of the keywords found in any of the
+    texts, case-insensitively, in a single pass over each text
+    """
+    tags = set()
+    for text in texts:
+        if text:
+            tags.update(match.lastgroup for match in KEYWORD_PATTERN.finditer(text))
+    return tags
+
 
-    keywords = {
-        JobType.FULL_TIME: r"full\s?time",
-        JobType.PART_TIME: r"part\s?time",
-        JobType.INTERNSHIP: r"internship",
-        JobType.CONTRACT: r"contract",
-    }
+def job_types_from_tags(tags: set[str]) -> list[JobType] | None:
+    job_types = [job_type for tag, job_type in TAG_JOB_TYPES.items() if tag in tags]
+    return job_types if job_types else None
 
-    listing_types = []
-    for key, pattern in keywords.items():
-        if re.search(pattern, description, re.IGNORECASE):
-            listing_types.append(key)
 
-    return listing_types if listing_types else None
+def extract_job_type(description: str):
+    if not description:
+        return []
+    return job_types_from_tags(classify_text(description))
 
 
 def map_str_to_site(site_name: str) -> Site:
@@ -302,9 +676,9 @@ def map_str_to_site(site_name: str) -> Site:
 
 
 def get_enum_from_value(value_str):
-    for job_type in JobType:
-        if value_str in job_type.value:
-            return job_type
+    job_type = JobType.from_label(value_str)
+    if job_type is not None:
+        return job_type
     raise Exception(f"Invalid job type: {value_str}")
 
 
@@ -361,3 +735,66 @@ desired_order = [
     "vacancy_count",
     "work_from_home_type",
 ]
+
+
+def job_to_row(job: JobPost, site: str, enforce_annual_salary: bool = False) -> dict:
+    """
+    Flattens a scraped JobPost into a scrape_jobs row, reading the model's
+    attributes directly instead of round-tripping through model_dump().
+    Salaries in descriptions are left to fill_description_salaries.
+    """
+    job_data = dict(job)
+    job_data["site"] = site
+    job_data["company"] = job.company_name
+    job_data["job_type"] = (
+        ", ".join(job_type.value[0] for job_type in job.job_type)
+        if job.job_type
+        else None
+    )
+    job_data["emails"] = ", ".join(job.emails) if job.emails else None
+    job_data["location"] = job.location.display_location() if job.location else None
+
+    compensation = job.compensation
+    if compensation:
+        job_data["interval"] = (
+            compensation.interval.value if compensation.interval else None
+        )
+        job_data["min_amount"] = compensation.min_amount
+        job_data["max_amount"] = compensation.max_amount
+        job_data["currency"] = compensation.currency
+        job_data["salary_source"] = SalarySource.DIRECT_DATA.value
+        if enforce_annual_salary and (
+            job_data["interval"]
+            and job_data["interval"] != "yearly"
+            and job_data["min_amount"]
+            and job_data["max_amount"]
+        ):
+            convert_to_annual(job_data)
+        job_data["salary_source"] = (
+            job_data["salary_source"] if job_data["min_amount"] else None
+        )
+    job_data["skills"] = ", ".join(job.skills) if job.skills else None
+    return job_data
+
+
+def fill_description_salaries(
+    jobs_df: pd.DataFrame, rows: np.ndarray, enforce_annual_salary: bool = False
+) -> None:
+    """
+    Fills the salary columns of the selected rows (those without compensation)
+    from their descriptions, in one batch
+    """
+    import numpy as np
+
+    if not rows.any():
+        return
+    salaries = extract_salary_batch(
+        jobs_df.loc[rows, "description"], enforce_annual_salary=enforce_annual_salary
+    )
+    for column in salaries.columns:
+        jobs_df[column] = jobs_df[column].astype(salaries[column].dtype)
+        jobs_df.loc[rows, column] = salaries[column]
+    jobs_df["salary_source"] = jobs_df["salary_source"].astype(object)
+    jobs_df.loc[rows, "salary_source"] = np.where(
+        salaries["min_amount"].notna(), SalarySource.DESCRIPTION.value, None
+    )
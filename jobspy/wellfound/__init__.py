@@ -11,7 +11,6 @@ from __future__ import annotations
 
 import json
 import re
-import time
 import random
 import logging
 
@@ -22,7 +21,11 @@ from jobspy.model import (
     ScraperInput,
     Site,
 )
-from jobspy.util import create_session, extract_emails_from_text
+from jobspy.checkpoint import mark_failed
+from jobspy.deadline import deadline_reached
+from jobspy.instrument import set_page
+from jobspy.seen import already_seen
+from jobspy.util import create_session, throttle
 from jobspy.wellfound.constant import headers
 from jobspy.wellfound.util import (
     parse_compensation,
@@ -44,15 +47,26 @@ class Wellfound(Scraper):
         proxies: list[str] | str | None = None,
         ca_cert: str | None = None,
         user_agent: str | None = None,
+        proxy_rotation: str | int = "request",
     ):
         site = Site(Site.WELLFOUND)
-        super().__init__(site, proxies=proxies, ca_cert=ca_cert, user_agent=user_agent)
+        super().__init__(
+            site,
+            proxies=proxies,
+            ca_cert=ca_cert,
+            user_agent=user_agent,
+            proxy_rotation=proxy_rotation,
+        )
         self.session = None
         self.seen_ids: set[str] = set()
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, has_retry=True
+            proxies=self.proxies,
+            ca_cert=self.ca_cert,
+            has_retry=True,
+            rotation=self.proxy_rotation,
+            key=self.site.value,
         )
         h = headers.copy()
         if self.user_agent:
@@ -67,14 +81,20 @@ class Wellfound(Scraper):
         page = 1
         max_pages = 25
 
-        while len(job_list) < results_wanted and page <= max_pages:
+        while (
+            len(job_list) < results_wanted
+            and page <= max_pages
+            and not deadline_reached()
+        ):
             url = self._build_url(role_slug, location_slug, page)
             log.info(f"fetching page {page}: {url}")
+            set_page(page)
 
             try:
                 resp = self.session.get(url)
             except Exception as e:
                 log.error(f"request failed: {e}")
+                mark_failed(str(e))
                 break
 
             if resp.status_code == 404:
@@ -82,6 +102,7 @@ class Wellfound(Scraper):
                 break
             if resp.status_code != 200:
                 log.warning(f"unexpected status {resp.status_code}")
+                mark_failed(f"status code {resp.status_code}")
                 break
 
             jobs_on_page, total_pages = self._parse_page(resp.text, scraper_input)
@@ -90,7 +111,7 @@ class Wellfound(Scraper):
                 break
 
             for job in jobs_on_page:
-                if job.id not in self.seen_ids:
+                if job.id not in self.seen_ids and not already_seen(job.id):
                     self.seen_ids.add(job.id)
                     job_list.append(job)
                     if len(job_list) >= results_wanted:
@@ -101,7 +122,7 @@ class Wellfound(Scraper):
 
             page += 1
             if page <= max_pages and len(job_list) < results_wanted:
-                time.sleep(random.uniform(3, 7))
+                throttle(random.uniform(3, 7))
 
         return JobResponse(jobs=job_list[:results_wanted])
 
@@ -238,7 +259,6 @@ class Wellfound(Scraper):
             job_type=job_type,
             is_remote=is_remote if isinstance(is_remote, bool) else None,
             description=description,
-            emails=extract_emails_from_text(description) if description else None,
             company_logo=company_logo,
             company_url=company_url,
             company_num_employees=str(company_size) if company_size else None,
@@ -0,0 +1,293 @@
+"""
+jobspy.workqueue
+~~~~~~~~~~~~~~~~~~~
+
+This module contains the work queue that spreads searches over worker
+processes on any number of machines. A coordinator splits each search into
+one task per site and enqueues it; workers lease tasks, scrape them with
+scrape_jobs under their process' shared sessions and limits, hand the jobs
+to a sink and acknowledge the task. A task whose scrape raises, times out
+or stops on an error goes back on the queue after a backoff, and a task
+whose worker died is taken over by another one once its lease expires.
+
+SQLiteQueue keeps the queue in one SQLite file, which every worker must be
+able to open. Any object with the same put, lease, ack and fail methods,
+for instance one backed by a Redis server, can be used in its place.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Iterable
+
+from jobspy.concurrency import ContextExecutor
+from jobspy.model import Site
+from jobspy.util import create_logger, map_str_to_site, shared_sessions
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+log = create_logger("WorkQueue")
+
+
+@dataclass
+class Task:
+    """One leased shard: the scrape_jobs arguments of one site of a search"""
+
+    id: int
+    query: dict
+    attempts: int
+
+
+class SQLiteQueue:
+    """A work queue in a SQLite file shared by the coordinator and workers"""
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        max_attempts: int = 3,
+        retry_delay: float = 30,
+    ):
+        self.path = os.fspath(path)
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self._local = threading.local()
+        with self._transaction() as db:
+            db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS tasks (
+                    id INTEGER PRIMARY KEY,
+                    query TEXT NOT NULL,
+                    state TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL,
+                    available_at REAL NOT NULL,
+                    lease_owner TEXT,
+                    lease_until REAL,
+                    error TEXT
+                )
+                """
+            )
+            db.execute(
+                "CREATE INDEX IF NOT EXISTS tasks_state ON tasks (state, available_at)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            self._local.db = db
+        return db
+
+    @contextmanager
+    def _transaction(self):
+        db = self._connection()
+        # takes the write lock up front so two workers can't lease one task
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            yield db
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+
+    def put(self, query: dict) -> int:
+        """Enqueues the scrape_jobs arguments of one task and returns its id"""
+        with self._transaction() as db:
+            cursor = db.execute(
+                "INSERT INTO tasks (query, max_attempts, available_at) VALUES (?, ?, ?)",
+                (json.dumps(query), self.max_attempts, time.time()),
+            )
+            return cursor.lastrowid
+
+    def lease(self, worker: str, seconds: float) -> Task | None:
+        """
+        Takes the oldest available task for seconds, or None when there is
+        none. Tasks whose lease expired are available again.
+        """
+        now = time.time()
+        with self._transaction() as db:
+            db.execute(
+                "UPDATE tasks SET state = 'failed', error = 'lease expired' "
+                "WHERE state = 'leased' AND lease_until <= ? "
+                "AND attempts >= max_attempts",
+                (now,),
+            )
+            row = db.execute(
+                "SELECT id, query, attempts FROM tasks "
+                "WHERE (state = 'pending' AND available_at <= ?) "
+                "OR (state = 'leased' AND lease_until <= ?) "
+                "ORDER BY id LIMIT 1",
+                (now, now),
+            ).fetchone()
+            if row is None:
+                return None
+            task_id, query, attempts = row
+            db.execute(
+                "UPDATE tasks SET state = 'leased', attempts = ?, lease_owner = ?, "
+                "lease_until = ? WHERE id = ?",
+                (attempts + 1, worker, now + seconds, task_id),
+            )
+        return Task(id=task_id, query=json.loads(query), attempts=attempts + 1)
+
+    def ack(self, task: Task, worker: str) -> None:
+        """Marks a task done, unless another worker has taken it over"""
+        with self._transaction() as db:
+            db.execute(
+                "UPDATE tasks SET state = 'done', lease_until = NULL, error = NULL "
+                "WHERE id = ? AND lease_owner = ?",
+                (task.id, worker),
+            )
+
+    def fail(self, task: Task, worker: str, error: str) -> None:
+        """
+        Puts a failed task back on the queue after a backoff doubling with
+        each attempt, or marks it failed after its last attempt
+        """
+        delay = self.retry_delay * 2 ** (task.attempts - 1)
+        with self._transaction() as db:
+            db.execute(
+                "UPDATE tasks SET "
+                "state = CASE WHEN attempts >= max_attempts "
+                "THEN 'failed' ELSE 'pending' END, "
+                "available_at = ?, lease_until = NULL, error = ? "
+                "WHERE id = ? AND lease_owner = ?",
+                (time.time() + delay, error, task.id, worker),
+            )
+
+    def counts(self) -> dict[str, int]:
+        """The number of tasks in each state"""
+        db = self._connection()
+        return dict(db.execute("SELECT state, COUNT(*) FROM tasks GROUP BY state"))
+
+    def unfinished(self) -> int:
+        """The number of tasks still pending or leased"""
+        counts = self.counts()
+        return counts.get("pending", 0) + counts.get("leased", 0)
+
+
+class JsonLinesSink:
+    """Appends the jobs of every finished task to a JSON lines file"""
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+
+    def __call__(self, task: Task, jobs_df: pd.DataFrame) -> None:
+        if jobs_df.empty:
+            return
+        lines = jobs_df.to_json(orient="records", lines=True, date_format="iso")
+        with self._lock, open(self.path, "a", encoding="utf-8") as file:
+            file.write(lines if lines.endswith("\n") else lines + "\n")
+
+
+def enqueue_searches(queue, queries: Iterable[dict], **kwargs) -> list[int]:
+    """
+    Enqueues each search once per site and returns the task ids
+    :param queries: scrape_jobs arguments per search, applied over the
+        arguments shared by all searches in kwargs; searches without
+        site_name are split over every site
+    """
+    task_ids = []
+    for query in queries:
+        query = {**kwargs, **query}
+        site_name = query.pop("site_name", None)
+        if site_name is None:
+            sites = list(Site)
+        elif isinstance(site_name, (str, Site)):
+            sites = [site_name]
+        else:
+            sites = site_name
+        for site in sites:
+            site = map_str_to_site(site) if isinstance(site, str) else site
+            task_ids.append(queue.put({**query, "site_name": site.value}))
+    return task_ids
+
+
+def _work(
+    queue,
+    sink: Callable[[Task, pd.DataFrame], None],
+    worker: str,
+    lease_seconds: float,
+    poll_interval: float,
+    stop_when_empty: bool,
+    stores: dict,
+) -> int:
+    from jobspy import _open_stores, scrape_jobs
+
+    done = 0
+    while True:
+        task = queue.lease(worker, lease_seconds)
+        if task is None:
+            if stop_when_empty and not queue.unfinished():
+                return done
+            time.sleep(poll_interval)
+            continue
+        # ends the scrape before the lease so no other worker takes it over
+        query = {"timeout": lease_seconds * 0.8, **task.query}
+        # tasks naming the same seen_jobs or incremental file share its store
+        query = _open_stores(query, stores)
+        try:
+            jobs_df = scrape_jobs(**query)
+            status = jobs_df.attrs.get("site_status", {}).get(query["site_name"])
+            if status == "timeout":
+                raise TimeoutError(f"{query['site_name']} timed out")
+            # a scraper stopped by a 429 or a failed request kept its
+            # checkpoint, so the retry resumes where it stopped
+            if status == "error":
+                raise RuntimeError(f"{query['site_name']} stopped on an error")
+            sink(task, jobs_df)
+        except Exception as e:
+            log.warning(f"task {task.id} failed on attempt {task.attempts}: {e}")
+            queue.fail(task, worker, repr(e))
+            continue
+        queue.ack(task, worker)
+        done += 1
+
+
+def run_worker(
+    queue,
+    sink: Callable[[Task, pd.DataFrame], None],
+    concurrency: int = 4,
+    lease_seconds: float = 600,
+    poll_interval: float = 5,
+    stop_when_empty: bool = True,
+    worker_id: str | None = None,
+) -> int:
+    """
+    Scrapes tasks from the queue until it is empty, or forever when
+    stop_when_empty is False, and returns the number of tasks done
+    :param sink: called with each finished task and its jobs' DataFrame
+    :param concurrency: tasks scraped at the same time, over shared sessions
+    :param lease_seconds: how long a task is held before another worker may
+        take it over; scrapes without a timeout are given 80% of it
+    """
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    stores = {}
+    with shared_sessions():
+        executor = ContextExecutor(max_workers=concurrency)
+        futures = [
+            executor.submit(
+                _work,
+                queue,
+                sink,
+                f"{worker_id}-{i}",
+                lease_seconds,
+                poll_interval,
+                stop_when_empty,
+                stores,
+            )
+            for i in range(concurrency)
+        ]
+        try:
+            return sum(future.result() for future in futures)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
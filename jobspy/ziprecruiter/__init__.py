@@ -3,20 +3,27 @@ from __future__ import annotations
 import json
 import math
 import re
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future
 from datetime import datetime
 
 from bs4 import BeautifulSoup
+from requests.cookies import RequestsCookieJar
 
 from jobspy.ziprecruiter.constant import headers, get_cookie_data
 from jobspy.util import (
-    extract_emails_from_text,
     create_session,
     markdown_converter,
     remove_attributes,
     create_logger,
+    throttle,
 )
+from jobspy.concurrency import ContextExecutor
+from jobspy.checkpoint import mark_failed
+from jobspy.deadline import deadline_reached
+from jobspy.instrument import set_page
+from jobspy.seen import already_seen
 from jobspy.model import (
     JobPost,
     Compensation,
@@ -32,23 +39,42 @@ from jobspy.ziprecruiter.util import get_job_type_enum, add_params
 
 log = create_logger("ZipRecruiter")
 
+# session cookies from the device event, shared by every scraper in the process
+# that uses the same proxies: {proxies key: (fetched at, cookie jar)}
+_cookie_cache: dict[tuple, tuple[float, object]] = {}
+# one lock per proxies key, so only scrapers waiting on the same cookies queue
+# behind a device event
+_cookie_locks: dict[tuple, threading.Lock] = {}
+_cookie_cache_lock = threading.Lock()
+
 
 class ZipRecruiter(Scraper):
     base_url = "https://www.ziprecruiter.com"
     api_url = "https://api.ziprecruiter.com"
+    cookie_ttl = 30 * 60
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+        proxy_rotation: str | int = "request",
     ):
         """
         Initializes ZipRecruiterScraper with the ZipRecruiter job search url
         """
-        super().__init__(Site.ZIP_RECRUITER, proxies=proxies)
+        super().__init__(
+            Site.ZIP_RECRUITER, proxies=proxies, proxy_rotation=proxy_rotation
+        )
 
         self.scraper_input = None
-        self.session = create_session(proxies=proxies, ca_cert=ca_cert)
+        self.session = create_session(
+            proxies=proxies,
+            ca_cert=ca_cert,
+            rotation=self.proxy_rotation,
+            key=self.site.value,
+        )
         self.session.headers.update(headers)
-        self._get_cookies()
 
         self.delay = 5
         self.jobs_per_page = 20
@@ -63,24 +89,51 @@ class ZipRecruiter(Scraper):
         self.scraper_input = scraper_input
         job_list: list[JobPost] = []
         continue_token = None
+        self._load_cookies()
+        descr_futures: list[tuple[JobPost, Future]] = []
 
         max_pages = math.ceil(scraper_input.results_wanted / self.jobs_per_page)
-        for page in range(1, max_pages + 1):
-            if len(job_list) >= scraper_input.results_wanted:
-                break
-            if page > 1:
-                time.sleep(self.delay)
-            log.info(f"search page: {page} / {max_pages}")
-            jobs_on_page, continue_token = self._find_jobs_in_page(
-                scraper_input, continue_token
-            )
-            if jobs_on_page:
+        # job pages are fetched on one pool for the whole search, so the next
+        # search page is requested while the previous page's details load
+        with ContextExecutor() as executor:
+            for page in range(1, max_pages + 1):
+                if len(job_list) >= scraper_input.results_wanted:
+                    break
+                if page > 1:
+                    throttle(self.delay)
+                if deadline_reached():
+                    break
+                log.info(f"search page: {page} / {max_pages}")
+                set_page(page)
+                jobs_on_page, continue_token = self._find_jobs_in_page(
+                    scraper_input, continue_token
+                )
+                if not jobs_on_page:
+                    break
+                jobs_on_page = [
+                    job_post
+                    for job_post in jobs_on_page
+                    if not already_seen(job_post.id)
+                ][: scraper_input.results_wanted - len(job_list)]
                 job_list.extend(jobs_on_page)
-            else:
-                break
-            if not continue_token:
-                break
-        return JobResponse(jobs=job_list[: scraper_input.results_wanted])
+                if scraper_input.ziprecruiter_fetch_description:
+                    descr_futures += [
+                        (job_post, executor.submit(self._get_descr, job_post.job_url))
+                        for job_post in jobs_on_page
+                    ]
+                if not continue_token:
+                    break
+
+            for job_post, future in descr_futures:
+                try:
+                    description_full, job_url_direct = future.result()
+                except Exception as e:
+                    log.error(f"ZipRecruiter: failed to fetch job page: {str(e)}")
+                    continue
+                if description_full:
+                    job_post.description = description_full
+                job_post.job_url_direct = job_url_direct
+        return JobResponse(jobs=job_list)
 
     def _find_jobs_in_page(
         self, scraper_input: ScraperInput, continue_token: str | None = None
@@ -97,6 +150,10 @@ class ZipRecruiter(Scraper):
             params["continue_from"] = continue_token
         try:
             res = self.session.get(f"{self.api_url}/jobs-app/jobs", params=params)
+            if res.status_code == 401:
+                # cached cookies expired or were revoked, get a fresh session
+                self._load_cookies(refresh=True)
+                res = self.session.get(f"{self.api_url}/jobs-app/jobs", params=params)
             if res.status_code not in range(200, 400):
                 if res.status_code == 429:
                     err = "429 Response - Blocked by ZipRecruiter for too many requests"
@@ -104,21 +161,20 @@ class ZipRecruiter(Scraper):
                     err = f"ZipRecruiter response status code {res.status_code}"
                     err += f" with response: {res.text}"  # ZipRecruiter likely not available in EU
                 log.error(err)
+                mark_failed(err)
                 return jobs_list, ""
         except Exception as e:
             if "Proxy responded with" in str(e):
                 log.error(f"Indeed: Bad proxy")
             else:
                 log.error(f"Indeed: {str(e)}")
+            mark_failed(str(e))
             return jobs_list, ""
 
         res_data = res.json()
         jobs_list = res_data.get("jobs", [])
         next_continue_token = res_data.get("continue", None)
-        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            job_results = [executor.submit(self._process_job, job) for job in jobs_list]
-
-        job_list = list(filter(None, (result.result() for result in job_results)))
+        job_list = list(filter(None, (self._process_job(job) for job in jobs_list)))
         return job_list, next_continue_token
 
     def _process_job(self, job: dict) -> JobPost | None:
@@ -154,7 +210,6 @@ class ZipRecruiter(Scraper):
         comp_min = int(job["compensation_min"]) if "compensation_min" in job else None
         comp_max = int(job["compensation_max"]) if "compensation_max" in job else None
         comp_currency = job.get("compensation_currency")
-        description_full, job_url_direct = self._get_descr(job_url)
 
         return JobPost(
             id=f'zr-{job["listing_key"]}',
@@ -170,9 +225,7 @@ class ZipRecruiter(Scraper):
             ),
             date_posted=date_posted,
             job_url=job_url,
-            description=description_full if description_full else description,
-            emails=extract_emails_from_text(description) if description else None,
-            job_url_direct=job_url_direct,
+            description=description,
             listing_type=listing_type,
         )
 
@@ -211,9 +264,43 @@ class ZipRecruiter(Scraper):
 
         return description_full, job_url_direct
 
-    def _get_cookies(self):
+    def _get_cookies(self) -> RequestsCookieJar:
         """
         Sends a session event to the API with device properties.
+        :return: the cookies the API set in response
         """
         url = f"{self.api_url}/jobs-app/event"
-        self.session.post(url, data=get_cookie_data)
+        response = self.session.post(url, data=get_cookie_data)
+        cookies = RequestsCookieJar()
+        cookies.update(getattr(response, "cookies", None) or {})
+        return cookies
+
+    def _load_cookies(self, refresh: bool = False):
+        """
+        Reuses the session cookies cached for these proxies, only sending the
+        device event when none are cached, they are older than cookie_ttl, or
+        refresh is set because the API rejected them.
+        """
+        if isinstance(self.proxies, list):
+            key = tuple(sorted(self.proxies))
+        else:
+            key = (self.proxies,)
+        with _cookie_cache_lock:
+            cached = _cookie_cache.get(key)
+            lock = _cookie_locks.setdefault(key, threading.Lock())
+        if not refresh and cached and time.time() - cached[0] <= self.cookie_ttl:
+            self.session.cookies.update(cached[1])
+            return
+        with lock:
+            with _cookie_cache_lock:
+                latest = _cookie_cache.get(key)
+            if latest is not cached and latest is not None:
+                # another scraper fetched fresh cookies while this one waited
+                self.session.cookies.update(latest[1])
+                return
+            # the session may be shared with other searches, so its jar is
+            # swapped for the fresh one rather than cleared while in use
+            cookies = self._get_cookies()
+            self.session.cookies = cookies
+            with _cookie_cache_lock:
+                _cookie_cache[key] = (time.time(), cookies.copy())
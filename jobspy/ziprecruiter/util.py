@@ -25,7 +25,5 @@ def add_params(scraper_input) -> dict[str, str | int]:
 
 
 def get_job_type_enum(job_type_str: str) -> list[JobType] | None:
-    for job_type in JobType:
-        if job_type_str in job_type.value:
-            return [job_type]
-    return None
+    job_type = JobType.from_label(job_type_str)
+    return [job_type] if job_type else None
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from unittest import mock
+
+from jobspy import scrape_jobs
+from jobspy.transport import ReplayTransport, use_transport
+
+
+def test_failed_listing_request_reports_an_error(tmp_path):
+    # an empty fixture store raises FixtureNotFound for every request
+    with use_transport(ReplayTransport(tmp_path)), mock.patch("time.sleep"):
+        jobs_df = scrape_jobs(site_name="bayt", search_term="engineer")
+    assert jobs_df.empty
+    assert jobs_df.attrs["site_status"] == {"bayt": "error"}
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import os
+import time
+from unittest import mock
+
+import requests
+
+from jobspy.cache import CacheEntry, HttpCache
+from jobspy.transport import HttpRequest, RecordedResponse
+from jobspy.util import create_session
+
+URL = "https://example.com/jobs"
+
+
+def response(status_code=200, content=b"jobs", headers=None) -> RecordedResponse:
+    return RecordedResponse(
+        status_code=status_code,
+        url=URL,
+        headers=headers or {"ETag": '"v1"'},
+        content=content,
+        encoding="utf-8",
+    )
+
+
+def test_saved_response_is_loaded(tmp_path):
+    cache = HttpCache(tmp_path)
+    request = HttpRequest("GET", URL, params={"page": 2})
+    cache.save(request, response())
+
+    entry = cache.load(request)
+    assert entry.content == b"jobs"
+    assert entry.validators() == {"If-None-Match": '"v1"'}
+    assert cache.load(HttpRequest("GET", URL, params={"page": 3})) is None
+    assert os.listdir(tmp_path) == [f"{request.key()}.json"]
+
+
+def test_only_successful_gets_are_cached(tmp_path):
+    cache = HttpCache(tmp_path)
+    request = HttpRequest("GET", URL)
+    cache.save(request, response(status_code=429))
+    assert cache.load(request) is None
+    assert cache.cacheable(request)
+    assert not cache.cacheable(HttpRequest("POST", URL))
+
+
+def test_entries_past_max_stale_are_dropped(tmp_path):
+    cache = HttpCache(tmp_path, max_stale=60)
+    request = HttpRequest("GET", URL)
+    cache.save(request, response())
+    with mock.patch("time.time", return_value=time.time() + 61):
+        assert cache.load(request) is None
+
+
+def test_revalidated_entry_is_fresh_again(tmp_path):
+    cache = HttpCache(tmp_path)
+    request = HttpRequest("GET", URL)
+    entry = CacheEntry(200, URL, {"etag": '"v1"'}, b"jobs", "utf-8", 0)
+    served = cache.revalidated(request, entry, response(304, b"", {"ETag": '"v2"'}))
+    assert served.text == "jobs"
+    reloaded = cache.load(request)
+    assert reloaded.age < cache.ttl
+    assert reloaded.validators() == {"If-None-Match": '"v2"'}
+
+
+def test_clear_empties_the_cache(tmp_path):
+    cache = HttpCache(tmp_path)
+    request = HttpRequest("GET", URL)
+    cache.save(request, response())
+    cache.clear()
+    assert cache.load(request) is None
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.url = URL
+        self.headers = headers or {}
+        self.content = content
+        self.encoding = "utf-8"
+
+
+def test_session_serves_fresh_entries_and_revalidates_stale_ones(tmp_path):
+    cache = HttpCache(tmp_path, ttl=60)
+    session = create_session(is_tls=False, cache=cache)
+    sent = []
+
+    def fake_request(self, method, url, **kwargs):
+        sent.append(kwargs.get("headers") or {})
+        if len(sent) == 1:
+            return FakeResponse(200, b"jobs", {"ETag": '"v1"'})
+        return FakeResponse(304)
+
+    with mock.patch.object(requests.Session, "request", fake_request):
+        assert session.get(URL).content == b"jobs"
+        assert session.get(URL).content == b"jobs"
+        assert len(sent) == 1
+        with mock.patch("time.time", return_value=time.time() + 61):
+            assert session.get(URL).content == b"jobs"
+    assert sent[1] == {"If-None-Match": '"v1"'}
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import pickle
+
+from jobspy.checkpoint import (
+    CheckpointStore,
+    checkpoint_scope,
+    failure_scope,
+    mark_failed,
+    resume_state,
+    save_state,
+)
+from jobspy.model import JobPost, Location
+
+
+def job(job_id: str) -> JobPost:
+    return JobPost(
+        id=job_id,
+        title="Engineer",
+        company_name="Acme",
+        job_url=f"https://example.com/{job_id}",
+        location=Location(),
+    )
+
+
+def ids(jobs: list[JobPost]) -> list[str]:
+    return [job.id for job in jobs]
+
+
+def test_resumes_from_the_last_page(tmp_path):
+    store = CheckpointStore(tmp_path)
+    checkpoint = store.get("indeed", "search")
+    jobs = []
+    for page in range(1, 4):
+        jobs += [job(f"{page}-a"), job(f"{page}-b")]
+        checkpoint.save({"page": page + 1}, jobs)
+
+    cursor, jobs = store.get("indeed", "search").load()
+    assert cursor == {"page": 4}
+    assert ids(jobs) == ["1-a", "1-b", "2-a", "2-b", "3-a", "3-b"]
+
+
+def test_each_save_writes_only_the_new_jobs(tmp_path):
+    checkpoint = CheckpointStore(tmp_path).get("indeed", "search")
+    jobs = [job("1")]
+    checkpoint.save({"page": 2}, jobs)
+    jobs.append(job("2"))
+    checkpoint.save({"page": 3}, jobs)
+
+    with open(checkpoint.path, "rb") as file:
+        records = [pickle.load(file), pickle.load(file)]
+    assert [ids(record["jobs"]) for record in records] == [["1"], ["2"]]
+
+
+def test_resumed_checkpoint_keeps_appending(tmp_path):
+    store = CheckpointStore(tmp_path)
+    store.get("indeed", "search").save({"page": 2}, [job("1")])
+
+    checkpoint = store.get("indeed", "search")
+    cursor, jobs = checkpoint.load()
+    checkpoint.save({"page": 3}, jobs + [job("2")])
+    assert store.get("indeed", "search").load() == ({"page": 3}, [job("1"), job("2")])
+
+
+def test_stale_checkpoint_is_overwritten_without_a_load(tmp_path):
+    store = CheckpointStore(tmp_path)
+    store.get("indeed", "search").save({"page": 9}, [job("old")])
+    store.get("indeed", "search").save({"page": 2}, [job("new")])
+    assert store.get("indeed", "search").load() == ({"page": 2}, [job("new")])
+
+
+def test_page_cut_short_is_dropped(tmp_path):
+    checkpoint = CheckpointStore(tmp_path).get("indeed", "search")
+    checkpoint.save({"page": 2}, [job("1")])
+    record = pickle.dumps({"cursor": {"page": 3}, "jobs": [job("2")]})
+    with open(checkpoint.path, "ab") as file:
+        file.write(record[: len(record) // 2])
+
+    resumed = CheckpointStore(tmp_path).get("indeed", "search")
+    cursor, jobs = resumed.load()
+    assert (cursor, ids(jobs)) == ({"page": 2}, ["1"])
+    resumed.save({"page": 3}, jobs + [job("2")])
+    assert ids(resumed.load()[1]) == ["1", "2"]
+
+
+def test_clear_removes_the_checkpoint(tmp_path):
+    checkpoint = CheckpointStore(tmp_path).get("indeed", "search")
+    checkpoint.save({"page": 2}, [job("1")])
+    checkpoint.clear()
+    checkpoint.clear()
+    assert checkpoint.load() == (None, [])
+
+
+def test_searches_and_sites_have_their_own_checkpoint(tmp_path):
+    store = CheckpointStore(tmp_path)
+    paths = {
+        store.get("indeed", "a").path,
+        store.get("indeed", "b").path,
+        store.get("linkedin", "a").path,
+    }
+    assert len(paths) == 3
+
+
+def test_state_functions_use_the_scoped_checkpoint(tmp_path):
+    assert resume_state() == (None, [])
+    save_state({"page": 2}, [job("1")])
+
+    checkpoint = CheckpointStore(tmp_path).get("indeed", "search")
+    with checkpoint_scope(checkpoint):
+        save_state({"page": 2}, [job("1")])
+        assert resume_state() == ({"page": 2}, [job("1")])
+
+
+def test_mark_failed_is_collected_by_the_scope():
+    mark_failed("outside any scope")
+    with failure_scope() as errors:
+        assert errors == []
+        mark_failed("429")
+    assert errors == ["429"]
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import json
+from unittest import mock
+
+from jobspy.cli import main, output_format
+from jobspy.model import JobPost, JobResponse, Location
+
+
+class StubScraper:
+    """Returns one job for Indeed and raises for LinkedIn"""
+
+    def __init__(self, **kwargs):
+        pass
+
+    def scrape(self, scraper_input):
+        site = scraper_input.site_type[0].value
+        if site == "linkedin":
+            raise ValueError("unexpected response")
+        return JobResponse(
+            jobs=[
+                JobPost(
+                    id=f"{site}-1",
+                    title="Nurse",
+                    company_name="Acme",
+                    job_url=f"https://example.com/{site}/1",
+                    location=Location(city="Austin"),
+                )
+            ]
+        )
+
+
+def test_failed_site_is_reported_and_the_others_written(tmp_path, capsys):
+    output = tmp_path / "jobs.jsonl"
+    with mock.patch("jobspy.get_scraper_class", lambda site: StubScraper):
+        code = main(
+            ["-s", "indeed", "-s", "linkedin", "-q", "nurse", "-o", str(output)]
+        )
+    assert code == 1
+    rows = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [row["id"] for row in rows] == ["indeed-1"]
+    assert "jobspy: linkedin error" in capsys.readouterr().err
+
+
+def test_output_format_follows_the_extension():
+    assert output_format("jobs.parquet", None) == "parquet"
+    assert output_format("jobs.jsonl", None) == "ndjson"
+    assert output_format("jobs.csv", "ndjson") == "ndjson"
+    assert output_format(None, None) == "ndjson"
@@ -0,0 +1,258 @@
+"""
+Replays the fixture corpus in benchmarks/fixtures through the scrapers and
+checks the parsed JobPosts, so parse regressions show up without network
+access.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from datetime import date, timedelta
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from jobspy.model import JobType, Site
+from jobspy.transport import FixtureStore, ReplayTransport, use_transport
+
+BENCHMARKS = Path(__file__).resolve().parent.parent / "benchmarks"
+
+
+def load_benchmarks():
+    spec = importlib.util.spec_from_file_location(
+        "benchmark_scrapers", BENCHMARKS / "scrapers.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+bench = load_benchmarks()
+
+
+def replay(site: Site):
+    store = FixtureStore(bench.FIXTURES / site.value)
+    assert store.path.is_dir(), f"no fixtures for {site.value}"
+    with use_transport(ReplayTransport(store)), mock.patch("time.sleep"):
+        scraper = bench.SCRAPERS[site]()
+        return scraper.scrape(bench.scraper_input(site, 30)).jobs
+
+
+def test_indeed():
+    jobs = replay(Site.INDEED)
+    assert [job.id for job in jobs] == [
+        "in-a1b2c3d4e5f60001",
+        "in-a1b2c3d4e5f60002",
+        "in-a1b2c3d4e5f60003",
+    ]
+    job = jobs[0]
+    assert job.title == "Software Engineer 1"
+    assert job.company_name == "Acme Robotics"
+    assert job.job_url == "https://www.indeed.com/viewjob?jk=a1b2c3d4e5f60001"
+    assert job.job_url_direct == "https://careers.example.com/jobs/1"
+    assert job.location.city == "San Francisco"
+    assert job.location.state == "CA"
+    assert job.date_posted == date(2026, 10, 1)
+    assert job.job_type == [JobType.FULL_TIME]
+    assert job.compensation.interval.value == "yearly"
+    assert (job.compensation.min_amount, job.compensation.max_amount) == (
+        130000,
+        170000,
+    )
+    assert job.company_industry == "Information Technology"
+    assert job.company_num_employees == "1,001 to 5,000"
+    assert "Build services at Acme Robotics" in job.description
+    assert not job.is_remote
+    assert jobs[2].is_remote
+
+
+def test_ziprecruiter():
+    jobs = replay(Site.ZIP_RECRUITER)
+    assert [job.id for job in jobs] == ["zr-zrkey1", "zr-zrkey2", "zr-zrkey3"]
+    job = jobs[1]
+    assert job.title == "Backend Developer 2"
+    assert job.company_name == "Globex"
+    assert job.location.city == "Oakland"
+    assert job.date_posted == date(2026, 10, 2)
+    assert job.job_type == [JobType.CONTRACT]
+    assert job.compensation.interval.value == "yearly"
+    assert (job.compensation.min_amount, job.compensation.max_amount) == (
+        110000,
+        150000,
+    )
+    # filled in from the job page
+    assert "Full description for listing zrkey2" in job.description
+    assert job.job_url_direct == "https://apply.example.com/zrkey2"
+
+
+def test_linkedin():
+    jobs = replay(Site.LINKEDIN)
+    assert [job.id for job in jobs] == [
+        "li-4000000001",
+        "li-4000000002",
+        "li-4000000003",
+    ]
+    job = jobs[0]
+    assert job.title == "Software Engineer 1"
+    assert job.company_name == "Acme Robotics"
+    assert job.company_url == "https://www.linkedin.com/company/acme"
+    assert job.job_url == "https://www.linkedin.com/jobs/view/4000000001"
+    assert job.location.city == "San Francisco"
+    assert job.location.state == "CA"
+    assert job.date_posted == date(2026, 10, 1)
+    assert (job.compensation.min_amount, job.compensation.max_amount) == (
+        130000,
+        170000,
+    )
+    assert jobs[1].compensation is None
+    # filled in from the job page
+    assert "Design and ship APIs for job 4000000001" in job.description
+    assert job.job_type == [JobType.FULL_TIME]
+    assert job.job_level == "mid-senior level"
+    assert job.job_function == "Engineering"
+    assert job.company_industry == "Software Development"
+    assert job.job_url_direct.startswith("https://careers.example.com/apply/4000000001")
+
+
+def test_glassdoor():
+    # job pages are parsed concurrently, so the order isn't fixed
+    jobs = sorted(replay(Site.GLASSDOOR), key=lambda job: job.id)
+    assert [job.id for job in jobs] == [
+        "gd-1009000001",
+        "gd-1009000002",
+        "gd-1009000003",
+    ]
+    job = jobs[0]
+    assert job.title == "Platform Engineer 1"
+    assert job.company_name == "Acme Robotics"
+    assert job.company_url == "https://www.glassdoor.com/Overview/W-EI_IE4001.htm"
+    assert job.job_url == "https://www.glassdoor.com/job-listing/j?jl=1009000001"
+    assert job.location.city == "San Francisco"
+    assert job.location.state == "CA"
+    assert job.date_posted == date.today() - timedelta(days=1)
+    assert job.compensation.interval.value == "yearly"
+    assert (job.compensation.min_amount, job.compensation.max_amount) == (
+        126000,
+        176000,
+    )
+    assert job.listing_type == "standard"
+    assert jobs[1].listing_type == "sponsored"
+    # fetched from the job detail query
+    assert "Own the platform for listing 1009000001" in job.description
+    assert not job.is_remote
+    assert jobs[2].is_remote
+    assert jobs[2].location is None
+
+
+def test_google():
+    jobs = replay(Site.GOOGLE)
+    # three from the search page, three from the next page callback
+    assert [job.id for job in jobs] == [f"go-gjob{i}" for i in range(1, 7)]
+    job = jobs[0]
+    assert job.title == "Site Reliability Engineer 1"
+    assert job.company_name == "Acme Robotics"
+    assert job.job_url == "https://careers.example.com/sre/1"
+    assert job.location.city == "San Francisco"
+    assert job.location.state == "CA"
+    assert job.location.country == "USA"
+    assert job.date_posted == date.today() - timedelta(days=1)
+    assert job.job_type == [JobType.PART_TIME]
+    assert jobs[2].is_remote
+    assert jobs[3].company_name == "Hooli"
+    assert jobs[3].job_type == [JobType.FULL_TIME]
+
+
+def test_naukri():
+    jobs = replay(Site.NAUKRI)
+    assert [job.id for job in jobs] == ["nk-011026001", "nk-011026002", "nk-011026003"]
+    job = jobs[0]
+    assert job.title == "Python Developer 1"
+    assert job.company_name == "Infosys"
+    assert job.company_url == "https://www.naukri.com/infosys-jobs-careers-1001"
+    assert job.job_url == (
+        "https://www.naukri.com/job-listings-python-developer-infosys-011026001"
+    )
+    assert job.location.city == "Bengaluru"
+    assert job.location.state == "Karnataka"
+    assert job.date_posted == date(2026, 10, 1)
+    assert job.compensation.currency == "INR"
+    assert (job.compensation.min_amount, job.compensation.max_amount) == (
+        1200000,
+        1600000,
+    )
+    assert jobs[1].compensation is None
+    assert job.job_type == [JobType.FULL_TIME]
+    assert job.company_industry == "IT Services & Consulting"
+    assert job.skills == ["Python", "Django", "AWS"]
+    assert job.experience_range == "3-5 Yrs"
+    assert job.company_rating == 3.9
+    assert job.work_from_home_type == "Work from office"
+    assert jobs[1].work_from_home_type == "Hybrid"
+
+
+def test_bdjobs():
+    jobs = replay(Site.BDJOBS)
+    assert [job.id for job in jobs] == ["131000", "132000", "133000"]
+    job = jobs[0]
+    assert job.title == "Software Engineer 1"
+    assert job.company_name == "bKash Limited"
+    assert job.job_url == "https://jobs.bdjobs.com/jobdetail.asp?id=1&jobid=131000&ln=1"
+    assert job.location.city == "Dhaka"
+    assert job.date_posted == date(2026, 11, 1)
+    assert not job.is_remote
+    assert jobs[2].is_remote
+    # filled in from the job page
+    assert "Maintain payment services for job 131000" in job.description
+    assert job.job_type == [JobType.FULL_TIME]
+    assert job.company_industry == "IT Enabled Service"
+
+
+def test_bayt():
+    jobs = replay(Site.BAYT)
+    assert [job.title for job in jobs] == [
+        "Software Engineer 1",
+        "Software Engineer 2",
+        "Software Engineer 3",
+    ]
+    job = jobs[0]
+    assert job.company_name == "Emirates NBD"
+    assert job.job_url == "https://www.bayt.com/en/uae/jobs/software-engineer-4900001/"
+    assert job.location.city == "Dubai"
+    # filled in from the JobPosting data on the job page
+    assert job.description == "Ship mobile features for job 4900001."
+    assert job.date_posted == date(2026, 10, 1)
+    assert job.job_type == [JobType.FULL_TIME]
+    assert jobs[2].job_type == [JobType.CONTRACT, JobType.TEMPORARY]
+
+
+def test_wellfound():
+    jobs = replay(Site.WELLFOUND)
+    assert [job.id for job in jobs] == ["wf-3001", "wf-3002", "wf-3003"]
+    job = jobs[0]
+    assert job.title == "Founding Engineer 1"
+    assert job.company_name == "Acme Robotics"
+    assert job.company_url == "https://acme-robotics.example.com"
+    assert (
+        job.job_url == "https://wellfound.com/jobs/acme-robotics/3001-founding-engineer"
+    )
+    assert job.location.city == "San Francisco"
+    assert job.location.state == "CA"
+    assert job.date_posted == date(2026, 10, 1)
+    assert job.job_type == [JobType.FULL_TIME]
+    assert (job.compensation.min_amount, job.compensation.max_amount) == (
+        110000,
+        160000,
+    )
+    assert job.company_num_employees == "11-50"
+    assert not job.is_remote
+    assert jobs[1].job_type == [JobType.CONTRACT]
+    assert jobs[2].is_remote
+
+
+@pytest.mark.parametrize(
+    "site, jobs", [(site, 6 if site == Site.GOOGLE else 3) for site in bench.SCRAPERS]
+)
+def test_replay_needs_no_network(site, jobs):
+    # ReplayTransport raises for any request without a fixture
+    assert len(replay(site)) == jobs
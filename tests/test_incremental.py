@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import os
+from datetime import date
+
+from jobspy.incremental import (
+    HighWaterMarks,
+    Watermark,
+    is_known,
+    page_is_known,
+    watermark_scope,
+)
+from jobspy.model import JobPost, Location
+
+
+def job(job_id: str, date_posted: date | None = date(2026, 10, 10)) -> JobPost:
+    return JobPost(
+        id=job_id,
+        title="Engineer",
+        company_name="Acme",
+        job_url=f"https://example.com/{job_id}",
+        location=Location(),
+        date_posted=date_posted,
+    )
+
+
+def test_known_by_id_or_posted_before_the_lookback():
+    mark = Watermark(lookback_days=2)
+    mark.add([job("in-1"), job("in-2", date(2026, 10, 12))])
+    assert mark.newest == date(2026, 10, 12)
+    assert mark.is_known("in-2")
+    assert mark.is_known("in-9", date(2026, 10, 9))
+    assert not mark.is_known("in-9", date(2026, 10, 10))
+    assert not mark.is_known("in-9")
+
+
+def test_ids_older_than_the_lookback_are_pruned():
+    mark = Watermark(lookback_days=2)
+    mark.add([job("in-1", date(2026, 10, 1)), job("in-2", date(2026, 10, 12))])
+    assert set(mark.ids) == {"in-2"}
+    # still known, by its date
+    assert mark.is_known("in-1", date(2026, 10, 1))
+
+
+def test_ids_are_capped_at_max_ids():
+    mark = Watermark(max_ids=3)
+    mark.add([job(f"in-{i}", None) for i in range(5)])
+    assert list(mark.ids) == ["in-2", "in-3", "in-4"]
+
+
+def test_marks_are_saved_and_reloaded(tmp_path):
+    path = tmp_path / "marks.json"
+    marks = HighWaterMarks(path)
+    marks.get("indeed", "Nurse ", "Austin").add([job("in-1")])
+    marks.save()
+
+    reloaded = HighWaterMarks(path).get("indeed", "nurse", "austin")
+    assert reloaded.newest == date(2026, 10, 10)
+    assert reloaded.is_known("in-1")
+    assert os.listdir(tmp_path) == ["marks.json"]
+
+
+def test_save_keeps_the_marks_of_other_writers(tmp_path):
+    path = tmp_path / "marks.json"
+    first = HighWaterMarks(path)
+    second = HighWaterMarks(path)
+    first.get("indeed", "nurse", None).add([job("in-1")])
+    first.get("linkedin", "nurse", None).add([job("li-1")])
+    first.save()
+    second.get("indeed", "nurse", None).add([job("in-2", date(2026, 10, 11))])
+    second.save()
+
+    reloaded = HighWaterMarks(path)
+    indeed = reloaded.get("indeed", "nurse", None)
+    assert indeed.is_known("in-1") and indeed.is_known("in-2")
+    assert indeed.newest == date(2026, 10, 11)
+    assert reloaded.get("linkedin", "nurse", None).is_known("li-1")
+
+
+def test_page_is_known_only_inside_a_scope():
+    mark = Watermark()
+    mark.add([job("in-1"), job("in-2")])
+    assert not page_is_known([job("in-1")])
+    with watermark_scope(mark):
+        assert is_known("in-1")
+        assert page_is_known([job("in-1"), job("in-2")])
+        assert not page_is_known([job("in-1"), job("in-3")])
+        assert not page_is_known([])
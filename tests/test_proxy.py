@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+import requests
+
+from jobspy.proxy import ProxyHealth, RotationPolicy
+from jobspy.util import create_session
+
+PROXIES = ["10.0.0.1:8080", "10.0.0.2:8080", "10.0.0.3:8080", "10.0.0.4:8080"]
+
+
+class FakeResponse:
+    status_code = 200
+    ok = True
+
+
+@pytest.fixture
+def health():
+    health = ProxyHealth()
+    with mock.patch("jobspy.util.proxy_health", health):
+        yield health
+
+
+@pytest.mark.parametrize("rotation", ["request", 3, "session"])
+def test_threads_send_through_the_proxy_they_chose(health, rotation):
+    session = create_session(proxies=PROXIES, is_tls=False, rotation=rotation)
+    sent = threading.local()
+    mismatches = []
+
+    def fake_request(self, method, url, **kwargs):
+        sent.proxy = kwargs["proxies"]["http"]
+        time.sleep(random.uniform(0, 0.002))
+        return FakeResponse()
+
+    def record(proxy, seconds, status):
+        if proxy != sent.proxy:
+            mismatches.append((proxy, sent.proxy))
+        return True
+
+    with (
+        mock.patch.object(requests.Session, "request", fake_request),
+        mock.patch.object(health, "record", side_effect=record),
+    ):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: session.get("https://example.com"), range(200)))
+
+    assert not mismatches
+
+
+def test_session_state_is_not_mutated(health):
+    session = create_session(proxies=PROXIES, is_tls=False)
+    with mock.patch.object(
+        requests.Session, "request", lambda *args, **kwargs: FakeResponse()
+    ):
+        session.get("https://example.com")
+    assert session.proxies == {}
+
+
+def test_sticky_policy_keeps_a_proxy_for_its_budget(health):
+    session = create_session(proxies=PROXIES, is_tls=False, rotation=3)
+    chosen = [session.next_proxy() for _ in range(6)]
+    assert chosen[0][0] == chosen[1][0] == chosen[2][0]
+    assert [changed for _, changed in chosen[:3]] == [True, False, False]
+    assert chosen[3][0] == chosen[4][0] == chosen[5][0]
+
+
+def test_failed_sticky_proxy_is_replaced(health):
+    session = create_session(proxies=PROXIES, is_tls=False, rotation="session")
+    first, _ = session.next_proxy()
+    with mock.patch.object(
+        requests.Session,
+        "request",
+        lambda *args, **kwargs: type("Blocked", (), {"status_code": 403})(),
+    ):
+        session.get("https://example.com")
+    assert session.next_proxy()[0] != first
+
+
+def test_direct_connection_without_proxies():
+    session = create_session(is_tls=False)
+    assert session.next_proxy() == (None, True)
+    assert session.proxy_settings(None) == {}
+
+
+def test_rotation_policy_parse():
+    assert RotationPolicy.parse("request") == RotationPolicy(1)
+    assert RotationPolicy.parse("session") == RotationPolicy(None)
+    assert RotationPolicy.parse(5).every == 5
+    with pytest.raises(ValueError):
+        RotationPolicy.parse(0)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+
+from jobspy import scrape_jobs_many
+from jobspy.model import JobPost, JobResponse, Location
+
+
+class StubScraper:
+    """Returns one job per site, and raises for the sites in failing"""
+
+    failing = {"linkedin"}
+
+    def __init__(self, **kwargs):
+        pass
+
+    def scrape(self, scraper_input):
+        site = scraper_input.site_type[0].value
+        if site in self.failing:
+            raise ValueError(f"unexpected response from {site}")
+        return JobResponse(
+            jobs=[
+                JobPost(
+                    id=f"{site}-1",
+                    title="Engineer",
+                    company_name="Acme",
+                    job_url=f"https://example.com/{site}/1",
+                    location=Location(city="Austin"),
+                )
+            ]
+        )
+
+
+@pytest.fixture(autouse=True)
+def stub_scrapers():
+    with mock.patch("jobspy.get_scraper_class", lambda site: StubScraper):
+        yield
+
+
+QUERIES = [{"site_name": site} for site in ("indeed", "linkedin", "glassdoor")]
+
+
+def test_failed_query_keeps_the_other_results():
+    jobs_df = scrape_jobs_many(QUERIES)
+    assert sorted(jobs_df["id"]) == ["glassdoor-1", "indeed-1"]
+    queries = {entry["query"]["site_name"]: entry for entry in jobs_df.attrs["queries"]}
+    assert queries["indeed"]["site_status"] == {"indeed": "complete"}
+    assert queries["indeed"]["error"] is None
+    assert queries["linkedin"]["jobs"] == 0
+    assert queries["linkedin"]["site_status"] == {"linkedin": "error"}
+    assert "unexpected response from linkedin" in queries["linkedin"]["error"]
+
+
+def test_failed_query_is_streamed_with_its_status():
+    results = {
+        query["site_name"]: jobs_df
+        for query, jobs_df in scrape_jobs_many(QUERIES, stream=True)
+    }
+    assert len(results["indeed"]) == 1
+    assert results["linkedin"].empty
+    assert results["linkedin"].attrs["site_status"] == {"linkedin": "error"}
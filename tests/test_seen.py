@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from jobspy.seen import SeenFilter, already_seen, seen_scope
+
+
+def test_added_ids_are_seen():
+    seen = SeenFilter(capacity=1_000)
+    seen.update(["in-1", "li-2"])
+    assert "in-1" in seen
+    assert "li-2" in seen
+    assert "in-3" not in seen
+    assert seen.count == 2
+
+
+def test_false_positive_rate_is_near_error_rate():
+    seen = SeenFilter(capacity=10_000, error_rate=0.01)
+    seen.update(f"in-{i}" for i in range(10_000))
+    false_positives = sum(f"li-{i}" in seen for i in range(10_000))
+    assert false_positives < 200
+
+
+def test_saved_filter_is_reopened(tmp_path):
+    path = tmp_path / "seen.bin"
+    seen = SeenFilter.open(path, capacity=1_000)
+    seen.add("in-1")
+    seen.save()
+
+    reopened = SeenFilter.open(path)
+    assert "in-1" in reopened
+    assert (reopened.bit_count, reopened.hash_count, reopened.count) == (
+        seen.bit_count,
+        seen.hash_count,
+        1,
+    )
+    assert os.listdir(tmp_path) == ["seen.bin"]
+
+
+def test_save_keeps_the_ids_of_other_writers(tmp_path):
+    path = tmp_path / "seen.bin"
+    first = SeenFilter.open(path, capacity=1_000)
+    second = SeenFilter.open(path, capacity=1_000)
+    first.add("in-1")
+    first.save()
+    second.add("in-2")
+    second.save()
+
+    reopened = SeenFilter.open(path)
+    assert "in-1" in reopened
+    assert "in-2" in reopened
+
+
+def test_save_replaces_a_filter_of_another_size(tmp_path):
+    path = tmp_path / "seen.bin"
+    SeenFilter(capacity=1_000, path=path).save()
+    seen = SeenFilter(capacity=5_000, path=path)
+    seen.add("in-1")
+    seen.save()
+    assert SeenFilter.open(path).bit_count == seen.bit_count
+
+
+def test_open_rejects_other_files(tmp_path):
+    path = tmp_path / "seen.bin"
+    path.write_bytes(b"not a filter" * 4)
+    with pytest.raises(ValueError):
+        SeenFilter.open(path)
+
+
+def test_already_seen_uses_the_scoped_filter():
+    seen = SeenFilter(capacity=1_000)
+    seen.add("in-1")
+    assert not already_seen("in-1")
+    with seen_scope(seen):
+        assert already_seen("in-1")
+        assert not already_seen("in-2")
+        assert not already_seen(None)
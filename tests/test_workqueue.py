@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from jobspy.workqueue import SQLiteQueue, run_worker
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return SQLiteQueue(tmp_path / "queue.db", max_attempts=2, retry_delay=0)
+
+
+def test_a_leased_task_is_not_leased_twice(queue):
+    task_id = queue.put({"site_name": "indeed"})
+    task = queue.lease("worker-1", 60)
+    assert task.id == task_id
+    assert task.query == {"site_name": "indeed"}
+    assert task.attempts == 1
+    assert queue.lease("worker-2", 60) is None
+
+
+def test_expired_lease_is_taken_over(queue):
+    queue.put({"site_name": "indeed"})
+    first = queue.lease("worker-1", 0)
+    second = queue.lease("worker-2", 60)
+    assert second.id == first.id
+    assert second.attempts == 2
+
+
+def test_ack_by_a_worker_that_lost_the_lease_is_ignored(queue):
+    queue.put({"site_name": "indeed"})
+    first = queue.lease("worker-1", 0)
+    second = queue.lease("worker-2", 60)
+    queue.ack(first, "worker-1")
+    assert queue.counts() == {"leased": 1}
+    queue.ack(second, "worker-2")
+    assert queue.counts() == {"done": 1}
+    assert queue.unfinished() == 0
+
+
+def test_fail_by_a_worker_that_lost_the_lease_is_ignored(queue):
+    queue.put({"site_name": "indeed"})
+    first = queue.lease("worker-1", 0)
+    queue.lease("worker-2", 60)
+    queue.fail(first, "worker-1", "boom")
+    assert queue.counts() == {"leased": 1}
+
+
+def test_failed_task_is_retried_until_max_attempts(queue):
+    queue.put({"site_name": "indeed"})
+    task = queue.lease("worker-1", 60)
+    queue.fail(task, "worker-1", "first")
+    assert queue.counts() == {"pending": 1}
+    task = queue.lease("worker-1", 60)
+    assert task.attempts == 2
+    queue.fail(task, "worker-1", "second")
+    assert queue.counts() == {"failed": 1}
+    assert queue.lease("worker-1", 60) is None
+    assert queue.unfinished() == 0
+
+
+def test_expired_lease_on_the_last_attempt_fails_the_task(queue):
+    queue.put({"site_name": "indeed"})
+    queue.lease("worker-1", 0)
+    queue.lease("worker-2", 0)
+    assert queue.lease("worker-3", 60) is None
+    assert queue.counts() == {"failed": 1}
+
+
+def test_failed_task_waits_for_its_backoff(tmp_path):
+    queue = SQLiteQueue(tmp_path / "queue.db", retry_delay=60)
+    queue.put({"site_name": "indeed"})
+    task = queue.lease("worker-1", 60)
+    queue.fail(task, "worker-1", "boom")
+    assert queue.lease("worker-1", 60) is None
+    assert queue.unfinished() == 1
+
+
+def test_tasks_are_leased_in_order(queue):
+    first = queue.put({"site_name": "indeed"})
+    second = queue.put({"site_name": "linkedin"})
+    assert queue.lease("worker-1", 60).id == first
+    assert queue.lease("worker-2", 60).id == second
+
+
+def scrape_results(*statuses):
+    """A stub scrape_jobs returning one job per call with the statuses given"""
+    statuses = list(statuses)
+
+    def scrape_jobs(**query):
+        status = statuses.pop(0)
+        if isinstance(status, Exception):
+            raise status
+        jobs_df = pd.DataFrame({"site": [query["site_name"]], "id": ["in-1"]})
+        jobs_df.attrs["site_status"] = {query["site_name"]: status}
+        return jobs_df
+
+    return scrape_jobs
+
+
+@pytest.mark.parametrize("failure", ["error", "timeout", ValueError("boom")])
+def test_failed_scrape_is_requeued_not_acked(queue, failure):
+    queue.put({"site_name": "indeed"})
+    sunk = []
+    with mock.patch("jobspy.scrape_jobs", scrape_results(failure, "complete")):
+        done = run_worker(
+            queue,
+            lambda task, jobs_df: sunk.append(task.attempts),
+            concurrency=1,
+            poll_interval=0,
+        )
+    # the first attempt went back on the queue, the retry was acked
+    assert done == 1
+    assert sunk == [2]
+    assert queue.counts() == {"done": 1}
+
+
+def test_shard_failing_every_attempt_is_marked_failed(queue):
+    queue.put({"site_name": "indeed"})
+    sunk = []
+    with mock.patch("jobspy.scrape_jobs", scrape_results("error", "error")):
+        done = run_worker(
+            queue, lambda task, jobs_df: sunk.append(task), poll_interval=0
+        )
+    assert done == 0
+    assert not sunk
+    assert queue.counts() == {"failed": 1}
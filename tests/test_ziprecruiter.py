@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+from requests.cookies import RequestsCookieJar
+
+from jobspy import ziprecruiter
+from jobspy.ziprecruiter import ZipRecruiter
+
+
+@pytest.fixture(autouse=True)
+def empty_cookie_cache():
+    with mock.patch.object(ziprecruiter, "_cookie_cache", {}):
+        yield
+
+
+class EventResponse:
+    def __init__(self, **cookies):
+        self.cookies = RequestsCookieJar()
+        self.cookies.update(cookies)
+
+
+def test_refresh_swaps_the_jar_instead_of_clearing_it():
+    scraper = ZipRecruiter()
+    in_use = scraper.session.cookies
+    in_use.set("stale", "1")
+    with mock.patch.object(
+        scraper.session, "post", return_value=EventResponse(session="fresh")
+    ):
+        scraper._load_cookies(refresh=True)
+    # a request already holding the old jar still sees its cookies
+    assert in_use.get("stale") == "1"
+    assert scraper.session.cookies is not in_use
+    assert dict(scraper.session.cookies) == {"session": "fresh"}
+
+
+def test_cached_cookies_are_reused():
+    first, second = ZipRecruiter(), ZipRecruiter()
+    with mock.patch.object(
+        first.session, "post", return_value=EventResponse(session="fresh")
+    ) as post:
+        first._load_cookies()
+    with mock.patch.object(second.session, "post") as second_post:
+        second._load_cookies()
+    assert post.call_count == 1
+    second_post.assert_not_called()
+    assert second.session.cookies.get("session") == "fresh"